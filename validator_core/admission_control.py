@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from datetime import datetime
+from .error_codes import AlertLevel, ErrorCode
+from .validator import ValidationResult
+
+# Validator section whose rule alert levels set a step's priority when not configured explicitly
+_STEP_SECTIONS = {
+    "prime_sequence": "prime_sequence_validator",
+    "field_address": "field_address_validator",
+    "gate_transition": "gate_validator",
+}
+
+_PRIORITIES = sorted(AlertLevel, reverse=True)
+
+_WAITING, _GRANTED, _SHED = 0, 1, 2
+
+class _Ticket:
+    __slots__ = ('deadline', 'seq', 'event', 'state')
+
+    def __init__(self, deadline: float, seq: int):
+        self.deadline = deadline
+        self.seq = seq
+        self.event = threading.Event()
+        self.state = _WAITING
+
+    def __lt__(self, other: "_Ticket") -> bool:
+        return (self.deadline, self.seq) < (other.deadline, other.seq)
+
+class AdmissionController:
+    """Bounds concurrent validation work and sheds excess load explicitly.
+
+    Up to `max_concurrent` steps run at once. Further callers wait in a
+    bounded queue per priority; a freed slot goes to the highest priority,
+    earliest deadline waiter. Callers whose queue is full or whose deadline
+    passes while waiting are shed instead of piling up.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        queue_limits: Optional[Dict[AlertLevel, int]] = None,
+        max_wait: Optional[Dict[AlertLevel, float]] = None,
+        step_priorities: Optional[Dict[str, AlertLevel]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_concurrent = max_concurrent
+        self.queue_limits = {level: 64 for level in AlertLevel}
+        self.queue_limits.update(queue_limits or {})
+        self.max_wait = {AlertLevel.NORMAL: 0.05, AlertLevel.HIGH: 0.25, AlertLevel.CRITICAL: 1.0}
+        self.max_wait.update(max_wait or {})
+        self.step_priorities = dict(step_priorities or {})
+        self.clock = clock
+        self.in_flight = 0
+        self.stats = {'admitted': 0, 'queued': 0, 'shed_queue_full': 0, 'shed_deadline': 0}
+        self.shed_counts = {level: 0 for level in AlertLevel}
+
+        self._queues: Dict[AlertLevel, List[_Ticket]] = {level: [] for level in AlertLevel}
+        self._depths = {level: 0 for level in AlertLevel}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger("AdmissionController")
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["AdmissionController"]:
+        """Builds a controller from the admission_control section; None if disabled there."""
+        config = config or {}
+        settings = config.get('admission_control') or {}
+        if not settings.get('enabled', True):
+            return None
+
+        step_priorities = {}
+        for step_type, section in _STEP_SECTIONS.items():
+            configured = (settings.get('step_priorities') or {}).get(step_type)
+            if configured is None:
+                rules = ((config.get(section) or {}).get('validation_rules') or {}).values()
+                configured = max(
+                    (AlertLevel(rule['alert_level']) for rule in rules if isinstance(rule, dict) and 'alert_level' in rule),
+                    default=AlertLevel.NORMAL
+                )
+            step_priorities[step_type] = AlertLevel(configured)
+
+        return cls(
+            max_concurrent=settings.get('max_concurrent', 8),
+            queue_limits={AlertLevel(k): v for k, v in (settings.get('queue_limits') or {}).items()},
+            max_wait={AlertLevel(k): v for k, v in (settings.get('max_wait') or {}).items()},
+            step_priorities=step_priorities
+        )
+
+    def priority_for(self, step_type: str) -> AlertLevel:
+        """Scheduling priority of a step type."""
+        return self.step_priorities.get(step_type, AlertLevel.NORMAL)
+
+    def acquire(self, priority: AlertLevel, deadline: Optional[float] = None) -> bool:
+        """Waits for a slot until `deadline` (monotonic seconds). False means the caller was shed."""
+        now = self.clock()
+        if deadline is None:
+            deadline = now + self.max_wait[priority]
+        with self._lock:
+            if self.in_flight < self.max_concurrent:
+                self.in_flight += 1
+                self.stats['admitted'] += 1
+                return True
+            if self._depths[priority] >= self.queue_limits[priority]:
+                self._shed(priority, 'shed_queue_full')
+                return False
+            if deadline <= now:
+                self._shed(priority, 'shed_deadline')
+                return False
+            ticket = _Ticket(deadline, next(self._seq))
+            heapq.heappush(self._queues[priority], ticket)
+            self._depths[priority] += 1
+            self.stats['queued'] += 1
+
+        ticket.event.wait(max(deadline - now, 0.0))
+        with self._lock:
+            if ticket.state == _GRANTED:
+                return True
+            if ticket.state == _WAITING:
+                # Timed out; the stale heap entry is discarded on the next grant
+                ticket.state = _SHED
+                self._depths[priority] -= 1
+                self._shed(priority, 'shed_deadline')
+            return False
+
+    def release(self) -> None:
+        """Returns a slot and hands it to the best live waiter."""
+        with self._lock:
+            self.in_flight -= 1
+            now = self.clock()
+            while self.in_flight < self.max_concurrent:
+                ticket = self._next_ticket(now)
+                if ticket is None:
+                    return
+                ticket.state = _GRANTED
+                self.in_flight += 1
+                self.stats['admitted'] += 1
+                ticket.event.set()
+
+    def queue_depths(self) -> Dict[str, int]:
+        """Callers currently waiting, per priority."""
+        return {level.label: depth for level, depth in self._depths.items()}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Queue depths, in-flight count and shed counters for Observer monitoring."""
+        return {
+            'in_flight': self.in_flight,
+            'queue_depths': self.queue_depths(),
+            'shed': {level.label: count for level, count in self.shed_counts.items()},
+            **self.stats
+        }
+
+    def shed_result(self, step_type: str) -> ValidationResult:
+        """The result returned in place of a step that was shed."""
+        priority = self.priority_for(step_type)
+        return ValidationResult(
+            is_valid=False,
+            error_code=ErrorCode.SHED,
+            error_message=f"{step_type} shed under load ({priority.label} priority)",
+            alert_level=AlertLevel.NORMAL,
+            timestamp=datetime.utcnow().isoformat() + 'Z',
+            details={'priority': priority.label, 'queue_depths': self.queue_depths()}
+        )
+
+    def _next_ticket(self, now: float) -> Optional[_Ticket]:
+        # Called with the lock held
+        for priority in _PRIORITIES:
+            queue = self._queues[priority]
+            while queue:
+                ticket = heapq.heappop(queue)
+                if ticket.state != _WAITING:
+                    continue
+                self._depths[priority] -= 1
+                if ticket.deadline <= now:
+                    ticket.state = _SHED
+                    self._shed(priority, 'shed_deadline')
+                    ticket.event.set()
+                    continue
+                return ticket
+        return None
+
+    def _shed(self, priority: AlertLevel, reason: str) -> None:
+        self.stats[reason] += 1
+        self.shed_counts[priority] += 1
+
+_shared_controllers: Dict[str, Optional[AdmissionController]] = {}
+_shared_lock = threading.Lock()
+
+def get_admission_controller(config: Dict[str, Any]) -> Optional[AdmissionController]:
+    """Returns the process-wide admission controller for the configured limits (None if disabled)."""
+    key = repr(((config or {}).get('admission_control'), [
+        ((config or {}).get(section) or {}).get('validation_rules') for section in _STEP_SECTIONS.values()
+    ]))
+    with _shared_lock:
+        if key not in _shared_controllers:
+            _shared_controllers[key] = AdmissionController.from_config(config)
+        return _shared_controllers[key]
+
+if __name__ == "__main__":
+    # Synthetic overload: 48 threads of routine steps plus a stream of critical
+    # gate transitions against 4 slots of 2ms work, FIFO semaphore vs admission.
+    def run(acquire: Callable[[str], bool], release: Callable[[], None]) -> Dict[str, List[float]]:
+        latencies: Dict[str, List[float]] = {"field_address": [], "gate_transition": []}
+        shed = {"field_address": 0, "gate_transition": 0}
+        stop = time.monotonic() + 2.0
+
+        def caller(step_type: str, pause: float) -> None:
+            while time.monotonic() < stop:
+                started = time.perf_counter()
+                if acquire(step_type):
+                    try:
+                        time.sleep(0.002)
+                    finally:
+                        release()
+                    latencies[step_type].append(time.perf_counter() - started)
+                else:
+                    shed[step_type] += 1
+                time.sleep(pause)
+
+        threads = [threading.Thread(target=caller, args=("field_address", 0.0)) for _ in range(48)]
+        threads += [threading.Thread(target=caller, args=("gate_transition", 0.01)) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return latencies, shed
+
+    def p99(samples: List[float]) -> float:
+        samples = sorted(samples)
+        return samples[int(len(samples) * 0.99)] * 1000 if samples else float('nan')
+
+    fifo = threading.Semaphore(4)
+    controller = AdmissionController(
+        max_concurrent=4,
+        step_priorities={"gate_transition": AlertLevel.CRITICAL, "field_address": AlertLevel.NORMAL},
+        max_wait={AlertLevel.NORMAL: 0.02}
+    )
+    for label, acquire, release in (
+        ("FIFO semaphore", lambda step: fifo.acquire(), fifo.release),
+        ("admission control", lambda step: controller.acquire(controller.priority_for(step)), controller.release),
+    ):
+        latencies, shed = run(acquire, release)
+        print(
+            f"{label:>17}: critical p99 {p99(latencies['gate_transition']):6.1f}ms "
+            f"({len(latencies['gate_transition'])} done), routine p99 {p99(latencies['field_address']):6.1f}ms "
+            f"({len(latencies['field_address'])} done, {shed['field_address']} shed)"
+        )
+    print(f"Admission snapshot: {controller.snapshot()}")
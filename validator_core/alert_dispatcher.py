@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from .concurrency import TokenBucket
+from .error_codes import AlertLevel, ErrorCode
+
+DEFAULT_CHANNELS = ["observer_log"]
+# Lowest alert level each channel delivers; unlisted channels take every level
+CHANNEL_MIN_LEVELS = {"admin_notification": AlertLevel.CRITICAL}
+
+@dataclass
+class AlertAggregate:
+    error_code: ErrorCode
+    alert_level: AlertLevel
+    count: int
+    first_seen: float
+    last_seen: float
+    last_message: str
+    sources: List[str] = field(default_factory=list)
+
+    def summary(self, window: float) -> str:
+        """Human readable form, e.g. "3× INVALID_GATE_SEQUENCE in 1s"."""
+        if self.count == 1:
+            return f"{self.error_code} - {self.last_message}"
+        return f"{self.count}× {self.error_code} in {window:g}s (last: {self.last_message})"
+
+class AlertDispatcher:
+    """Asynchronous alert fan-out with deduplication, aggregation and rate limits.
+
+    Validation threads only ever call submit(), which never blocks: alerts
+    that do not fit in the bounded queue are counted and dropped.
+    """
+
+    def __init__(
+        self,
+        channels: Optional[List[str]] = None,
+        queue_size: int = 1024,
+        aggregation_window: float = 1.0,
+        rate_limits: Optional[Dict[str, float]] = None
+    ):
+        self.channels = list(channels or DEFAULT_CHANNELS)
+        self.aggregation_window = aggregation_window
+        self.queue: "queue.Queue[Tuple[float, ErrorCode, AlertLevel, str, str]]" = queue.Queue(maxsize=queue_size)
+        self.rate_limiters = {
+            channel: TokenBucket(rate, rate)
+            for channel, rate in (rate_limits or {}).items()
+        }
+        self.handlers: Dict[str, List[Callable[[AlertAggregate], None]]] = {c: [] for c in self.channels}
+        self.system_state: Dict[str, Dict[str, Any]] = {}
+        self.stats = {
+            'submitted': 0,
+            'dropped': 0,
+            'aggregated': 0,
+            'delivered': 0,
+            'rate_limited': 0
+        }
+
+        self._pending: Dict[ErrorCode, AlertAggregate] = {}
+        self._window_start = time.monotonic()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._idle = threading.Condition()
+        self.logger = logging.getLogger("AlertDispatcher")
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "AlertDispatcher":
+        """Builds a dispatcher from an observer_interface config section."""
+        observer_config = (config or {}).get('observer_interface', {}) or {}
+        dispatch_config = observer_config.get('alert_dispatch', {}) or {}
+        return cls(
+            channels=observer_config.get('alert_channels') or DEFAULT_CHANNELS,
+            queue_size=dispatch_config.get('queue_size', 1024),
+            aggregation_window=dispatch_config.get('aggregation_window', 1.0),
+            rate_limits=dispatch_config.get('rate_limits')
+        )
+
+    def register_handler(self, channel: str, handler: Callable[[AlertAggregate], None]) -> None:
+        """Registers an extra delivery callback for a channel."""
+        self.handlers.setdefault(channel, []).append(handler)
+
+    def submit(self, error_code: ErrorCode, alert_level: AlertLevel, message: str, source: str = "") -> bool:
+        """Enqueues an alert without blocking. Returns False if it was dropped."""
+        if self._thread is None:
+            self._start()
+        try:
+            self.queue.put_nowait((time.monotonic(), ErrorCode(error_code), AlertLevel(alert_level), message, source))
+            self._count('submitted')
+            return True
+        except queue.Full:
+            self._count('dropped')
+            return False
+
+    def submit_result(self, result: Any, source: str = "") -> bool:
+        """Enqueues a ValidationResult or CoherenceResult."""
+        return self.submit(result.error_code, result.alert_level, result.error_message, source)
+
+    def flush(self, timeout: float = 1.0) -> None:
+        """Waits until queued alerts are delivered (for shutdown and tooling)."""
+        if self._thread is None:
+            return
+        deadline = time.monotonic() + timeout
+        with self._idle:
+            while self.queue.unfinished_tasks or self._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._window_start = 0.0
+                self._idle.wait(min(remaining, 0.05))
+
+    def close(self) -> None:
+        """Delivers outstanding alerts and stops the dispatcher thread."""
+        self.flush()
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _count(self, name: str) -> None:
+        # submit() runs on any validation thread, delivery on the dispatcher thread
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._stopping.clear()
+                self._thread = threading.Thread(target=self._run, name="AlertDispatcher", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            timeout = max(0.0, self._window_start + self.aggregation_window - time.monotonic())
+            try:
+                item = self.queue.get(timeout=timeout if self._pending else 0.1)
+                self._aggregate(*item)
+                self.queue.task_done()
+            except queue.Empty:
+                pass
+            if time.monotonic() - self._window_start >= self.aggregation_window:
+                self._flush_window()
+
+    def _aggregate(self, ts: float, code: ErrorCode, level: AlertLevel, message: str, source: str) -> None:
+        if not self._pending:
+            self._window_start = ts
+        aggregate = self._pending.get(code)
+        if aggregate is None:
+            self._pending[code] = AlertAggregate(code, level, 1, ts, ts, message, [source] if source else [])
+            return
+        aggregate.count += 1
+        aggregate.last_seen = ts
+        aggregate.last_message = message
+        aggregate.alert_level = max(aggregate.alert_level, level)
+        if source and source not in aggregate.sources:
+            aggregate.sources.append(source)
+        self._count('aggregated')
+
+    def _flush_window(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._window_start = time.monotonic()
+        now = self._window_start
+        # Most severe first, so lower levels cannot spend a channel's rate budget ahead of them
+        for aggregate in sorted(pending.values(), key=lambda a: a.alert_level, reverse=True):
+            for channel in self.channels:
+                if aggregate.alert_level < CHANNEL_MIN_LEVELS.get(channel, AlertLevel.NORMAL):
+                    continue
+                limiter = self.rate_limiters.get(channel)
+                if limiter is not None and not limiter.allow(now):
+                    self._count('rate_limited')
+                    continue
+                self._deliver(channel, aggregate)
+        with self._idle:
+            self._idle.notify_all()
+
+    def _deliver(self, channel: str, aggregate: AlertAggregate) -> None:
+        try:
+            if channel == "observer_log":
+                self.logger.warning(f"Observer Alert: {aggregate.summary(self.aggregation_window)}")
+            elif channel == "system_state":
+                self.system_state[aggregate.error_code.name] = {
+                    'alert_level': aggregate.alert_level.label,
+                    'count': aggregate.count,
+                    'last_message': aggregate.last_message,
+                    'sources': list(aggregate.sources)
+                }
+            for handler in self.handlers.get(channel, []):
+                handler(aggregate)
+            self._count('delivered')
+        except Exception as e:
+            self.logger.error(f"Alert delivery error on {channel}: {str(e)}")
+
+_shared_dispatchers: Dict[str, AlertDispatcher] = {}
+_shared_lock = threading.Lock()
+
+def get_alert_dispatcher(config: Dict[str, Any]) -> AlertDispatcher:
+    """Returns the process-wide dispatcher for the configured alert channels and dispatch settings."""
+    observer_config = (config or {}).get('observer_interface', {}) or {}
+    key = repr((observer_config.get('alert_channels') or DEFAULT_CHANNELS, observer_config.get('alert_dispatch')))
+    with _shared_lock:
+        dispatcher = _shared_dispatchers.get(key)
+        if dispatcher is None:
+            dispatcher = _shared_dispatchers[key] = AlertDispatcher.from_config(config)
+        return dispatcher
+
+if __name__ == "__main__":
+    # Example usage
+    logging.basicConfig(level=logging.INFO)
+    dispatcher = AlertDispatcher(
+        channels=["observer_log", "system_state", "admin_notification"],
+        rate_limits={"admin_notification": 1.0}
+    )
+    for _ in range(500):
+        dispatcher.submit(ErrorCode.INVALID_GATE_SEQUENCE, AlertLevel.CRITICAL, "Gate sequence violation detected", "flow-1")
+    dispatcher.close()
+    print(f"Dispatcher stats: {dispatcher.stats}")
+    print(f"System state: {dispatcher.system_state}")
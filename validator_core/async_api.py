@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+
+import asyncio
+import contextvars
+import functools
+import logging
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Union
+from .validator import FieldValidator, ValidationResult
+from .coherence_check import CrossValidatorCoherence, CoherenceResult
+from .validation_flow import ValidationFlowPipeline
+from .observer_interface import ObserverInterface, ObserverCommand, ObserverAction, ObserverResponse
+from .result_columns import ResultColumns
+from .prime_index import PrimeAlignmentIndex
+from .tracing import get_span_recorder
+
+# Rough cost units: one unit per trial division or per node checked
+def prime_sequence_cost(sequence: Sequence[int]) -> int:
+    """Trial-division work of validating `sequence`, estimated from its length and last element."""
+    if not sequence:
+        return 0
+    try:
+        return len(sequence) * math.isqrt(max(int(sequence[-1]), 0))
+    except (TypeError, ValueError):
+        return 0
+
+def step_cost(step_type: str, params: Dict[str, Any]) -> int:
+    """Estimated cost of a pipeline validation step."""
+    if step_type == "prime_sequence":
+        return prime_sequence_cost(params.get('sequence') or ())
+    return 1
+
+class AsyncOffloader:
+    """Runs synchronous validator calls from asyncio without stalling the loop.
+
+    Pure checks estimated below `cost_threshold` run inline; costlier ones
+    and every call that may block (admission control, flow locks) go to a
+    thread pool. With `use_processes`, costly prime checks run in a process
+    pool instead (see AsyncFieldValidator). Calls sharing an ordering key
+    (a flow id) run strictly in submission order; different keys proceed
+    concurrently.
+    """
+
+    def __init__(self, cost_threshold: int = 20000, max_workers: int = 4, use_processes: bool = False):
+        self.cost_threshold = cost_threshold
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.stats = {'inline': 0, 'threaded': 0, 'processed': 0}
+
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._waiting: Dict[Hashable, int] = {}
+        self.logger = logging.getLogger("AsyncOffloader")
+
+    async def run(self, key: Optional[Hashable], cost: int, fn: Callable, *args: Any, may_block: bool = False) -> Any:
+        """Calls fn(*args) inline or on the thread pool, in order with other calls for `key`.
+
+        Set `may_block` for calls that can wait (admission queues, flow
+        locks); they never run on the loop, whatever their cost.
+        """
+        if key is None:
+            return await self._execute(cost, fn, args, may_block)
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._waiting[key] = self._waiting.get(key, 0) + 1
+        try:
+            async with lock:
+                return await self._execute(cost, fn, args, may_block)
+        finally:
+            self._waiting[key] -= 1
+            if not self._waiting[key]:
+                del self._waiting[key]
+                del self._locks[key]
+
+    def offloads_to_processes(self, cost: int) -> bool:
+        """True if a pure check of this cost should run in the process pool."""
+        return self.use_processes and cost >= self.cost_threshold
+
+    async def run_in_process(self, fn: Callable, *args: Any) -> Any:
+        """Calls a picklable fn(*args) in the process pool; it sees none of this process's state."""
+        self.stats['processed'] += 1
+        return await asyncio.get_running_loop().run_in_executor(self._process_pool(), fn, *args)
+
+    async def _execute(self, cost: int, fn: Callable, args: Sequence[Any], may_block: bool) -> Any:
+        if cost < self.cost_threshold and not may_block:
+            self.stats['inline'] += 1
+            return fn(*args)
+        loop = asyncio.get_running_loop()
+        self.stats['threaded'] += 1
+        # Carry contextvars (e.g. the trace id) into the worker thread
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._thread_pool(), functools.partial(context.run, fn, *args))
+
+    def _thread_pool(self) -> Executor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="AsyncValidator")
+        return self._threads
+
+    def _process_pool(self) -> Executor:
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._processes
+
+    def close(self) -> None:
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown(wait=True)
+        self._threads = self._processes = None
+
+# Per worker process: config path -> validator, for process-pool offload
+_process_validators: Dict[str, FieldValidator] = {}
+
+def _check_prime_sequence_in_process(config_path: str, sequence: List[int]) -> ValidationResult:
+    """The bare prime check; overrides, the negative cache and tracing stay with the caller."""
+    validator = _process_validators.get(config_path)
+    if validator is None:
+        validator = _process_validators[config_path] = FieldValidator(config_path)
+    return validator._check_prime_sequence(sequence)
+
+class AsyncFieldValidator:
+    """Awaitable FieldValidator checks. These are pure, so they are not serialised per flow."""
+
+    def __init__(self, validator: FieldValidator, offloader: AsyncOffloader):
+        self.validator = validator
+        self.offloader = offloader
+
+    async def validate_prime_sequence(self, sequence: List[int]) -> ValidationResult:
+        validator = self.validator
+        cost = prime_sequence_cost(sequence)
+        if not self.offloader.offloads_to_processes(cost):
+            return await self.offloader.run(None, cost, validator.validate_prime_sequence, sequence)
+        # Only the check itself leaves the process: overrides, the negative cache
+        # and the trace are applied here, as validate_prime_sequence would
+        with get_span_recorder().span("FieldValidator.validate_prime_sequence"):
+            try:
+                result = validator.known_prime_sequence_result(sequence)
+                if result is None:
+                    result = await self.offloader.run_in_process(
+                        _check_prime_sequence_in_process, validator.config_path, list(sequence)
+                    )
+                    validator.remember_prime_sequence_result(sequence, result)
+                return result
+            except Exception as e:
+                return validator.prime_sequence_error(e)
+
+    async def validate_field_address(self, latitude: str, longitude: str, temporal: str) -> ValidationResult:
+        return await self.offloader.run(None, 1, self.validator.validate_field_address, latitude, longitude, temporal)
+
+    async def validate_gate_transition(self, gate: str, from_domain: str, to_domain: str) -> ValidationResult:
+        return await self.offloader.run(None, 1, self.validator.validate_gate_transition, gate, from_domain, to_domain)
+
+class AsyncCoherence:
+    """Awaitable CrossValidatorCoherence checks, ordered per checker (it caches its last inputs)."""
+
+    def __init__(self, checker: CrossValidatorCoherence, offloader: AsyncOffloader):
+        self.checker = checker
+        self.offloader = offloader
+
+    async def check_full_field_coherence(
+        self,
+        prime_sequence: List[int],
+        field_coordinates: Dict[str, str],
+        gate: str,
+        target_domain: str,
+        active_gates: List[str]
+    ) -> CoherenceResult:
+        return await self.offloader.run(
+            ('coherence', self.checker.flow_id),
+            len(prime_sequence),
+            self.checker.check_full_field_coherence,
+            prime_sequence, field_coordinates, gate, target_domain, active_gates
+        )
+
+    async def check_fleet_prime_spatial_coherence(
+        self,
+        prime_sequence: Union[Sequence[int], PrimeAlignmentIndex],
+        fleet_coordinates: Iterable[Dict[str, str]]
+    ) -> ResultColumns:
+        fleet_coordinates = list(fleet_coordinates)
+        length = prime_sequence.length if isinstance(prime_sequence, PrimeAlignmentIndex) else len(prime_sequence)
+        return await self.offloader.run(
+            ('coherence', self.checker.flow_id),
+            length + len(fleet_coordinates),
+            self.checker.check_fleet_prime_spatial_coherence,
+            prime_sequence, fleet_coordinates
+        )
+
+class AsyncFlowPipeline:
+    """Awaitable ValidationFlowPipeline operations, applied to the flow in submission order.
+
+    They wait on admission control and the flow lock, so they always run on the thread pool.
+    """
+
+    def __init__(self, pipeline: ValidationFlowPipeline, offloader: AsyncOffloader):
+        self.pipeline = pipeline
+        self.offloader = offloader
+
+    async def process_validation_step(self, step_type: str, params: Dict[str, Any]) -> bool:
+        return await self.offloader.run(
+            self.pipeline.flow_id,
+            step_cost(step_type, params),
+            self.pipeline.process_validation_step,
+            step_type, params,
+            may_block=True
+        )
+
+    async def check_field_coherence(self) -> CoherenceResult:
+        return await self.offloader.run(
+            self.pipeline.flow_id,
+            len(self.pipeline.flow_context.prime_sequence),
+            self.pipeline.check_field_coherence,
+            may_block=True
+        )
+
+class AsyncObserver:
+    """Awaitable ObserverInterface commands, ordered per target flow; always on the thread pool."""
+
+    def __init__(self, observer: ObserverInterface, offloader: AsyncOffloader):
+        self.observer = observer
+        self.offloader = offloader
+
+    async def execute_command(self, command: ObserverCommand) -> ObserverResponse:
+        cost = 1
+        if command.action == ObserverAction.ADVANCE:
+            cost = step_cost(command.parameters.get('step_type', ''), command.parameters.get('params') or {})
+        return await self.offloader.run(
+            command.parameters.get('flow_id', self.observer.flow_controller.flow_id),
+            cost,
+            self.observer.execute_command,
+            command,
+            may_block=True
+        )
+
+if __name__ == "__main__":
+    # Event-loop responsiveness while a large prime sequence is validated,
+    # and per-flow ordering across concurrently running flows.
+    import os
+    import time
+
+    logging.basicConfig(level=logging.WARNING)
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "validator_config.yaml")
+    primes = [n for n in range(2, 200000) if all(n % d for d in range(2, math.isqrt(n) + 1))]
+
+    async def worst_stall(coro) -> float:
+        """Largest gap between 1ms ticks of a heartbeat task while `coro` runs."""
+        gaps = [0.0]
+
+        async def heartbeat():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(0.001)
+                now = time.perf_counter()
+                gaps[0] = max(gaps[0], now - last)
+                last = now
+
+        beat = asyncio.create_task(heartbeat())
+        await asyncio.sleep(0.01)
+        await coro
+        await asyncio.sleep(0.005)  # let the heartbeat observe any stall
+        beat.cancel()
+        return gaps[0] * 1000
+
+    async def main():
+        offloader = AsyncOffloader()
+        validator = FieldValidator(config_path)
+        facade = AsyncFieldValidator(validator, offloader)
+
+        async def blocking():
+            validator.validate_prime_sequence(primes)
+
+        print(f"{len(primes)}-prime sequence (cost {prime_sequence_cost(primes)}): "
+              f"loop stalled {await worst_stall(blocking()):.1f}ms called directly, "
+              f"{await worst_stall(facade.validate_prime_sequence(primes)):.1f}ms through the facade")
+
+        flows = [AsyncFlowPipeline(ValidationFlowPipeline(config_path, f"flow-{i}"), offloader) for i in range(3)]
+        for flow in flows:
+            flow.pipeline.initialize_flow({'domain': 'OBI-WAN'})
+        completed: Dict[str, List[int]] = {flow.pipeline.flow_id: [] for flow in flows}
+
+        async def step(flow: AsyncFlowPipeline, n: int) -> None:
+            await flow.process_validation_step("prime_sequence", {'sequence': primes[:n]})
+            completed[flow.pipeline.flow_id].append(n)
+
+        # Heavy and trivial steps interleaved: the trivial ones must not overtake within a flow
+        sizes = (17000, 10, 5000, 1)
+        steps = [step(flow, n) for n in sizes for flow in flows]
+        started = time.perf_counter()
+        await asyncio.gather(*steps)
+        elapsed = time.perf_counter() - started
+        for flow_id, order in completed.items():
+            print(f"{flow_id}: steps completed in order {order} ({'ordered' if tuple(order) == sizes else 'REORDERED'})")
+        print(f"{len(steps)} steps across {len(flows)} flows in {elapsed * 1000:.0f}ms; offloader stats: {offloader.stats}")
+        offloader.close()
+
+    asyncio.run(main())
@@ -0,0 +1,680 @@
+#!/usr/bin/env python3
+
+import bisect
+import hashlib
+import json
+import logging
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from itertools import islice
+from typing import Any, Dict, List, Optional
+from .validation_flow import ValidationFlowPipeline
+from .validator import ValidationResult
+from .coherence_check import CoherenceResult, CoherenceState
+from .error_codes import AlertLevel, ErrorCode
+from .flow_checkpoint import _RECORD_FIELDS, _capture, restore_flow
+from .flow_replay import FlowReplayLog
+from .quarantine_scheduler import QuarantineScheduler
+from .config_cache import configure_logging, load_config
+
+# Frames are a 4-byte big-endian length followed by a UTF-8 JSON object
+_FRAME = struct.Struct(">I")
+MAX_FRAME = 16 * 1024 * 1024
+HISTORY_TAIL = 100
+REPLAY_TAIL = 256  # replay events carried per migration, rounded out to whole keyframe blocks
+
+class HashRing:
+    """Consistent hash ring with virtual nodes; keys move only to or from a changed member."""
+
+    def __init__(self, nodes: List[str] = (), vnodes: int = 64):
+        self.vnodes = vnodes
+        self.nodes: List[str] = []
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        for node in nodes:
+            self.add(node)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'big')
+
+    def add(self, node: str) -> None:
+        if node in self.nodes:
+            return
+        self.nodes.append(node)
+        for i in range(self.vnodes):
+            point = self._hash(f"{node}#{i}")
+            at = bisect.bisect(self._points, point)
+            self._points.insert(at, point)
+            self._owners.insert(at, node)
+
+    def remove(self, node: str) -> None:
+        if node not in self.nodes:
+            return
+        self.nodes.remove(node)
+        keep = [(p, o) for p, o in zip(self._points, self._owners) if o != node]
+        self._points = [p for p, _ in keep]
+        self._owners = [o for _, o in keep]
+
+    def owner(self, key: str) -> Optional[str]:
+        """Member that owns `key` (a flow id), or None for an empty ring."""
+        if not self._points:
+            return None
+        at = bisect.bisect(self._points, self._hash(key)) % len(self._points)
+        return self._owners[at]
+
+def _encode_result(result: Any) -> Optional[Dict[str, Any]]:
+    if result is None:
+        return None
+    encoded = {
+        'error_code': int(result.error_code),
+        'error_message': result.error_message,
+        'alert_level': int(result.alert_level),
+        'timestamp': result.timestamp
+    }
+    if isinstance(result, CoherenceResult):
+        encoded.update(is_valid=result.is_coherent, state=result.state.value, drift_points=list(result.drift_points))
+    else:
+        encoded['is_valid'] = result.is_valid
+    return encoded
+
+def _encode_row(row: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
+    """Encodes a compacted history entry from its stored codes."""
+    return {
+        'error_code': int(row['error_code']),
+        'error_message': "",
+        'alert_level': int(row['alert_level']),
+        'timestamp': timestamp,
+        'is_valid': row['is_valid']
+    }
+
+def _decode_result(encoded: Dict[str, Any]) -> Any:
+    common = dict(
+        error_code=ErrorCode(encoded['error_code']),
+        error_message=encoded['error_message'],
+        alert_level=AlertLevel(encoded['alert_level']),
+        timestamp=encoded['timestamp']
+    )
+    if 'state' in encoded:
+        return CoherenceResult(
+            is_coherent=encoded['is_valid'],
+            state=CoherenceState(encoded['state']),
+            drift_points=encoded['drift_points'],
+            **common
+        )
+    return ValidationResult(is_valid=encoded['is_valid'], **common)
+
+def export_flow_record(
+    flow: ValidationFlowPipeline,
+    history_tail: int = HISTORY_TAIL,
+    replay_tail: int = REPLAY_TAIL
+) -> Dict[str, Any]:
+    """Context, gate, drift and quarantine state and history and replay tails of a flow as a JSON-safe migration record."""
+    with flow.lock:  # a background revalidation may be running on the flow
+        record = dict(zip(_RECORD_FIELDS, _capture(flow)))
+        # The validator only ever consults the last active gate
+        record['gate_state'] = flow.validator.validation_state['active_gates'][-1:]
+        record['quarantine_step'] = flow.quarantine_step
+        drift_engine = flow.coherence_checker.drift_engine
+        record['drift'] = drift_engine.export_flow(flow.flow_id) if drift_engine is not None else None
+        record['replay'] = flow.replay_log.export(replay_tail) if flow.replay_log is not None else None
+        entries = flow.flow_context.validation_history
+        record['history'] = []
+        for entry in islice(entries, max(len(entries) - history_tail, 0), None):
+            if entry['result'] is not None:
+                encoded = _encode_result(entry['result'])
+            else:
+                row = flow.result_columns.row(entry['column'])
+                if row is None:
+                    continue  # codes dropped along with the flow's result columns
+                encoded = _encode_row(row, entry['timestamp'])
+            record['history'].append({
+                'timestamp': entry['timestamp'],
+                'event_type': entry.get('event_type', 'validation'),
+                'flow_state': entry['flow_state'],
+                'result': encoded
+            })
+        return record
+
+def import_flow_record(flow: ValidationFlowPipeline, record: Dict[str, Any]) -> None:
+    """Applies a migration record to a freshly constructed flow."""
+    restore_flow(flow, record)
+    flow.validator.validation_state['active_gates'] = list(record['gate_state'])
+    if record['coherence_state'] is not None:
+        flow.coherence_checker.coherence_state = CoherenceState(record['coherence_state'])
+    if record.get('quarantine_step') is not None:
+        flow.quarantine_step = tuple(record['quarantine_step'])
+    drift_engine = flow.coherence_checker.drift_engine
+    if drift_engine is not None and record.get('drift') is not None:
+        drift_engine.import_flow(flow.flow_id, record['drift'])
+    history = flow.flow_context.validation_history
+    for entry in record['history']:
+        result = _decode_result(entry['result'])
+        history.append(dict(entry, result=result, column=flow.result_columns.append(result)))
+    for entry in islice(history, max(len(history) - flow.retain_results, 0)):
+        entry['result'] = None
+    if flow.replay_log is not None:
+        if record.get('replay') is not None:
+            flow.replay_log = FlowReplayLog.from_export(record['replay'], flow.replay_log.max_events)
+        flow.replay_log.record(flow, "migrated")
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:])
+        if n == 0:
+            return None
+        received += n
+    return bytes(buffer)
+
+def recv_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """Reads one frame; None when the peer closed the connection."""
+    header = _recv_exact(sock, _FRAME.size)
+    if header is None:
+        return None
+    (length,) = _FRAME.unpack(header)
+    if length > MAX_FRAME:
+        raise ValueError(f"Frame of {length} bytes exceeds the {MAX_FRAME} byte limit")
+    body = _recv_exact(sock, length)
+    if body is None:
+        return None
+    return json.loads(body)
+
+def send_message(sock: socket.socket, message: Dict[str, Any]) -> None:
+    body = json.dumps(message, separators=(',', ':')).encode()
+    sock.sendall(_FRAME.pack(len(body)) + body)
+
+def _connect(address: str) -> socket.socket:
+    """Connects to "unix:/path" or "host:port"."""
+    if address.startswith("unix:"):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(address[5:])
+    else:
+        host, port = address.rsplit(':', 1)
+        sock = socket.create_connection((host, int(port)))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+class PeerPool:
+    """Reusable request/reply connections per peer address."""
+
+    def __init__(self):
+        self._idle: Dict[str, List[socket.socket]] = {}
+        self._lock = threading.Lock()
+
+    def request(self, address: str, message: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            idle = self._idle.get(address)
+            sock = idle.pop() if idle else None
+        if sock is None:
+            sock = _connect(address)
+        try:
+            send_message(sock, message)
+            reply = recv_message(sock)
+            if reply is None:
+                raise ConnectionError(f"Peer {address} closed the connection")
+        except BaseException:
+            sock.close()
+            raise
+        with self._lock:
+            self._idle.setdefault(address, []).append(sock)
+        return reply
+
+    def close(self) -> None:
+        with self._lock:
+            for sockets in self._idle.values():
+                for sock in sockets:
+                    sock.close()
+            self._idle.clear()
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        node = self.server.node
+        while True:
+            try:
+                message = recv_message(self.request)
+            except (OSError, ValueError):
+                return
+            if message is None:
+                return
+            send_message(self.request, node.handle(message))
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+class ClusterNode:
+    """One validator_core process owning the flows the hash ring assigns to it.
+
+    Membership arrives as an epoch-numbered member map. On a change the node
+    pushes flows it no longer owns to their new owner in the background; a
+    new owner touched before the push arrives pulls the flow from its
+    previous owner instead; while a flow is in transit the node replies
+    'unavailable' and the client retries. Flows are only created by begin,
+    so a flow is only ever live on one node. Quarantined flows are
+    recovered by the node they are live on.
+    """
+
+    def __init__(self, node_id: str, address: str, config_path: str, vnodes: int = 64):
+        self.node_id = node_id
+        self.address = address
+        self.config_path = config_path
+        self.vnodes = vnodes
+        self.epoch = 0
+        self.members: Dict[str, str] = {}
+        self.previous_members: Dict[str, str] = {}
+        self.ring = HashRing(vnodes=vnodes)
+        self.previous_ring: Optional[HashRing] = None
+        self.flows: Dict[str, ValidationFlowPipeline] = {}
+        self.peers = PeerPool()
+        self.stats = {'steps': 0, 'moved': 0, 'migrated_in': 0, 'migrated_out': 0, 'pulled': 0}
+        self.quarantine_scheduler = QuarantineScheduler.from_config(load_config(config_path).config)
+
+        self._flow_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[socketserver.BaseServer] = None
+        self._ops = {
+            'ping': self._ping,
+            'members': self._set_members,
+            'begin': self._begin,
+            'step': self._step,
+            'coherence': self._coherence,
+            'status': self._status,
+            'export_flow': self._export_flow,
+            'import_flow': self._import_flow,
+            'stats': self._stats,
+        }
+        configure_logging()
+        self.logger = logging.getLogger("ClusterNode")
+
+    def serve_forever(self) -> None:
+        """Listens on the node's address until shutdown()."""
+        if self.address.startswith("unix:"):
+            path = self.address[5:]
+            if os.path.exists(path):
+                os.unlink(path)
+            self._server = _UnixServer(path, _RequestHandler)
+        else:
+            host, port = self.address.rsplit(':', 1)
+            self._server = _TCPServer((host, int(port)), _RequestHandler)
+        self._server.node = self
+        self.logger.info(f"Cluster node {self.node_id} listening on {self.address}")
+        self.quarantine_scheduler.start()
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        self.quarantine_scheduler.stop()
+        self.peers.close()
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Executes one protocol message and returns its reply."""
+        op = self._ops.get(message.get('op'))
+        if op is None:
+            return {'ok': False, 'error': f"Unknown op: {message.get('op')}"}
+        try:
+            return op(message)
+        except Exception as e:
+            self.logger.error(f"Cluster op {message.get('op')} failed: {str(e)}")
+            return {'ok': False, 'error': str(e)}
+
+    def _ping(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        return {'ok': True, 'node_id': self.node_id, 'epoch': self.epoch, 'flows': len(self.flows)}
+
+    def _stats(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        return {'ok': True, 'node_id': self.node_id, 'flows': len(self.flows), **stats}
+
+    def _count(self, *names: str) -> None:
+        with self._lock:
+            for name in names:
+                self.stats[name] += 1
+
+    def _set_members(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            if message['epoch'] <= self.epoch:
+                return {'ok': True, 'epoch': self.epoch}
+            # The sender's view of the prior membership: a joining node has none of its own
+            self.previous_members = dict(message.get('previous_members') or self.members)
+            self.previous_ring = HashRing(sorted(self.previous_members), self.vnodes)
+            self.members = dict(message['members'])
+            self.ring = HashRing(sorted(self.members), self.vnodes)
+            self.epoch = message['epoch']
+        threading.Thread(target=self._rebalance, name="ClusterRebalance", daemon=True).start()
+        return {'ok': True, 'epoch': self.epoch}
+
+    def _moved(self, flow_id: str) -> Optional[Dict[str, Any]]:
+        owner = self.ring.owner(flow_id)
+        if owner == self.node_id:
+            return None
+        self._count('moved')
+        return {'ok': False, 'moved': owner, 'epoch': self.epoch, 'members': self.members}
+
+    def _begin(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        flow_id = message['flow_id']
+        with self._flow_lock(flow_id):
+            moved = self._moved(flow_id)
+            if moved:
+                return moved
+            flow = ValidationFlowPipeline(self.config_path, flow_id)
+            ok = flow.initialize_flow(message.get('context') or {})
+            with self._lock:
+                self.flows[flow_id] = flow
+            self.quarantine_scheduler.track(flow)
+            return {'ok': True, 'valid': ok, 'state': flow.flow_context.state.value}
+
+    def _step(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        flow_id = message['flow_id']
+        with self._flow_lock(flow_id):
+            moved = self._moved(flow_id)
+            if moved:
+                return moved
+            flow = self._local_flow(flow_id)
+            if flow is None:
+                return self._unavailable(flow_id)
+            valid = flow.process_validation_step(message['step_type'], message['params'])
+            self._count('steps')
+            return {
+                'ok': True,
+                'valid': valid,
+                'result': _encode_result(flow.last_result),
+                'state': flow.flow_context.state.value
+            }
+
+    def _coherence(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        flow_id = message['flow_id']
+        with self._flow_lock(flow_id):
+            moved = self._moved(flow_id)
+            if moved:
+                return moved
+            flow = self._local_flow(flow_id)
+            if flow is None:
+                return self._unavailable(flow_id)
+            result = flow.check_field_coherence()
+            return {'ok': True, 'valid': result.is_coherent, 'result': _encode_result(result)}
+
+    def _status(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        flow_id = message['flow_id']
+        with self._flow_lock(flow_id):
+            moved = self._moved(flow_id)
+            if moved:
+                return moved
+            flow = self._local_flow(flow_id)
+            if flow is None:
+                return self._unavailable(flow_id)
+            ctx = flow.flow_context
+            return {
+                'ok': True,
+                'node_id': self.node_id,
+                'state': ctx.state.value,
+                'coherence_state': ctx.coherence_state,
+                'current_domain': ctx.current_domain,
+                'active_gates': ctx.active_gates,
+                'field_coordinates': ctx.field_coordinates,
+                'revision': flow.revision,
+                'history_length': len(ctx.validation_history)
+            }
+
+    def _export_flow(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Hands a flow over to the caller (a pull by its new owner)."""
+        flow_id = message['flow_id']
+        with self._flow_lock(flow_id):
+            with self._lock:
+                flow = self.flows.pop(flow_id, None)
+            if flow is None:
+                return {'ok': True, 'record': None}
+            self.quarantine_scheduler.untrack(flow)
+            self._count('migrated_out')
+            return {'ok': True, 'record': export_flow_record(flow)}
+
+    def _import_flow(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Accepts a pushed flow. Takes no flow lock, so a concurrent pull cannot deadlock with it."""
+        flow = ValidationFlowPipeline(self.config_path, message['flow_id'])
+        import_flow_record(flow, message['record'])
+        with self._lock:
+            if message['flow_id'] in self.flows:
+                self.logger.warning(f"Ignoring pushed flow {message['flow_id']}: already live here")
+                return {'ok': True, 'accepted': False}
+            self.flows[message['flow_id']] = flow
+        self.quarantine_scheduler.track(flow)
+        self._count('migrated_in')
+        return {'ok': True, 'accepted': True}
+
+    def _local_flow(self, flow_id: str) -> Optional[ValidationFlowPipeline]:
+        """The live flow, pulled from its previous owner if needed; None if it is not reachable yet."""
+        # Called with the flow lock held
+        flow = self.flows.get(flow_id)
+        if flow is not None:
+            return flow
+
+        previous = self.previous_ring.owner(flow_id) if self.previous_ring else None
+        if previous is None or previous == self.node_id:
+            return None
+        address = self.previous_members.get(previous) or self.members.get(previous)
+        try:
+            reply = self.peers.request(address, {'op': 'export_flow', 'flow_id': flow_id})
+        except (OSError, ConnectionError) as e:
+            self.logger.warning(f"Could not pull flow {flow_id} from {previous}: {str(e)}")
+            return None
+        if reply.get('record') is None:
+            # Not there (still in transit, or it moved on): the push will land here or the client retries
+            with self._lock:
+                return self.flows.get(flow_id)
+
+        flow = ValidationFlowPipeline(self.config_path, flow_id)
+        import_flow_record(flow, reply['record'])
+        with self._lock:
+            # A push may have landed while we were pulling; both came from the same single live copy
+            flow = self.flows.setdefault(flow_id, flow)
+        self.quarantine_scheduler.track(flow)
+        self._count('pulled', 'migrated_in')
+        return flow
+
+    def _unavailable(self, flow_id: str) -> Dict[str, Any]:
+        return {'ok': False, 'unavailable': True, 'error': f"Flow {flow_id} is not live on {self.node_id}"}
+
+    def _rebalance(self) -> None:
+        """Pushes every flow this node no longer owns to its new owner."""
+        for flow_id in list(self.flows):
+            owner = self.ring.owner(flow_id)
+            if owner == self.node_id or owner is None:
+                continue
+            with self._flow_lock(flow_id):
+                with self._lock:
+                    flow = self.flows.pop(flow_id, None)
+                if flow is None:
+                    continue
+                self.quarantine_scheduler.untrack(flow)
+                try:
+                    self.peers.request(self.members[owner], {
+                        'op': 'import_flow',
+                        'flow_id': flow_id,
+                        'record': export_flow_record(flow)
+                    })
+                    self._count('migrated_out')
+                except (OSError, ConnectionError) as e:
+                    with self._lock:
+                        self.flows.setdefault(flow_id, flow)
+                    self.quarantine_scheduler.track(flow)
+                    self.logger.error(f"Migration of flow {flow_id} to {owner} failed: {str(e)}")
+
+    def _flow_lock(self, flow_id: str) -> threading.Lock:
+        lock = self._flow_locks.get(flow_id)
+        if lock is None:
+            with self._lock:
+                lock = self._flow_locks.setdefault(flow_id, threading.Lock())
+        return lock
+
+class ClusterClient:
+    """Routes flow requests to their owning node and follows ownership changes."""
+
+    def __init__(self, members: Dict[str, str], vnodes: int = 64, epoch: int = 0):
+        self.vnodes = vnodes
+        self.peers = PeerPool()
+        self.epoch = epoch
+        self.members = dict(members)
+        self.ring = HashRing(sorted(self.members), vnodes)
+
+    def set_members(self, members: Dict[str, str]) -> None:
+        """Announces a new membership to every old and new node; leaving nodes drain their flows."""
+        self.epoch += 1
+        message = {'op': 'members', 'epoch': self.epoch, 'members': members, 'previous_members': self.members}
+        for address in set(self.members.values()) | set(members.values()):
+            self.peers.request(address, message)
+        self.members = dict(members)
+        self.ring = HashRing(sorted(self.members), self.vnodes)
+
+    def request(self, flow_id: str, message: Dict[str, Any], retries: int = 3, backoff: float = 0.05) -> Dict[str, Any]:
+        """Sends a flow request to its owner, following moves and waiting out flows in transit.
+
+        Returns the owner's reply; an unknown flow ends as an 'unavailable' error reply.
+        """
+        message = dict(message, flow_id=flow_id)
+        for attempt in range(retries + 1):
+            owner = self.ring.owner(flow_id)
+            reply = self.peers.request(self.members[owner], message)
+            if reply.get('unavailable'):
+                if attempt < retries:
+                    time.sleep(backoff * 2 ** attempt)
+                continue
+            if 'moved' not in reply:
+                return reply
+            if reply['epoch'] > self.epoch:
+                self.epoch = reply['epoch']
+                self.members = dict(reply['members'])
+                self.ring = HashRing(sorted(self.members), self.vnodes)
+        if reply.get('unavailable'):
+            return reply
+        raise ConnectionError(f"Flow {flow_id} kept moving after {retries} retries")
+
+    def begin(self, flow_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        return self.request(flow_id, {'op': 'begin', 'context': context})
+
+    def step(self, flow_id: str, step_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self.request(flow_id, {'op': 'step', 'step_type': step_type, 'params': params})
+
+    def coherence(self, flow_id: str) -> Dict[str, Any]:
+        return self.request(flow_id, {'op': 'coherence'})
+
+    def status(self, flow_id: str) -> Dict[str, Any]:
+        return self.request(flow_id, {'op': 'status'})
+
+    def node_stats(self) -> List[Dict[str, Any]]:
+        return [self.peers.request(address, {'op': 'stats'}) for address in self.members.values()]
+
+    def close(self) -> None:
+        self.peers.close()
+
+def run_node(node_id: str, address: str, config_path: str) -> None:
+    """Process entry point for one cluster node."""
+    logging.basicConfig(level=logging.WARNING)
+    ClusterNode(node_id, address, config_path).serve_forever()
+
+def _run_load(members: Dict[str, str], epoch: int, flow_ids: List[str], seconds: float, threads: int, results) -> None:
+    """Load generator process for the example below: field address steps over `flow_ids`."""
+    client = ClusterClient(members, epoch=epoch)
+    counts = {flow_id: 0 for flow_id in flow_ids}
+    stop = time.monotonic() + seconds
+
+    def worker(own: List[str]) -> None:
+        i = 0
+        while time.monotonic() < stop:
+            flow_id = own[i % len(own)]
+            reply = client.step(flow_id, "field_address", {
+                'latitude': f"FIELD/node-{i % 7}/{i % 97}",
+                'longitude': 'OBI-WAN/personal',
+                'temporal': '20250612091630Z'
+            })
+            counts[flow_id] += bool(reply.get('ok'))
+            i += 1
+
+    workers = [threading.Thread(target=worker, args=(flow_ids[n::threads],)) for n in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    client.close()
+    results.put(counts)
+
+if __name__ == "__main__":
+    # Four node processes on one machine, driven by four load processes:
+    # nodes join one at a time, flows migrate live while load runs, and
+    # throughput is measured at each cluster size.
+    import multiprocessing
+    import tempfile
+    from . import cluster as cluster_module  # importable targets for spawned processes
+
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "validator_config.yaml")
+    socket_dir = tempfile.mkdtemp()
+    addresses = {f"node-{i}": f"unix:{os.path.join(socket_dir, f'node-{i}.sock')}" for i in range(1, 5)}
+
+    context = multiprocessing.get_context("spawn")
+    nodes = [
+        context.Process(target=cluster_module.run_node, args=(node_id, address, config_path), daemon=True)
+        for node_id, address in addresses.items()
+    ]
+    for process in nodes:
+        process.start()
+    for address in addresses.values():
+        for _ in range(200):
+            try:
+                _connect(address).close()
+                break
+            except OSError:
+                time.sleep(0.05)
+
+    client = ClusterClient({})
+    flow_ids = [f"flow-{i}" for i in range(400)]
+    expected: Dict[str, int] = {}
+    load_processes, seconds = 4, 3.0
+    print(f"Running on {os.cpu_count()} CPU(s); steps/s can only grow with nodes while CPUs are free")
+
+    for size in range(1, 5):
+        client.set_members({node_id: addresses[node_id] for node_id in list(addresses)[:size]})
+        if size == 1:
+            for flow_id in flow_ids:
+                client.begin(flow_id, {'domain': 'OBI-WAN', 'prime_sequence': [2, 3, 5, 7, 11]})
+                expected[flow_id] = client.status(flow_id)['revision']
+
+        results = context.Queue()
+        loaders = [
+            context.Process(
+                target=cluster_module._run_load,
+                args=(client.members, client.epoch, flow_ids[n::load_processes], seconds, 8, results)
+            )
+            for n in range(load_processes)
+        ]
+        for process in loaders:
+            process.start()
+        steps = 0
+        for _ in loaders:
+            for flow_id, count in results.get().items():
+                expected[flow_id] += count
+                steps += count
+        for process in loaders:
+            process.join()
+
+        intact = sum(client.status(flow_id)['revision'] == expected[flow_id] for flow_id in flow_ids)
+        spread = {s['node_id']: s['flows'] for s in client.node_stats()}
+        print(f"{size} node(s): {steps / seconds:7.0f} steps/s, flows per node {spread}, "
+              f"{intact}/{len(flow_ids)} flows with every step applied")
+
+    client.set_members({node_id: addresses[node_id] for node_id in list(addresses)[1:]})
+    intact = sum(client.status(flow_id)['revision'] == expected[flow_id] for flow_id in flow_ids)
+    print(f"node-1 left: flows per node {dict((s['node_id'], s['flows']) for s in client.node_stats())}, "
+          f"{intact}/{len(flow_ids)} flows with every step applied")
+    client.close()
+    for process in nodes:
+        process.terminate()
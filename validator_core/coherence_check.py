@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from collections import deque
+from typing import Dict, Iterable, List, Any, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from .error_codes import AlertLevel, ErrorCode
+from .coordinates import FieldAddress, get_coordinate_cache
+from .prime_index import PrimeAlignmentIndex
+from .tracing import traced
+from .result_columns import ResultColumns
+from .overrides import get_override_registry
 
 class CoherenceState(Enum):
     COHERENT = "coherent"
@@ -17,36 +24,48 @@ class CoherenceResult:
     is_coherent: bool
     state: CoherenceState
     drift_points: List[str]
-    error_code: str = ""
+    error_code: ErrorCode = ErrorCode.NONE
     error_message: str = ""
     timestamp: str = ""
     details: Dict[str, Any] = None
+    alert_level: AlertLevel = AlertLevel.NORMAL
 
 class CrossValidatorCoherence:
-    def __init__(self):
+    def __init__(self, drift_engine: Any = None, history_limit: int = 1000, flow_id: str = "default"):
+        self.flow_id = flow_id
         self.logger = logging.getLogger("CrossValidatorCoherence")
         self.coherence_state = CoherenceState.COHERENT
-        self.drift_history: List[Dict[str, Any]] = []
+        self.drift_history: "deque[Dict[str, Any]]" = deque(maxlen=history_limit)
+        self.drift_engine = drift_engine
+        self.coordinates = get_coordinate_cache()
+        self.overrides = get_override_registry()
+        self._alignment_index: Optional[PrimeAlignmentIndex] = None
+        # Inputs of the last coherent outcome of each sub-check in check_full_field_coherence
+        self._coherent_inputs: Dict[str, Tuple] = {}
+        self.stats = {'checks_run': 0, 'checks_skipped': 0}
 
+    @traced
     def check_prime_spatial_coherence(
         self,
         prime_sequence: List[int],
         field_coordinates: Dict[str, str]
     ) -> CoherenceResult:
         """Validates coherence between prime sequence and spatial coordinates."""
+        if self.overrides.is_overridden("prime_spatial", self.flow_id):
+            return self._overridden_result("prime_spatial")
         try:
-            # Extract coordinate components
-            latitude = field_coordinates.get('latitude', '')
-            node_id = latitude.split('/')[-1] if latitude else ''
+            address = self.coordinates.parse_coordinates(field_coordinates)
+            node_id = address.node_token
             
             # Verify node ID aligns with prime sequence
-            if node_id and not self._validate_node_prime_alignment(int(node_id), prime_sequence):
+            if node_id and not self._validate_node_prime_alignment(self._node_id(address), prime_sequence):
                 return CoherenceResult(
                     is_coherent=False,
                     state=CoherenceState.CRITICAL_DRIFT,
                     drift_points=["prime_spatial_misalignment"],
-                    error_code="PRIME_SPATIAL_INCOHERENCE",
-                    error_message=f"Node {node_id} does not align with prime sequence {prime_sequence}",
+                    error_code=ErrorCode.PRIME_SPATIAL_INCOHERENCE,
+                    alert_level=AlertLevel.CRITICAL,
+                    error_message=f"Node {node_id} does not align with prime sequence {self._describe_sequence(prime_sequence)}",
                     timestamp=datetime.utcnow().isoformat() + 'Z'
                 )
 
@@ -59,8 +78,34 @@ class CrossValidatorCoherence:
 
         except Exception as e:
             self.logger.error(f"Prime-spatial coherence check error: {str(e)}")
-            return self._create_error_result("COHERENCE_CHECK_ERROR", str(e))
+            return self._create_error_result(ErrorCode.COHERENCE_CHECK_ERROR, str(e))
+
+    @traced
+    def check_fleet_prime_spatial_coherence(
+        self,
+        prime_sequence: Union[Sequence[int], PrimeAlignmentIndex],
+        fleet_coordinates: Iterable[Dict[str, str]]
+    ) -> ResultColumns:
+        """Checks prime-spatial coherence for many nodes against one sequence in a single pass.
+
+        Returns one byte-coded entry per node, in input order.
+        """
+        index = self.alignment_index(prime_sequence)
+        addresses = [self.coordinates.parse_coordinates(coords) for coords in fleet_coordinates]
+        # Unparsed node ids are decided without the index; 0 keeps the batch on the bitset gather
+        aligned = index.contains_many([a.node_id if a.node_id is not None else 0 for a in addresses])
+
+        columns = ResultColumns()
+        for address, is_aligned in zip(addresses, aligned):
+            if is_aligned or not address.node_token:
+                columns.append_code(ErrorCode.NONE, AlertLevel.NORMAL, True)
+            elif address.node_id is None:
+                columns.append_code(ErrorCode.COHERENCE_CHECK_ERROR, AlertLevel.CRITICAL, False)
+            else:
+                columns.append_code(ErrorCode.PRIME_SPATIAL_INCOHERENCE, AlertLevel.CRITICAL, False)
+        return columns
 
+    @traced
     def check_gate_temporal_coherence(
         self,
         gate: str,
@@ -68,6 +113,8 @@ class CrossValidatorCoherence:
         active_gates: List[str]
     ) -> CoherenceResult:
         """Validates coherence between gate transition and temporal sequence."""
+        if self.overrides.is_overridden("gate_temporal", self.flow_id):
+            return self._overridden_result("gate_temporal")
         try:
             # Verify temporal sequence of gates
             if not self._validate_gate_temporal_sequence(gate, temporal_marker, active_gates):
@@ -75,7 +122,8 @@ class CrossValidatorCoherence:
                     is_coherent=False,
                     state=CoherenceState.PARTIAL_DRIFT,
                     drift_points=["gate_temporal_misalignment"],
-                    error_code="GATE_TEMPORAL_INCOHERENCE",
+                    error_code=ErrorCode.GATE_TEMPORAL_INCOHERENCE,
+                    alert_level=AlertLevel.HIGH,
                     error_message=f"Gate {gate} violates temporal sequence",
                     timestamp=datetime.utcnow().isoformat() + 'Z'
                 )
@@ -89,8 +137,9 @@ class CrossValidatorCoherence:
 
         except Exception as e:
             self.logger.error(f"Gate-temporal coherence check error: {str(e)}")
-            return self._create_error_result("COHERENCE_CHECK_ERROR", str(e))
+            return self._create_error_result(ErrorCode.COHERENCE_CHECK_ERROR, str(e))
 
+    @traced
     def check_spatial_gate_coherence(
         self,
         field_coordinates: Dict[str, str],
@@ -98,9 +147,10 @@ class CrossValidatorCoherence:
         target_domain: str
     ) -> CoherenceResult:
         """Validates coherence between spatial coordinates and gate transitions."""
+        if self.overrides.is_overridden("spatial_gate", self.flow_id):
+            return self._overridden_result("spatial_gate")
         try:
-            # Extract domain from coordinates
-            current_domain = field_coordinates.get('longitude', '').split('/')[0]
+            current_domain = self.coordinates.parse_coordinates(field_coordinates).domain_name
             
             # Verify domain transition is valid for gate
             if not self._validate_domain_gate_compatibility(current_domain, target_domain, gate):
@@ -108,7 +158,8 @@ class CrossValidatorCoherence:
                     is_coherent=False,
                     state=CoherenceState.CRITICAL_DRIFT,
                     drift_points=["spatial_gate_misalignment"],
-                    error_code="SPATIAL_GATE_INCOHERENCE",
+                    error_code=ErrorCode.SPATIAL_GATE_INCOHERENCE,
+                    alert_level=AlertLevel.CRITICAL,
                     error_message=f"Gate {gate} incompatible with domain transition {current_domain} -> {target_domain}",
                     timestamp=datetime.utcnow().isoformat() + 'Z'
                 )
@@ -122,8 +173,9 @@ class CrossValidatorCoherence:
 
         except Exception as e:
             self.logger.error(f"Spatial-gate coherence check error: {str(e)}")
-            return self._create_error_result("COHERENCE_CHECK_ERROR", str(e))
+            return self._create_error_result(ErrorCode.COHERENCE_CHECK_ERROR, str(e))
 
+    @traced
     def check_full_field_coherence(
         self,
         prime_sequence: List[int],
@@ -132,27 +184,40 @@ class CrossValidatorCoherence:
         target_domain: str,
         active_gates: List[str]
     ) -> CoherenceResult:
-        """Performs comprehensive field coherence validation."""
+        """Performs comprehensive field coherence validation.
+
+        Sub-checks whose inputs are unchanged since they last passed are
+        skipped; see stats['checks_skipped'].
+        """
         try:
+            index = self.alignment_index(prime_sequence)
+            latitude = field_coordinates.get('latitude', '')
+            longitude = field_coordinates.get('longitude', '')
+            temporal = field_coordinates.get('temporal', '')
+
             # Check all coherence aspects
-            prime_spatial = self.check_prime_spatial_coherence(prime_sequence, field_coordinates)
-            if not prime_spatial.is_coherent:
+            prime_spatial = self._run_unless_unchanged(
+                'prime_spatial',
+                (index, latitude),
+                lambda: self.check_prime_spatial_coherence(index, field_coordinates)
+            )
+            if prime_spatial is not None and not prime_spatial.is_coherent:
                 return prime_spatial
 
-            gate_temporal = self.check_gate_temporal_coherence(
-                gate,
-                field_coordinates.get('temporal', ''),
-                active_gates
+            gate_temporal = self._run_unless_unchanged(
+                'gate_temporal',
+                (gate, temporal, tuple(active_gates[-1:])),
+                lambda: self.check_gate_temporal_coherence(gate, temporal, active_gates)
             )
-            if not gate_temporal.is_coherent:
+            if gate_temporal is not None and not gate_temporal.is_coherent:
                 return gate_temporal
 
-            spatial_gate = self.check_spatial_gate_coherence(
-                field_coordinates,
-                gate,
-                target_domain
+            spatial_gate = self._run_unless_unchanged(
+                'spatial_gate',
+                (longitude, gate, target_domain),
+                lambda: self.check_spatial_gate_coherence(field_coordinates, gate, target_domain)
             )
-            if not spatial_gate.is_coherent:
+            if spatial_gate is not None and not spatial_gate.is_coherent:
                 return spatial_gate
 
             return CoherenceResult(
@@ -164,11 +229,51 @@ class CrossValidatorCoherence:
 
         except Exception as e:
             self.logger.error(f"Full field coherence check error: {str(e)}")
-            return self._create_error_result("COHERENCE_CHECK_ERROR", str(e))
+            return self._create_error_result(ErrorCode.COHERENCE_CHECK_ERROR, str(e))
 
-    def _validate_node_prime_alignment(self, node_id: int, prime_sequence: List[int]) -> bool:
+    def _node_id(self, address: FieldAddress) -> int:
+        """Returns the numeric node id of a parsed address."""
+        if address.node_id is None:
+            raise ValueError(f"Invalid node id: {address.node_token}")
+        return address.node_id
+
+    def _run_unless_unchanged(self, name: str, key: Tuple, check) -> Optional[CoherenceResult]:
+        """Runs a sub-check unless it last passed with the same inputs (then returns None).
+
+        Passes granted by an Observer override are not memoised, so the
+        check runs again once the override is removed or expires.
+        """
+        if self._coherent_inputs.get(name) == key:
+            self.stats['checks_skipped'] += 1
+            return None
+        result = check()
+        self.stats['checks_run'] += 1
+        if result.is_coherent and not (result.details or {}).get('overridden'):
+            self._coherent_inputs[name] = key
+        else:
+            self._coherent_inputs.pop(name, None)
+        return result
+
+    def alignment_index(self, prime_sequence: Union[Sequence[int], PrimeAlignmentIndex]) -> PrimeAlignmentIndex:
+        """Returns the alignment index for a sequence, rebuilding it only when the contents changed."""
+        if isinstance(prime_sequence, PrimeAlignmentIndex):
+            return prime_sequence
+        index = self._alignment_index
+        if index is None or not index.matches(prime_sequence):
+            index = self._alignment_index = PrimeAlignmentIndex(prime_sequence)
+        return index
+
+    def _validate_node_prime_alignment(self, node_id: int, prime_sequence: Sequence[int]) -> bool:
         """Validates if node ID aligns with prime sequence."""
-        return node_id in prime_sequence
+        return node_id in self.alignment_index(prime_sequence)
+
+    def _describe_sequence(self, prime_sequence: Union[Sequence[int], PrimeAlignmentIndex]) -> str:
+        """Short form of a prime sequence for error messages."""
+        if isinstance(prime_sequence, PrimeAlignmentIndex):
+            prime_sequence = prime_sequence.sequence
+        if len(prime_sequence) <= 16:
+            return str(list(prime_sequence))
+        return f"[{prime_sequence[0]}, {prime_sequence[1]}, ..., {prime_sequence[-1]}] ({len(prime_sequence)} primes)"
 
     def _validate_gate_temporal_sequence(self, gate: str, temporal_marker: str, active_gates: List[str]) -> bool:
         """Validates temporal sequence of gate transitions."""
@@ -188,7 +293,17 @@ class CrossValidatorCoherence:
         }
         return target_domain in gate_domain_map.get(gate, {}).get(current_domain, [])
 
-    def _create_error_result(self, code: str, message: str) -> CoherenceResult:
+    def _overridden_result(self, check: str) -> CoherenceResult:
+        """Result for a check skipped because an Observer override is active."""
+        return CoherenceResult(
+            is_coherent=True,
+            state=CoherenceState.COHERENT,
+            drift_points=[],
+            timestamp=datetime.utcnow().isoformat() + 'Z',
+            details={'overridden': check}
+        )
+
+    def _create_error_result(self, code: ErrorCode, message: str) -> CoherenceResult:
         """Creates an error result with given code and message."""
         return CoherenceResult(
             is_coherent=False,
@@ -196,18 +311,24 @@ class CrossValidatorCoherence:
             drift_points=["system_error"],
             error_code=code,
             error_message=message,
+            alert_level=AlertLevel.CRITICAL,
             timestamp=datetime.utcnow().isoformat() + 'Z'
         )
 
-    def update_coherence_history(self, result: CoherenceResult) -> None:
-        """Updates coherence drift history."""
+    def update_coherence_history(self, result: CoherenceResult, flow_id: str = "default") -> Any:
+        """Updates coherence drift history and returns the drift engine's assessment, if any."""
         self.drift_history.append({
             'timestamp': result.timestamp,
             'state': result.state.value,
             'drift_points': result.drift_points,
             'details': result.details
         })
-        self.coherence_state = result.state
+        if self.drift_engine is None:
+            self.coherence_state = result.state
+            return None
+        assessment = self.drift_engine.record(flow_id, result)
+        self.coherence_state = assessment.state
+        return assessment
 
 if __name__ == "__main__":
     # Example usage
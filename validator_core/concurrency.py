@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import functools
+import time
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+class TokenBucket:
+    """Rate limiter refilled at `rate` tokens per second up to `burst`.
+
+    Not locked: callers use it from a single thread or under their own lock.
+    """
+
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = max(burst, 1.0)
+        self.tokens = self.capacity
+        self.updated = clock()
+
+    def allow(self, now: float) -> bool:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+def serialized(method: F) -> F:
+    """Runs a flow method under the flow's re-entrant `lock`.
+
+    Flows are not thread-safe; live steps, Observer commands, migrations and
+    background revalidation of the same flow all go through this lock.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
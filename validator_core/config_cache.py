@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+import hashlib
+import logging
+import marshal
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+from dataclasses import dataclass
+
+_CACHE_SUFFIX = ".cfgcache"
+_CACHE_FORMAT = 1
+
+@dataclass
+class CompiledConfig:
+    content_hash: str
+    config: Dict[str, Any]
+    patterns: Dict[str, Pattern]
+    gate_sequence: List[str]
+    gate_index: Dict[str, int]
+
+# (absolute path, mtime_ns, size) -> (content hash, marshalled compiled payload)
+_memo: Dict[Tuple[str, int, int], Tuple[str, bytes]] = {}
+_memo_lock = threading.Lock()
+_logging_configured = False
+
+def configure_logging() -> None:
+    """Runs logging.basicConfig once per process instead of once per constructor."""
+    global _logging_configured
+    if not _logging_configured:
+        logging.basicConfig(level=logging.INFO)
+        _logging_configured = True
+
+def load_config(config_path: str, cache_dir: Optional[str] = None) -> CompiledConfig:
+    """Loads a validator YAML config through the compiled-config cache.
+
+    The parsed config and its derived rule data are stored next to the YAML
+    (in __pycache__, or $VALIDATOR_CONFIG_CACHE_DIR) keyed by the file's
+    content hash, so PyYAML is only imported when the YAML changed. Each
+    call returns a private copy.
+    """
+    path = os.path.abspath(config_path)
+    stat = os.stat(path)
+    memo_key = (path, stat.st_mtime_ns, stat.st_size)
+
+    cached = _memo.get(memo_key)
+    if cached is None:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        content_hash = hashlib.sha256(raw).hexdigest()
+        cache_path = os.path.join(
+            cache_dir
+            or os.environ.get('VALIDATOR_CONFIG_CACHE_DIR')
+            or os.path.join(os.path.dirname(path), '__pycache__'),
+            f"{os.path.basename(path)}.{content_hash[:16]}{_CACHE_SUFFIX}"
+        )
+        payload = _read_cache(cache_path, content_hash)
+        if payload is None:
+            payload = marshal.dumps(_compile(raw))
+            _write_cache(cache_path, content_hash, payload)
+        cached = (content_hash, payload)
+        with _memo_lock:
+            _memo[memo_key] = cached
+
+    content_hash, payload = cached
+    config, pattern_sources, gate_sequence = marshal.loads(payload)
+    return CompiledConfig(
+        content_hash=content_hash,
+        config=config,
+        patterns={name: re.compile(source) for name, source in pattern_sources.items()},
+        gate_sequence=gate_sequence,
+        gate_index={gate: i for i, gate in enumerate(gate_sequence)}
+    )
+
+def clear_memo() -> None:
+    """Forgets in-process results so the next load re-checks the file."""
+    with _memo_lock:
+        _memo.clear()
+
+def _compile(raw: bytes) -> Tuple[Dict[str, Any], Dict[str, str], List[str]]:
+    import yaml  # only needed on a cache miss
+
+    config = yaml.safe_load(raw) or {}
+    rules = (config.get('field_address_validator') or {}).get('validation_rules') or {}
+    pattern_sources = {
+        name: rule['pattern']
+        for name, rule in rules.items()
+        if isinstance(rule, dict) and 'pattern' in rule
+    }
+    gate_sequence = list((config.get('gate_validator') or {}).get('gate_sequence') or [])
+    return config, pattern_sources, gate_sequence
+
+def _read_cache(cache_path: str, content_hash: str) -> Optional[bytes]:
+    try:
+        with open(cache_path, 'rb') as f:
+            header = marshal.load(f)
+            if header != (_CACHE_FORMAT, marshal.version, content_hash):
+                return None
+            return f.read()
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+def _write_cache(cache_path: str, content_hash: str, payload: bytes) -> None:
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            marshal.dump((_CACHE_FORMAT, marshal.version, content_hash), f)
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logging.getLogger("ConfigCache").debug(f"Config cache not written: {str(e)}")
+        return
+    _prune_stale(cache_path)
+
+def _prune_stale(cache_path: str) -> None:
+    """Deletes caches left by earlier contents of the same config file."""
+    directory, current = os.path.split(cache_path)
+    prefix = current[:-len(_CACHE_SUFFIX)].rsplit('.', 1)[0] + '.'
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+    for name in names:
+        digest = name[len(prefix):-len(_CACHE_SUFFIX)]
+        if (name != current and name.startswith(prefix) and name.endswith(_CACHE_SUFFIX)
+                and len(digest) == 16 and all(c in '0123456789abcdef' for c in digest)):
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass  # another process pruned it first
+
+if __name__ == "__main__":
+    # Cold-start measurement: import + construct in fresh interpreters,
+    # first with an empty cache directory, then with the cache populated.
+    import subprocess
+    import sys
+    import tempfile
+
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    config_path = os.path.join(package_root, "validator_core", "validator_config.yaml")
+    env = dict(os.environ, VALIDATOR_CONFIG_CACHE_DIR=tempfile.mkdtemp())
+    probe = (
+        "import time; t = time.perf_counter()\n"
+        "from validator_core.validation_flow import ValidationFlowPipeline\n"
+        f"ValidationFlowPipeline({config_path!r})\n"
+        "import sys; print(f\"{(time.perf_counter() - t) * 1000:.1f}ms yaml_imported={'yaml' in sys.modules}\")\n"
+    )
+    for label in ("cold cache", "warm cache"):
+        out = subprocess.run(
+            [sys.executable, "-c", probe],
+            cwd=package_root, env=env, capture_output=True, text=True
+        ).stdout.strip()
+        print(f"{label}: import + construct {out}")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Pattern, Tuple
+from enum import Enum
+
+class Domain(Enum):
+    OBI_WAN = "OBI-WAN"
+    BERJAK = "BERJAK"
+    INFINITY = "INFINITY"
+
+_DOMAINS = {domain.value: domain for domain in Domain}
+
+class FieldAddress:
+    """Parsed spatial part of a field address (latitude + longitude).
+
+    Instances are interned by CoordinateCache, so identical coordinate
+    strings share one record; the pattern verdict is memoised on it per
+    config hash.
+    """
+
+    __slots__ = (
+        'latitude', 'longitude', 'node_name', 'node_token', 'node_id',
+        'domain_name', 'domain', 'subdomain',
+        'verdict'
+    )
+
+    def __init__(self, latitude: str, longitude: str):
+        self.latitude = latitude
+        self.longitude = longitude
+
+        lat_parts = latitude.split('/') if latitude else []
+        self.node_name = sys.intern(lat_parts[1]) if len(lat_parts) > 2 else ""
+        self.node_token = sys.intern(lat_parts[-1]) if lat_parts else ""
+        self.node_id: Optional[int] = (
+            int(self.node_token) if self.node_token.isascii() and self.node_token.isdigit() else None
+        )
+
+        long_parts = longitude.split('/', 1)
+        self.domain_name = sys.intern(long_parts[0])
+        self.domain: Optional[Domain] = _DOMAINS.get(self.domain_name)
+        self.subdomain = sys.intern(long_parts[1]) if len(long_parts) > 1 else ""
+
+        # (verdict_key, latitude_valid, longitude_valid), swapped as one
+        # reference so threads on other configs never see a mixed verdict
+        self.verdict: Tuple[Optional[str], bool, bool] = (None, False, False)
+
+    def spatial_verdict(self, verdict_key: str, patterns: Dict[str, Pattern]) -> Tuple[bool, bool]:
+        """Returns (latitude_valid, longitude_valid), matching only on first use per config."""
+        verdict = self.verdict
+        if verdict[0] != verdict_key:
+            verdict = (
+                verdict_key,
+                bool(patterns['latitude'].match(self.latitude)),
+                bool(patterns['longitude'].match(self.longitude))
+            )
+            self.verdict = verdict
+        return verdict[1], verdict[2]
+
+    def __repr__(self) -> str:
+        return (
+            f"FieldAddress(node_name={self.node_name!r}, node_id={self.node_id!r}, "
+            f"domain={self.domain_name!r}, subdomain={self.subdomain!r})"
+        )
+
+class CoordinateCache:
+    """Bounded LRU of interned FieldAddress records keyed by the raw coordinate strings."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        self._entries: "OrderedDict[Tuple[str, str], FieldAddress]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, latitude: str, longitude: str) -> FieldAddress:
+        """Returns the shared record for a latitude/longitude pair, parsing it at most once."""
+        key = (latitude, longitude)
+        address = self._entries.get(key)
+        if address is not None:
+            self.stats['hits'] += 1
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                pass
+            return address
+
+        address = FieldAddress(latitude, longitude)
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                return existing
+            self._entries[key] = address
+            self.stats['misses'] += 1
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+        return address
+
+    def parse_coordinates(self, field_coordinates: Dict[str, str]) -> FieldAddress:
+        """parse() for a coordinates mapping as carried in flow contexts."""
+        return self.parse(field_coordinates.get('latitude', ''), field_coordinates.get('longitude', ''))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+_default_cache = CoordinateCache()
+
+def get_coordinate_cache() -> CoordinateCache:
+    """Returns the process-wide coordinate cache shared by validators and coherence checks."""
+    return _default_cache
+
+if __name__ == "__main__":
+    # Example usage
+    cache = get_coordinate_cache()
+    first = cache.parse("FIELD/node-1/003", "OBI-WAN/personal")
+    second = cache.parse("FIELD/node-1/003", "OBI-WAN/personal")
+    print(f"Parsed: {first} shared={first is second}")
+    print(f"Cache stats: {cache.stats}")
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+from dataclasses import dataclass
+from .coherence_check import CoherenceResult, CoherenceState
+
+_STATE_RANK = {
+    CoherenceState.COHERENT: 0,
+    CoherenceState.PARTIAL_DRIFT: 1,
+    CoherenceState.CRITICAL_DRIFT: 2,
+    CoherenceState.QUARANTINED: 3,
+}
+
+FLOW_TOTAL = "*"
+
+@dataclass
+class DriftThresholds:
+    window_seconds: float = 60.0
+    bucket_seconds: float = 1.0
+    partial_drift_count: int = 1
+    critical_drift_count: int = 5
+    quarantine_count: int = 20
+    max_flows: int = 10000
+
+@dataclass
+class DriftAssessment:
+    flow_id: str
+    state: CoherenceState
+    previous_state: CoherenceState
+    window_count: int
+    window_rate: float
+
+    @property
+    def escalated(self) -> bool:
+        return _STATE_RANK[self.state] > _STATE_RANK[self.previous_state]
+
+class _SlidingWindow:
+    """Ring of per-bucket counts with a running total; updates are amortised O(1)."""
+
+    __slots__ = ('counts', 'total', 'head')
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * buckets
+        self.total = 0
+        self.head = -1
+
+    def _advance(self, bucket: int) -> None:
+        size = len(self.counts)
+        if bucket <= self.head:
+            return
+        if self.head < 0 or bucket - self.head >= size:
+            for i in range(size):
+                self.counts[i] = 0
+            self.total = 0
+        else:
+            for b in range(self.head + 1, bucket + 1):
+                i = b % size
+                self.total -= self.counts[i]
+                self.counts[i] = 0
+        self.head = bucket
+
+    def add(self, bucket: int, amount: int = 1) -> None:
+        self._advance(bucket)
+        self.counts[bucket % len(self.counts)] += amount
+        self.total += amount
+
+    def count(self, bucket: int) -> int:
+        self._advance(bucket)
+        return self.total
+
+class _FlowDrift:
+    __slots__ = ('windows', 'state')
+
+    def __init__(self):
+        self.windows: Dict[str, _SlidingWindow] = {}
+        self.state = CoherenceState.COHERENT
+
+class DriftDetectionEngine:
+    """Streaming drift statistics per flow and per drift type in bounded memory.
+
+    Each flow keeps one fixed-size bucket ring per drift type plus one for
+    its total; the least recently seen flows are evicted past max_flows.
+    One engine is normally shared by every flow in the process (see
+    get_drift_engine), so all methods are thread-safe.
+    """
+
+    def __init__(self, thresholds: Optional[DriftThresholds] = None, clock: Callable[[], float] = time.monotonic):
+        self.thresholds = thresholds or DriftThresholds()
+        self.clock = clock
+        self.buckets = max(1, int(round(self.thresholds.window_seconds / self.thresholds.bucket_seconds)))
+        self.flows: "OrderedDict[str, _FlowDrift]" = OrderedDict()
+        self.drift_types: Dict[str, _SlidingWindow] = {}
+        self.stats = {'recorded': 0, 'escalations': 0, 'quarantines': 0, 'evicted_flows': 0}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger("DriftDetectionEngine")
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], clock: Callable[[], float] = time.monotonic) -> "DriftDetectionEngine":
+        """Reads thresholds from the sonar_integration drift_detection feature, if present."""
+        settings = _drift_settings(config)
+        defaults = DriftThresholds()
+        thresholds = DriftThresholds(**{
+            name: settings.get(name, getattr(defaults, name))
+            for name in defaults.__dataclass_fields__
+        })
+        return cls(thresholds, clock)
+
+    def record(self, flow_id: str, result: CoherenceResult) -> DriftAssessment:
+        """Folds one coherence result into the windows and returns the flow's drift state."""
+        with self._lock:
+            bucket = self._bucket()
+            flow = self._flow(flow_id)
+            previous = flow.state
+            self.stats['recorded'] += 1
+
+            total = flow.windows.get(FLOW_TOTAL)
+            if total is None:
+                total = flow.windows[FLOW_TOTAL] = _SlidingWindow(self.buckets)
+            if result.drift_points:
+                total.add(bucket, len(result.drift_points))
+                for drift_type in result.drift_points:
+                    window = flow.windows.get(drift_type)
+                    if window is None:
+                        window = flow.windows[drift_type] = _SlidingWindow(self.buckets)
+                    window.add(bucket)
+                    global_window = self.drift_types.get(drift_type)
+                    if global_window is None:
+                        global_window = self.drift_types[drift_type] = _SlidingWindow(self.buckets)
+                    global_window.add(bucket)
+
+            count = total.count(bucket)
+            flow.state = self._classify(flow.state, result.state, count)
+            assessment = DriftAssessment(
+                flow_id=flow_id,
+                state=flow.state,
+                previous_state=previous,
+                window_count=count,
+                window_rate=count / self.thresholds.window_seconds
+            )
+            if assessment.escalated:
+                self.stats['escalations'] += 1
+                if flow.state == CoherenceState.QUARANTINED:
+                    self.stats['quarantines'] += 1
+                self.logger.warning(
+                    f"Drift escalation: flow {flow_id} {previous.value} -> {flow.state.value} "
+                    f"({count} drift points in {self.thresholds.window_seconds:g}s)"
+                )
+        return assessment
+
+    def release(self, flow_id: str) -> None:
+        """Clears a flow's sticky quarantine so its state follows the windows again."""
+        with self._lock:
+            flow = self.flows.get(flow_id)
+            if flow is not None:
+                flow.state = CoherenceState.COHERENT
+
+    def export_flow(self, flow_id: str) -> Optional[Dict[str, Any]]:
+        """A flow's drift state with window counts by bucket age, newest first, for migration."""
+        with self._lock:
+            flow = self.flows.get(flow_id)
+            if flow is None:
+                return None
+            bucket = self._bucket()
+            windows = {}
+            for drift_type, window in flow.windows.items():
+                window._advance(bucket)
+                size = len(window.counts)
+                windows[drift_type] = [window.counts[(bucket - age) % size] for age in range(size)]
+            return {'state': flow.state.value, 'windows': windows}
+
+    def import_flow(self, flow_id: str, record: Dict[str, Any]) -> None:
+        """Replaces a flow's drift state with one from export_flow(), aged from now."""
+        with self._lock:
+            bucket = self._bucket()
+            flow = self._flow(flow_id)
+            flow.state = CoherenceState(record['state'])
+            flow.windows = {}
+            for drift_type, counts in record['windows'].items():
+                window = flow.windows[drift_type] = _SlidingWindow(self.buckets)
+                window._advance(bucket)
+                for age, count in enumerate(counts[:self.buckets]):
+                    if count:
+                        window.add(bucket - age, count)
+
+    def window_counts(self, flow_id: str) -> Dict[str, int]:
+        """Returns the current window count per drift type for a flow."""
+        with self._lock:
+            flow = self.flows.get(flow_id)
+            if flow is None:
+                return {}
+            bucket = self._bucket()
+            return {drift_type: window.count(bucket) for drift_type, window in flow.windows.items()}
+
+    def drift_type_rates(self) -> Dict[str, float]:
+        """Returns the fleet-wide rate per second of each drift type over the window."""
+        with self._lock:
+            bucket = self._bucket()
+            return {
+                drift_type: window.count(bucket) / self.thresholds.window_seconds
+                for drift_type, window in self.drift_types.items()
+            }
+
+    def _classify(self, current: CoherenceState, observed: CoherenceState, count: int) -> CoherenceState:
+        if current == CoherenceState.QUARANTINED:
+            return current
+        t = self.thresholds
+        if count >= t.quarantine_count or observed == CoherenceState.QUARANTINED:
+            return CoherenceState.QUARANTINED
+        if count >= t.critical_drift_count:
+            state = CoherenceState.CRITICAL_DRIFT
+        elif count >= t.partial_drift_count:
+            state = CoherenceState.PARTIAL_DRIFT
+        else:
+            state = CoherenceState.COHERENT
+        return max(state, observed, key=_STATE_RANK.__getitem__)
+
+    def _flow(self, flow_id: str) -> _FlowDrift:
+        flow = self.flows.get(flow_id)
+        if flow is None:
+            flow = self.flows[flow_id] = _FlowDrift()
+            if len(self.flows) > self.thresholds.max_flows:
+                self.flows.popitem(last=False)
+                self.stats['evicted_flows'] += 1
+        else:
+            self.flows.move_to_end(flow_id)
+        return flow
+
+    def _bucket(self) -> int:
+        return int(self.clock() / self.thresholds.bucket_seconds)
+
+def _drift_settings(config: Dict[str, Any]) -> Dict[str, Any]:
+    features = ((config or {}).get('sonar_integration', {}) or {}).get('features') or []
+    return next((f for f in features if f.get('type') == 'drift_detection'), {})
+
+_shared_engines: Dict[str, DriftDetectionEngine] = {}
+_shared_lock = threading.Lock()
+
+def get_drift_engine(config: Dict[str, Any]) -> DriftDetectionEngine:
+    """Returns the process-wide drift engine for the configured thresholds."""
+    key = repr(_drift_settings(config))
+    with _shared_lock:
+        if key not in _shared_engines:
+            _shared_engines[key] = DriftDetectionEngine.from_config(config)
+        return _shared_engines[key]
+
+if __name__ == "__main__":
+    # Example usage
+    engine = DriftDetectionEngine(DriftThresholds(window_seconds=10, critical_drift_count=3, quarantine_count=6))
+    drift = CoherenceResult(
+        is_coherent=False,
+        state=CoherenceState.PARTIAL_DRIFT,
+        drift_points=["gate_temporal_misalignment"]
+    )
+    for _ in range(100000):
+        assessment = engine.record("flow-1", drift)
+    print(f"Final assessment: {assessment}")
+    print(f"Window counts: {engine.window_counts('flow-1')}")
+    print(f"Engine stats: {engine.stats}")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+from enum import IntEnum
+from typing import Dict
+
+
+class _CompactEnum(IntEnum):
+    """Small-int enum that prints by name and parses its legacy string form."""
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.name, format_spec)
+
+    @property
+    def label(self) -> str:
+        """Legacy lowercase string form (e.g. "critical")."""
+        return self.name.lower()
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return cls.__members__.get(value.strip().upper().replace('-', '_'))
+        return None
+
+class AlertLevel(_CompactEnum):
+    NORMAL = 0
+    HIGH = 1
+    CRITICAL = 2
+
+class ErrorCode(_CompactEnum):
+    # Values are stored in columnar buffers and snapshots; never renumber.
+    NONE = 0
+    VALIDATION_ERROR = 1
+    INVALID_PRIME_PROGRESSION = 2
+    NON_PRIME_DETECTED = 3
+    INVALID_FIELD_COORDINATE = 4
+    INVALID_DOMAIN_ALIGNMENT = 5
+    INVALID_TEMPORAL_MARKER = 6
+    INVALID_GATE = 7
+    INCOMPATIBLE_DOMAINS = 8
+    INVALID_GATE_SEQUENCE = 9
+    FLOW_INIT_ERROR = 10
+    INVALID_FLOW_STATE = 11
+    GATE_TRANSITION_ERROR = 12
+    COORDINATE_UPDATE_ERROR = 13
+    PRIME_SPATIAL_INCOHERENCE = 14
+    GATE_TEMPORAL_INCOHERENCE = 15
+    SPATIAL_GATE_INCOHERENCE = 16
+    COHERENCE_CHECK_ERROR = 17
+    SHED = 18
+
+    @property
+    def default_level(self) -> AlertLevel:
+        """Alert level this code is raised with unless the caller overrides it."""
+        return _DEFAULT_LEVELS.get(self, AlertLevel.CRITICAL)
+
+_DEFAULT_LEVELS: Dict[ErrorCode, AlertLevel] = {
+    ErrorCode.NONE: AlertLevel.NORMAL,
+    ErrorCode.INVALID_DOMAIN_ALIGNMENT: AlertLevel.HIGH,
+    ErrorCode.INCOMPATIBLE_DOMAINS: AlertLevel.HIGH,
+    ErrorCode.GATE_TEMPORAL_INCOHERENCE: AlertLevel.HIGH,
+    ErrorCode.SHED: AlertLevel.NORMAL,
+}
+
+if __name__ == "__main__":
+    # Example usage
+    print(f"Parsed level: {AlertLevel('critical')!r}")
+    print(f"Severity routing: {AlertLevel.HIGH >= AlertLevel('high')}")
+    for code in ErrorCode:
+        print(f"{int(code):>3} {code:<28} {code.default_level.label}")
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+
+import logging
+import marshal
+import mmap
+import os
+import struct
+import threading
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Header: magic, format version, marshal version, index offset, index length.
+# The index pointer is rewritten in place only after the records and index
+# it points at have been flushed, so a crash mid-checkpoint leaves the
+# previous checkpoint readable.
+_MAGIC = b"VCKP"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHHQQ")
+
+def _capture(flow: Any) -> Tuple:
+    """Copies a flow context into an immutable record without locking the flow."""
+    ctx = flow.flow_context
+    return (
+        ctx.state.value,
+        ctx.current_domain,
+        tuple(ctx.active_gates),
+        tuple(ctx.prime_sequence),
+        dict(ctx.field_coordinates),
+        ctx.timestamp,
+        getattr(ctx, 'coherence_state', None),
+        getattr(flow, 'revision', 0)
+    )
+
+def restore_flow(flow: Any, record: Dict[str, Any]) -> None:
+    """Applies a materialized checkpoint record to a flow's context."""
+    ctx = flow.flow_context
+    ctx.state = type(ctx.state)(record['state'])
+    ctx.current_domain = record['current_domain']
+    ctx.active_gates = list(record['active_gates'])
+    ctx.prime_sequence = list(record['prime_sequence'])
+    ctx.field_coordinates = dict(record['field_coordinates'])
+    ctx.timestamp = record['timestamp']
+    if record['coherence_state'] is not None and hasattr(ctx, 'coherence_state'):
+        ctx.coherence_state = record['coherence_state']
+    if hasattr(flow, 'revision'):
+        flow.revision = record['revision']
+    if hasattr(flow, 'result_columns'):
+        # Checkpoints carry no history: start a fresh one so entries and columns stay aligned
+        ctx.validation_history.clear()
+        flow.result_columns.clear()
+
+_RECORD_FIELDS = (
+    'state', 'current_domain', 'active_gates', 'prime_sequence',
+    'field_coordinates', 'timestamp', 'coherence_state', 'revision'
+)
+
+class FlowCheckpointReader:
+    """Memory-mapped view of a checkpoint file; records are decoded on first access."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, marshal_version, index_offset, index_length = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION or marshal_version != marshal.version:
+            self.close()
+            raise ValueError(f"Unsupported checkpoint file: {path}")
+        self.index_length = index_length
+        self.index: Dict[str, Tuple[int, int]] = (
+            marshal.loads(self._mmap[index_offset:index_offset + index_length]) if index_length else {}
+        )
+        self._materialized: Dict[str, Dict[str, Any]] = {}
+
+    def __contains__(self, flow_id: str) -> bool:
+        return flow_id in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def flow_ids(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def load(self, flow_id: str) -> Optional[Dict[str, Any]]:
+        """Returns the checkpointed context for a flow, decoding it on first access."""
+        record = self._materialized.get(flow_id)
+        if record is None:
+            location = self.index.get(flow_id)
+            if location is None:
+                return None
+            offset, length = location
+            record = dict(zip(_RECORD_FIELDS, marshal.loads(self._mmap[offset:offset + length])))
+            self._materialized[flow_id] = record
+        return record
+
+    def restore(self, flow_id: str, flow: Any) -> bool:
+        """Restores one flow from the checkpoint. Returns False if it was not checkpointed."""
+        record = self.load(flow_id)
+        if record is None:
+            return False
+        restore_flow(flow, record)
+        return True
+
+    def raw_record(self, flow_id: str) -> bytes:
+        offset, length = self.index[flow_id]
+        return self._mmap[offset:offset + length]
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+class FlowCheckpointStore:
+    """Periodic incremental snapshots of tracked flow contexts to one local binary file.
+
+    Only flows whose revision or state changed since the last checkpoint are
+    written; superseded records are reclaimed by compaction once they
+    outweigh the live data.
+    """
+
+    def __init__(self, path: str, compact_ratio: float = 1.0):
+        self.path = path
+        self.compact_ratio = compact_ratio
+        self.stats = {'checkpoints': 0, 'records_written': 0, 'compactions': 0}
+
+        self._flows: Dict[str, Any] = {}
+        self._written: Dict[str, Tuple[int, Any]] = {}
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._live_bytes = 0
+        self._garbage_bytes = 0
+        self._last_index_length = 0
+        self._index_dirty = False
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.logger = logging.getLogger("FlowCheckpointStore")
+
+        if os.path.exists(path):
+            try:
+                reader = FlowCheckpointReader(path)
+                self._index = dict(reader.index)
+                self._live_bytes = sum(length for _, length in self._index.values())
+                self._last_index_length = reader.index_length
+                self._garbage_bytes = os.path.getsize(path) - _HEADER.size - self._live_bytes - reader.index_length
+                reader.close()
+            except (ValueError, OSError, EOFError) as e:
+                self.logger.warning(f"Discarding unreadable checkpoint {path}: {str(e)}")
+                self._index = {}
+
+    def track(self, flow_id: str, flow: Any) -> None:
+        """Includes a flow in future checkpoints."""
+        self._flows[flow_id] = flow
+
+    def untrack(self, flow_id: str) -> None:
+        """Stops checkpointing a flow and drops it from the file at the next checkpoint."""
+        self._flows.pop(flow_id, None)
+        self._written.pop(flow_id, None)
+        location = self._index.pop(flow_id, None)
+        if location is not None:
+            self._live_bytes -= location[1]
+            self._garbage_bytes += location[1]
+            self._index_dirty = True
+
+    def checkpoint(self) -> int:
+        """Writes every dirty tracked flow. Returns the number of records written."""
+        with self._lock:
+            dirty = []
+            for flow_id, flow in list(self._flows.items()):
+                key = (getattr(flow, 'revision', 0), flow.flow_context.state)
+                if self._written.get(flow_id) == key and flow_id in self._index:
+                    continue
+                dirty.append((flow_id, key, marshal.dumps(_capture(flow))))
+            if not dirty and not self._index_dirty:
+                return 0
+
+            if not os.path.exists(self.path) or self._garbage_bytes > self.compact_ratio * max(self._live_bytes, 1):
+                self._rewrite(dirty)
+            else:
+                self._append(dirty)
+
+            for flow_id, key, _ in dirty:
+                self._written[flow_id] = key
+            self._index_dirty = False
+            self.stats['checkpoints'] += 1
+            self.stats['records_written'] += len(dirty)
+            return len(dirty)
+
+    def start(self, interval: float = 5.0) -> None:
+        """Checkpoints in a background thread every `interval` seconds."""
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, args=(interval,), name="FlowCheckpoint", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread after a final checkpoint."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.checkpoint()
+
+    def _run(self, interval: float) -> None:
+        while not self._stopping.wait(interval):
+            try:
+                self.checkpoint()
+            except Exception as e:
+                self.logger.error(f"Checkpoint error: {str(e)}")
+
+    def _append(self, dirty) -> None:
+        with open(self.path, 'r+b') as f:
+            f.seek(0, os.SEEK_END)
+            offset = f.tell()
+            for flow_id, _, payload in dirty:
+                previous = self._index.get(flow_id)
+                if previous is not None:
+                    self._live_bytes -= previous[1]
+                    self._garbage_bytes += previous[1]
+                self._index[flow_id] = (offset, len(payload))
+                self._live_bytes += len(payload)
+                f.write(payload)
+                offset += len(payload)
+            index_payload = marshal.dumps(self._index)
+            f.write(index_payload)
+            f.flush()
+            os.fsync(f.fileno())
+            self._write_header(f, offset, len(index_payload))
+        self._garbage_bytes += self._last_index_length
+        self._last_index_length = len(index_payload)
+
+    def _rewrite(self, dirty) -> None:
+        fresh = {flow_id: payload for flow_id, _, payload in dirty}
+        reader = None
+        if os.path.exists(self.path) and self._index:
+            reader = FlowCheckpointReader(self.path)
+        tmp_path = self.path + ".tmp"
+        index: Dict[str, Tuple[int, int]] = {}
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, marshal.version, 0, 0))
+                offset = _HEADER.size
+                for flow_id in set(self._index) | set(fresh):
+                    payload = fresh.get(flow_id)
+                    if payload is None:
+                        if reader is None:
+                            continue
+                        payload = reader.raw_record(flow_id)
+                    index[flow_id] = (offset, len(payload))
+                    f.write(payload)
+                    offset += len(payload)
+                index_payload = marshal.dumps(index)
+                f.write(index_payload)
+                f.flush()
+                os.fsync(f.fileno())
+                self._write_header(f, offset, len(index_payload))
+        finally:
+            if reader is not None:
+                reader.close()
+        os.replace(tmp_path, self.path)
+        self._index = index
+        self._live_bytes = sum(length for _, length in index.values())
+        self._garbage_bytes = 0
+        self._last_index_length = len(index_payload)
+        self.stats['compactions'] += 1
+
+    @staticmethod
+    def _write_header(f, index_offset: int, index_length: int) -> None:
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, marshal.version, index_offset, index_length))
+        f.flush()
+        os.fsync(f.fileno())
+
+if __name__ == "__main__":
+    # Example usage
+    import tempfile
+    import time
+    from .flow_controller import ValidationFlowController
+
+    path = os.path.join(tempfile.mkdtemp(), "flows.ckpt")
+    store = FlowCheckpointStore(path)
+    template = ValidationFlowController("validator_config.yaml")
+    template.begin_validation_flow({
+        'domain': 'OBI-WAN',
+        'prime_sequence': [2, 3, 5, 7, 11],
+        'coordinates': {
+            'latitude': 'FIELD/node-1/003',
+            'longitude': 'OBI-WAN/personal',
+            'temporal': '20250612091630Z'
+        }
+    })
+    for i in range(100000):
+        store.track(f"flow-{i}", template)
+    started = time.perf_counter()
+    store.checkpoint()
+    print(f"Checkpointed 100k flows in {time.perf_counter() - started:.2f}s ({os.path.getsize(path)} bytes)")
+
+    started = time.perf_counter()
+    reader = FlowCheckpointReader(path)
+    print(f"Opened checkpoint of {len(reader)} flows in {time.perf_counter() - started:.3f}s")
+    print(f"Flow 99999: {reader.load('flow-99999')}")
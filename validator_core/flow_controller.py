@@ -1,12 +1,24 @@
 #!/usr/bin/env python3
 
-import yaml
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from .validator import FieldValidator, ValidationResult
+from .admission_control import get_admission_controller
+from .error_codes import AlertLevel, ErrorCode
+from .result_columns import ResultColumns
+from .config_cache import configure_logging
+from .flow_replay import FlowReplayLog
+from .memory_accounting import flow_memory
+from .watch_points import WatchPointScheduler, PRIME_STATE, FIELD_COORDINATES, GATE_TRANSITIONS
+from .tracing import traced
+from .concurrency import serialized
+
+FIELD_COMPONENTS = ('latitude', 'longitude', 'temporal')
 
 class FlowState(Enum):
     INITIALIZING = "initializing"
@@ -23,11 +35,13 @@ class FlowContext:
     prime_sequence: List[int]
     field_coordinates: Dict[str, str]
     timestamp: str
-    validation_history: List[Dict[str, Any]]
+    validation_history: Deque[Dict[str, Any]]
 
 class ValidationFlowController:
-    def __init__(self, config_path: str):
-        self.validator = FieldValidator(config_path)
+    def __init__(self, config_path: str, flow_id: str = "default"):
+        self.flow_id = flow_id
+        self.validator = FieldValidator(config_path, flow_id)
+        history_settings = self.validator.config.get('flow_history') or {}
         self.flow_context = FlowContext(
             state=FlowState.INITIALIZING,
             current_domain="",
@@ -35,19 +49,39 @@ class ValidationFlowController:
             prime_sequence=[],
             field_coordinates={},
             timestamp=datetime.utcnow().isoformat() + 'Z',
-            validation_history=[]
+            validation_history=deque(maxlen=history_settings.get('max_entries'))
         )
+        self.result_columns = ResultColumns()
+        self.retain_results = history_settings.get('retain_results', 256)
+        self.revision = 0
+        self.validated_coordinates: Dict[str, str] = {}
+        self.coordinate_stats = {
+            'updates': 0,
+            'unchanged_updates': 0,
+            'components_validated': 0,
+            'components_skipped': 0
+        }
+        self.watch_scheduler = WatchPointScheduler.from_config(self.validator.config)
+        self.watch_versions = {PRIME_STATE: 0, FIELD_COORDINATES: 0, GATE_TRANSITIONS: 0}
+        self.quarantine_scheduler = None  # set by QuarantineScheduler.track()
+        self.lock = threading.RLock()  # serializes steps with background revalidation and migration
+        self.quarantine_step: Optional[Tuple[str, Tuple[Any, ...]]] = None  # step that last quarantined the flow
+        self.admission = get_admission_controller(self.validator.config)
+        self.replay_log = FlowReplayLog.from_config(self.validator.config)
         
-        logging.basicConfig(level=logging.INFO)
+        configure_logging()
         self.logger = logging.getLogger("ValidationFlowController")
 
+    @traced
+    @serialized
     def begin_validation_flow(self, initial_context: Dict[str, Any]) -> ValidationResult:
         """Initiates a new validation flow with given context."""
         try:
             # Update flow context
             self.flow_context.current_domain = initial_context.get('domain', '')
-            self.flow_context.prime_sequence = initial_context.get('prime_sequence', [])
+            self.flow_context.prime_sequence = list(initial_context.get('prime_sequence', []))  # owned copy, not the caller's list
             self.flow_context.field_coordinates = initial_context.get('coordinates', {})
+            self.revision += 1  # context replaced without a history entry; marks checkpoints dirty
             
             # Validate initial state
             result = self._validate_initial_state()
@@ -56,28 +90,43 @@ class ValidationFlowController:
                 return result
 
             self.flow_context.state = FlowState.ACTIVE
-            return ValidationResult(is_valid=True, timestamp=datetime.utcnow().isoformat() + 'Z')
+            self.validated_coordinates = dict(self.flow_context.field_coordinates)
+            result = ValidationResult(is_valid=True, timestamp=datetime.utcnow().isoformat() + 'Z')
+            if self.replay_log is not None:
+                self.replay_log.record(self, "flow_initialized", result)
+            self._publish_watch(PRIME_STATE, result, changed=True)
+            self._publish_watch(FIELD_COORDINATES, result, changed=True)
+            return result
 
         except Exception as e:
             self.logger.error(f"Flow initialization error: {str(e)}")
             self.flow_context.state = FlowState.ERROR
             return ValidationResult(
                 is_valid=False,
-                error_code="FLOW_INIT_ERROR",
+                error_code=ErrorCode.FLOW_INIT_ERROR,
                 error_message=str(e),
-                alert_level="critical",
+                alert_level=AlertLevel.CRITICAL,
                 timestamp=datetime.utcnow().isoformat() + 'Z'
             )
 
-    def process_gate_transition(self, gate: str, target_domain: str) -> ValidationResult:
-        """Processes and validates a gate transition in the flow."""
+    @traced
+    @serialized
+    def process_gate_transition(self, gate: str, target_domain: str, deadline: Optional[float] = None) -> ValidationResult:
+        """Processes and validates a gate transition in the flow.
+
+        Returns an ErrorCode.SHED result without touching the flow if
+        admission control sheds the transition.
+        """
+        admission = self.admission
+        if admission is not None and not admission.acquire(admission.priority_for("gate_transition"), deadline):
+            return admission.shed_result("gate_transition")
         try:
             if self.flow_context.state != FlowState.ACTIVE:
                 return ValidationResult(
                     is_valid=False,
-                    error_code="INVALID_FLOW_STATE",
+                    error_code=ErrorCode.INVALID_FLOW_STATE,
                     error_message=f"Flow not active. Current state: {self.flow_context.state}",
-                    alert_level="critical",
+                    alert_level=AlertLevel.CRITICAL,
                     timestamp=datetime.utcnow().isoformat() + 'Z'
                 )
 
@@ -94,47 +143,124 @@ class ValidationFlowController:
                 self.flow_context.current_domain = target_domain
                 self._update_validation_history(result)
             else:
-                self._handle_validation_failure(result)
+                self._handle_validation_failure(result, ("gate_transition", (gate, target_domain)))
 
+            self._publish_watch(GATE_TRANSITIONS, result, changed=result.is_valid)
             return result
 
         except Exception as e:
             self.logger.error(f"Gate transition error: {str(e)}")
             return ValidationResult(
                 is_valid=False,
-                error_code="GATE_TRANSITION_ERROR",
+                error_code=ErrorCode.GATE_TRANSITION_ERROR,
                 error_message=str(e),
-                alert_level="critical",
+                alert_level=AlertLevel.CRITICAL,
                 timestamp=datetime.utcnow().isoformat() + 'Z'
             )
 
+        finally:
+            if admission is not None:
+                admission.release()
+
+    @traced
+    @serialized
     def update_field_coordinates(self, new_coordinates: Dict[str, str]) -> ValidationResult:
-        """Updates and validates new field coordinates."""
+        """Updates and validates new field coordinates.
+
+        Only components that differ from the last validated coordinates are
+        re-validated; skipped work is counted in coordinate_stats.
+        """
         try:
-            result = self.validator.validate_field_address(
-                new_coordinates.get('latitude', ''),
-                new_coordinates.get('longitude', ''),
-                new_coordinates.get('temporal', datetime.utcnow().isoformat() + 'Z')
-            )
+            new_coordinates = dict(new_coordinates)
+            if 'temporal' not in new_coordinates:
+                new_coordinates['temporal'] = datetime.utcnow().strftime('%Y%m%d%H%M%SZ')
+            changed_components = [
+                name for name in FIELD_COMPONENTS
+                if new_coordinates.get(name, '') != self.validated_coordinates.get(name, '')
+            ]
+            self.coordinate_stats['updates'] += 1
+            self.coordinate_stats['components_validated'] += len(changed_components)
+            self.coordinate_stats['components_skipped'] += len(FIELD_COMPONENTS) - len(changed_components)
+
+            if not changed_components:
+                self.coordinate_stats['unchanged_updates'] += 1
+                result = ValidationResult(is_valid=True, timestamp=datetime.utcnow().isoformat() + 'Z')
+            else:
+                result = self.validator.validate_field_address(
+                    new_coordinates.get('latitude', ''),
+                    new_coordinates.get('longitude', ''),
+                    new_coordinates['temporal'],
+                    components=changed_components
+                )
 
+            changed = result.is_valid and new_coordinates != self.flow_context.field_coordinates
             if result.is_valid:
                 self.flow_context.field_coordinates = new_coordinates
+                if not (result.details or {}).get('overridden'):
+                    # An override-granted pass must be re-checked once the override goes
+                    self.validated_coordinates = new_coordinates
                 self._update_validation_history(result)
             else:
-                self._handle_validation_failure(result)
+                self._handle_validation_failure(result, ("field_address", (new_coordinates,)))
 
+            self._publish_watch(FIELD_COORDINATES, result, changed=changed)
             return result
 
         except Exception as e:
             self.logger.error(f"Coordinate update error: {str(e)}")
             return ValidationResult(
                 is_valid=False,
-                error_code="COORDINATE_UPDATE_ERROR",
+                error_code=ErrorCode.COORDINATE_UPDATE_ERROR,
                 error_message=str(e),
-                alert_level="critical",
+                alert_level=AlertLevel.CRITICAL,
                 timestamp=datetime.utcnow().isoformat() + 'Z'
             )
 
+    @traced
+    @serialized
+    def revalidate(self) -> bool:
+        """Re-validates the committed flow state; a quarantined flow that passes becomes ACTIVE again.
+
+        The gate transition or coordinate update that quarantined the flow is
+        retried as well and applied if it now passes. Runs under the flow
+        lock, so it never interleaves with live steps.
+        """
+        if self.flow_context.state != FlowState.QUARANTINED:
+            return True  # left quarantine while this call waited for the lock
+        step = self.quarantine_step
+        result = self._validate_initial_state()
+        if result.is_valid and step is not None:
+            result = self._retry_step(*step)
+        if not result.is_valid:
+            self._handle_validation_failure(result, step)
+            return False
+        self.quarantine_step = None
+        if self.flow_context.state == FlowState.QUARANTINED:
+            self.flow_context.state = FlowState.ACTIVE
+            self._update_validation_history(result)
+        return self.flow_context.state == FlowState.ACTIVE
+
+    def _retry_step(self, step_type: str, args: Tuple[Any, ...]) -> ValidationResult:
+        """Re-runs a failed step against the current context, applying it on success."""
+        if step_type == "gate_transition":
+            gate, target_domain = args
+            result = self.validator.validate_gate_transition(gate, self.flow_context.current_domain, target_domain)
+            if result.is_valid:
+                self.flow_context.active_gates.append(gate)
+                self.flow_context.current_domain = target_domain
+            return result
+        (coordinates,) = args
+        result = self.validator.validate_field_address(
+            coordinates.get('latitude', ''),
+            coordinates.get('longitude', ''),
+            coordinates.get('temporal', '')
+        )
+        if result.is_valid:
+            self.flow_context.field_coordinates = coordinates
+            if not (result.details or {}).get('overridden'):
+                self.validated_coordinates = coordinates
+        return result
+
     def _validate_initial_state(self) -> ValidationResult:
         """Validates the initial flow state."""
         # Validate prime sequence
@@ -155,34 +281,55 @@ class ValidationFlowController:
 
         return ValidationResult(is_valid=True, timestamp=datetime.utcnow().isoformat() + 'Z')
 
-    def _handle_validation_failure(self, result: ValidationResult) -> None:
-        """Handles validation failures based on severity."""
-        if result.alert_level == "critical":
+    def _handle_validation_failure(self, result: ValidationResult, step: Optional[Tuple[str, Tuple[Any, ...]]] = None) -> None:
+        """Handles validation failures based on severity; `step` is retried on quarantine recovery."""
+        if result.alert_level >= AlertLevel.CRITICAL:
             self.flow_context.state = FlowState.ERROR
-        elif result.alert_level == "high":
+        elif result.alert_level >= AlertLevel.HIGH:
             self.flow_context.state = FlowState.QUARANTINED
+            self.quarantine_step = step
+            if self.quarantine_scheduler is not None:
+                self.quarantine_scheduler.quarantine(self, result.alert_level)
         
         self._update_validation_history(result)
         self._notify_observer(result)
 
     def _update_validation_history(self, result: ValidationResult) -> None:
         """Updates the validation history with new result."""
+        self.revision += 1
         self.flow_context.validation_history.append({
             'timestamp': result.timestamp,
             'result': result,
+            'column': self.result_columns.append(result),
             'flow_state': self.flow_context.state.value
         })
+        self.result_columns.compact_history(self.flow_context.validation_history, self.retain_results)
+        if self.replay_log is not None:
+            self.replay_log.record(self, "validation", result)
 
     def _notify_observer(self, result: ValidationResult) -> None:
-        """Notifies observer of validation state changes."""
-        self.logger.info(
-            f"Observer Notification: Flow State: {self.flow_context.state.value}, "
-            f"Alert: {result.error_code} - {result.error_message}"
+        """Notifies observer of validation state changes; repeats served from the negative cache stay quiet."""
+        if result.details and result.details.get('negative_cache'):
+            return
+        self.validator.alert_dispatcher.submit_result(
+            result,
+            f"ValidationFlowController:{self.flow_context.state.value}"
         )
 
-    def get_flow_status(self) -> Dict[str, Any]:
-        """Returns current flow status for observer monitoring."""
-        return {
+    def _publish_watch(self, topic: str, result: ValidationResult, changed: bool) -> None:
+        """Bumps the topic's state version on change and offers the event to subscribed watchers."""
+        if changed:
+            self.watch_versions[topic] += 1
+        if self.watch_scheduler.wants(topic):
+            self.watch_scheduler.publish(topic, self.watch_versions[topic], self.get_flow_status, result)
+
+    def get_flow_status(self, include_memory: bool = False) -> Dict[str, Any]:
+        """Returns current flow status for observer monitoring.
+
+        With include_memory, adds estimated retained bytes per growing
+        structure under 'memory'.
+        """
+        status = {
             'state': self.flow_context.state.value,
             'current_domain': self.flow_context.current_domain,
             'active_gates': self.flow_context.active_gates,
@@ -190,6 +337,9 @@ class ValidationFlowController:
             'last_validation': self.flow_context.validation_history[-1] if self.flow_context.validation_history else None,
             'timestamp': datetime.utcnow().isoformat() + 'Z'
         }
+        if include_memory:
+            status['memory'] = flow_memory(self)
+        return status
 
 if __name__ == "__main__":
     # Example usage
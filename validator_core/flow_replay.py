@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+
+import bisect
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from .flow_checkpoint import restore_flow
+
+# Scalar context fields carried by keyframes and deltas, by slot
+_STATE, _DOMAIN, _COORDINATES, _COHERENCE, _TIMESTAMP, _GATES_START, _PRIMES_START = range(7)
+
+_NO_RESULT = -1
+
+def _epoch(at: Union[str, float, datetime]) -> float:
+    """Epoch seconds for an ISO-8601 timestamp (naive means UTC), a datetime or a number."""
+    if isinstance(at, (int, float)):
+        return float(at)
+    if isinstance(at, str):
+        at = datetime.fromisoformat(at.strip().replace('Z', '+00:00'))
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    return at.timestamp()
+
+class _SequenceLog:
+    """Append-only store for one list field of a flow context.
+
+    Each version of the list is a [start, end) slice of one shared value
+    list. Flows only append to these lists in place, so a step that adds a
+    gate costs one appended value; replacing the list starts a new slice.
+    Positions are absolute: values[pos - offset] once old values are trimmed.
+    """
+
+    __slots__ = ('values', 'start', 'offset', '_source', '_seen')
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self.start = 0
+        self.offset = 0
+        self._source: Optional[list] = None
+        self._seen = 0
+
+    @property
+    def end(self) -> int:
+        return self.offset + len(self.values)
+
+    def slice(self, start: int, end: int) -> List[Any]:
+        return self.values[start - self.offset:end - self.offset]
+
+    def trim(self, keep_from: int) -> None:
+        """Drops values before absolute position `keep_from`."""
+        if keep_from > self.offset:
+            del self.values[:keep_from - self.offset]
+            self.offset = keep_from
+
+    def sync(self, current: list) -> bool:
+        """Catches up with the flow's list; True if a new slice was started."""
+        if current is self._source and len(current) >= self._seen:
+            self.values.extend(current[self._seen:])
+            self._seen = len(current)
+            return False
+        self.start = self.end
+        self.values.extend(current)
+        self._source = current
+        self._seen = len(current)
+        return True
+
+class FlowReplayLog:
+    """Event log of one flow from which its context at any past event can be rebuilt.
+
+    Every recorded event stores its time, revision, kind and result code in
+    flat columns plus a delta of the scalar fields it changed. Every
+    `keyframe_interval` events a full scalar keyframe is kept, so
+    reconstructing event i costs a bisect to find i (for timestamp
+    queries) and at most `keyframe_interval` delta applications:
+    O(log n + k). List fields live in append-only value logs and are
+    sliced out directly.
+
+    With `max_events` set, whole keyframe blocks older than the newest
+    `max_events` events are dropped (in batches of about an eighth of the
+    window); event indexes stay absolute.
+    """
+
+    def __init__(
+        self,
+        keyframe_interval: int = 256,
+        max_events: Optional[int] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        self.keyframe_interval = keyframe_interval
+        self.max_events = None if max_events is None else max(max_events, keyframe_interval)
+        self.clock = clock
+        self.stats = {'events': 0, 'keyframes': 0, 'reconstructions': 0, 'trimmed': 0}
+        self._base = 0  # absolute index of the oldest retained event, a multiple of keyframe_interval
+        self._trim_at = None if self.max_events is None else self.max_events + max(
+            keyframe_interval, self.max_events // 8 // keyframe_interval * keyframe_interval
+        )
+
+        self._times = array('d')
+        self._revisions = array('q')
+        self._kinds = array('B')
+        self._codes = array('b')
+        self._gates_end = array('q')
+        self._primes_end = array('q')
+        self._deltas: List[Optional[Tuple[Tuple[int, Any], ...]]] = []
+        self._keyframes: List[Tuple[Any, ...]] = []
+        self._kind_names: List[str] = []
+        self._kind_ids: Dict[str, int] = {}
+        self._gates = _SequenceLog()
+        self._primes = _SequenceLog()
+        self._last: Optional[List[Any]] = None
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["FlowReplayLog"]:
+        """Builds a log from the flow_replay section; None if disabled there."""
+        settings = (config or {}).get('flow_replay') or {}
+        if not settings.get('enabled', True):
+            return None
+        return cls(
+            keyframe_interval=settings.get('keyframe_interval', 256),
+            max_events=settings.get('max_events')
+        )
+
+    def __len__(self) -> int:
+        """Number of retained events."""
+        return len(self._times)
+
+    @property
+    def first_index(self) -> int:
+        """Absolute index of the oldest retained event."""
+        return self._base
+
+    def record(self, flow: Any, event_type: str, result: Any = None) -> int:
+        """Appends the flow's context after an event. Returns the event index."""
+        ctx = flow.flow_context
+        index = self._base + len(self._times)
+        new_gates = self._gates.sync(ctx.active_gates)
+        new_primes = self._primes.sync(ctx.prime_sequence)
+
+        last = self._last
+        if last is None:
+            last = self._last = [None] * 7
+        changes = []
+        for slot, value in (
+            (_STATE, ctx.state.value),
+            (_DOMAIN, ctx.current_domain),
+            (_COHERENCE, getattr(ctx, 'coherence_state', None)),
+            (_TIMESTAMP, ctx.timestamp),
+        ):
+            if value != last[slot]:
+                last[slot] = value
+                changes.append((slot, value))
+        if ctx.field_coordinates != last[_COORDINATES]:
+            last[_COORDINATES] = dict(ctx.field_coordinates)
+            changes.append((_COORDINATES, last[_COORDINATES]))
+        if new_gates:
+            last[_GATES_START] = self._gates.start
+            changes.append((_GATES_START, self._gates.start))
+        if new_primes:
+            last[_PRIMES_START] = self._primes.start
+            changes.append((_PRIMES_START, self._primes.start))
+
+        kind = self._kind_ids.get(event_type)
+        if kind is None:
+            kind = self._kind_ids[event_type] = len(self._kind_names)
+            self._kind_names.append(event_type)
+
+        self._times.append(self.clock())
+        self._revisions.append(getattr(flow, 'revision', 0))
+        self._kinds.append(kind)
+        self._codes.append(_NO_RESULT if result is None else int(result.error_code))
+        self._gates_end.append(self._gates.end)
+        self._primes_end.append(self._primes.end)
+        self._deltas.append(tuple(changes) if changes else None)
+        if index % self.keyframe_interval == 0:
+            self._keyframes.append(tuple(last))
+            self.stats['keyframes'] += 1
+        self.stats['events'] += 1
+        if self._trim_at is not None and len(self._times) >= self._trim_at:
+            self._trim()
+        return index
+
+    def _trim(self) -> None:
+        """Drops the oldest whole keyframe blocks beyond max_events."""
+        k = self.keyframe_interval
+        drop = (len(self._times) - self.max_events) // k * k
+        if drop <= 0:
+            return
+        for column in (self._times, self._revisions, self._kinds, self._codes, self._gates_end, self._primes_end):
+            del column[:drop]
+        del self._deltas[:drop]
+        del self._keyframes[:drop // k]
+        self._base += drop
+        self.stats['trimmed'] += drop
+        # The new first keyframe holds the earliest list slices still reachable
+        keyframe = self._keyframes[0]
+        self._gates.trim(keyframe[_GATES_START])
+        self._primes.trim(keyframe[_PRIMES_START])
+
+    def index_at(self, at: Union[str, float, datetime]) -> Optional[int]:
+        """Index of the last event at or before `at`, or None if that predates the retained events."""
+        index = bisect.bisect_right(self._times, _epoch(at)) - 1
+        return index + self._base if index >= 0 else None
+
+    def state_at(self, index: int, tail: Optional[int] = None) -> Dict[str, Any]:
+        """The flow context as it stood right after event `index` (negative counts from the end).
+
+        `tail` caps active_gates and prime_sequence to their last entries,
+        keeping long-running flows cheap to inspect.
+        """
+        first, count = self._base, len(self._times)
+        if index < 0:
+            index += first + count
+        if not first <= index < first + count:
+            raise IndexError(f"Event index {index} outside retained range {first}..{first + count - 1}")
+
+        # Positions below are relative to the oldest retained event
+        i = index - first
+        base = i - i % self.keyframe_interval
+        fields = list(self._keyframes[base // self.keyframe_interval])
+        deltas = self._deltas
+        for j in range(base + 1, i + 1):
+            delta = deltas[j]
+            if delta is not None:
+                for slot, value in delta:
+                    fields[slot] = value
+        self.stats['reconstructions'] += 1
+
+        gates_start, gates_end = fields[_GATES_START], self._gates_end[i]
+        primes_start, primes_end = fields[_PRIMES_START], self._primes_end[i]
+        if tail is not None:
+            gates_start = max(gates_start, gates_end - tail)
+            primes_start = max(primes_start, primes_end - tail)
+        code = self._codes[i]
+        return {
+            'event_index': index,
+            'event_type': self._kind_names[self._kinds[i]],
+            'event_time': datetime.fromtimestamp(self._times[i], timezone.utc).isoformat().replace('+00:00', 'Z'),
+            'error_code': None if code == _NO_RESULT else code,
+            'state': fields[_STATE],
+            'current_domain': fields[_DOMAIN],
+            'active_gates': self._gates.slice(gates_start, gates_end),
+            'prime_sequence': self._primes.slice(primes_start, primes_end),
+            'field_coordinates': dict(fields[_COORDINATES]),
+            'timestamp': fields[_TIMESTAMP],
+            'coherence_state': fields[_COHERENCE],
+            'revision': self._revisions[i]
+        }
+
+    def state_at_time(self, at: Union[str, float, datetime], tail: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """The flow context as it stood at `at`, or None if that predates the first event."""
+        index = self.index_at(at)
+        return None if index is None else self.state_at(index, tail)
+
+    def restore(self, flow: Any, index: int) -> None:
+        """Rewinds a flow's context (e.g. a scratch copy) to event `index`."""
+        restore_flow(flow, self.state_at(index))
+
+    def export(self, tail: Optional[int] = None) -> Dict[str, Any]:
+        """JSON-safe copy of the newest whole keyframe blocks holding at least `tail` events (all if None)."""
+        k = self.keyframe_interval
+        skip = 0 if tail is None else max(len(self._times) - tail, 0) // k * k
+        keyframes = self._keyframes[skip // k:]
+        gates_from = keyframes[0][_GATES_START] if keyframes else self._gates.end
+        primes_from = keyframes[0][_PRIMES_START] if keyframes else self._primes.end
+        return {
+            'keyframe_interval': k,
+            'first_index': self._base + skip,
+            'times': self._times[skip:].tolist(),
+            'revisions': self._revisions[skip:].tolist(),
+            'kinds': self._kinds[skip:].tolist(),
+            'codes': self._codes[skip:].tolist(),
+            'gates_end': self._gates_end[skip:].tolist(),
+            'primes_end': self._primes_end[skip:].tolist(),
+            'deltas': self._deltas[skip:],
+            'keyframes': keyframes,
+            'kind_names': list(self._kind_names),
+            'gates': [gates_from, self._gates.start, self._gates.slice(gates_from, self._gates.end)],
+            'primes': [primes_from, self._primes.start, self._primes.slice(primes_from, self._primes.end)],
+            'last': None if self._last is None else list(self._last)
+        }
+
+    @classmethod
+    def from_export(
+        cls,
+        record: Dict[str, Any],
+        max_events: Optional[int] = None,
+        clock: Callable[[], float] = time.time
+    ) -> "FlowReplayLog":
+        """Rebuilds a log from export(), e.g. on the node a flow migrated to; event indexes carry on."""
+        log = cls(record['keyframe_interval'], max_events, clock)
+        log._base = record['first_index']
+        log._times.extend(record['times'])
+        log._revisions.extend(record['revisions'])
+        log._kinds.extend(record['kinds'])
+        log._codes.extend(record['codes'])
+        log._gates_end.extend(record['gates_end'])
+        log._primes_end.extend(record['primes_end'])
+        # JSON turns the tuples into lists
+        log._deltas = [None if delta is None else tuple(map(tuple, delta)) for delta in record['deltas']]
+        log._keyframes = [tuple(keyframe) for keyframe in record['keyframes']]
+        log._kind_names = list(record['kind_names'])
+        log._kind_ids = {name: kind for kind, name in enumerate(log._kind_names)}
+        for sequence, (offset, start, values) in ((log._gates, record['gates']), (log._primes, record['primes'])):
+            sequence.offset, sequence.start, sequence.values = offset, start, list(values)
+        log._last = None if record['last'] is None else list(record['last'])
+        return log
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the column buffers and indexes (excluding shared values)."""
+        columns = (self._times, self._revisions, self._kinds, self._codes, self._gates_end, self._primes_end)
+        pointers = 8 * (len(self._deltas) + len(self._gates.values) + len(self._primes.values))
+        keyframes = 8 * 7 * len(self._keyframes)
+        return sum(column.itemsize * len(column) for column in columns) + pointers + keyframes
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Event and keyframe counts for Observer monitoring."""
+        return {
+            'events': len(self._times),
+            'first_index': self._base,
+            'max_events': self.max_events,
+            'keyframes': len(self._keyframes),
+            'keyframe_interval': self.keyframe_interval,
+            'first_event': self.state_at(self._base)['event_time'] if self._times else None,
+            'nbytes': self.nbytes()
+        }
+
+if __name__ == "__main__":
+    # A synthetic multi-million-event flow: reconstruct random past states by
+    # timestamp and compare with replaying the log from the start.
+    import os
+    import random
+    from .flow_controller import ValidationFlowController, FlowState
+
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "validator_config.yaml")
+    controller = ValidationFlowController(config_path, "replay-demo")
+    controller.begin_validation_flow({
+        'domain': 'OBI-WAN',
+        'prime_sequence': [2, 3, 5, 7, 11],
+        'coordinates': {'latitude': 'FIELD/node-1/003', 'longitude': 'OBI-WAN/personal', 'temporal': '20250612091630Z'}
+    })
+
+    ticks = iter(range(10 ** 9))
+    log = FlowReplayLog(clock=lambda: 1_750_000_000.0 + next(ticks) * 0.001)
+    ctx = controller.flow_context
+    gates, domains = ["🜂", "🜄", "🜁", "🜃"], ['OBI-WAN', 'BERJAK', 'TATA', 'ATLAS']
+    events = 2_000_000
+
+    started = time.perf_counter()
+    for i in range(events):
+        if i % 3 == 0:
+            ctx.active_gates.append(gates[i % 4])
+            ctx.current_domain = domains[i % 4]
+        elif i % 97 == 0:
+            ctx.field_coordinates = {**ctx.field_coordinates, 'latitude': f"FIELD/node-{i % 50}/003"}
+        elif i % 1009 == 0:
+            ctx.state = FlowState.QUARANTINED if ctx.state == FlowState.ACTIVE else FlowState.ACTIVE
+        controller.revision += 1
+        log.record(controller, "validation")
+    elapsed = time.perf_counter() - started
+    print(f"Recorded {events} events in {elapsed:.1f}s ({elapsed / events * 1e6:.2f}us each), "
+          f"~{log.nbytes() / 2 ** 20:.0f}MiB of columns and indexes")
+
+    queries = [1_750_000_000.0 + random.randrange(events) * 0.001 for _ in range(1000)]
+    started = time.perf_counter()
+    states = [log.state_at_time(at, tail=16) for at in queries]
+    per_query = (time.perf_counter() - started) / len(queries)
+    started = time.perf_counter()
+    full = [log.state_at_time(at) for at in queries[:100]]
+    per_full = (time.perf_counter() - started) / 100
+    print(f"Reconstructed 1000 random past states: {per_query * 1e6:.0f}us each with the last 16 gates, "
+          f"{per_full * 1e6:.0f}us copying all gates (up to {max(len(s['active_gates']) for s in full)})")
+
+    # Reference: fold every delta from event 0 for a late event
+    target = log.index_at(queries[0])
+    started = time.perf_counter()
+    fields = [None] * 7
+    for delta in log._deltas[:target + 1]:
+        for slot, value in delta or ():
+            fields[slot] = value
+    print(f"Naive replay to event {target}: {(time.perf_counter() - started) * 1e3:.0f}ms; "
+          f"states agree: {fields[_DOMAIN] == states[0]['current_domain'] and fields[_STATE] == states[0]['state']}")
+    print(f"Latest: {log.state_at(-1, tail=4)}")
+
+    # The same workload under a retention window: memory stays flat, indexes stay absolute
+    bounded = FlowReplayLog(max_events=65536, clock=lambda: 1_760_000_000.0 + next(ticks) * 0.001)
+    for i in range(500_000):
+        if i % 3 == 0:
+            ctx.active_gates.append(gates[i % 4])
+        controller.revision += 1
+        bounded.record(controller, "validation")
+    print(f"Retaining events {bounded.first_index}..{bounded.first_index + len(bounded) - 1} of 500000: "
+          f"~{bounded.nbytes() / 2 ** 20:.1f}MiB; oldest {bounded.state_at(bounded.first_index, tail=2)['active_gates']}, "
+          f"latest {bounded.state_at(-1, tail=2)['active_gates']}")
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+
+import codecs
+import json
+import re
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from .config_cache import load_config
+from .validator import FieldValidator
+
+# Defaults mirror validateFractalFieldStructure in utils/fractal-field-validator.ts
+DEFAULT_FIELD_NAMES = ("Tata", "Atlas", "Dojo", "ObiWan")
+DEFAULT_PETAL_COUNT = 6
+PETAL_PROPS = ("name", "glyph", "description", "pNumber")
+NODE_PROPS = ("name", "glyph", "color", "description", "rNumber", "rName")
+
+_CHUNK_SIZE = 1 << 16
+
+class StructureIssueKind(Enum):
+    MISSING_FIELD = "missing_field"
+    UNEXPECTED_FIELD = "unexpected_field"
+    DUPLICATE_FIELD = "duplicate_field"
+    PETAL_COUNT = "petal_count"
+    EMPTY_PETAL = "empty_petal"
+    MISSING_PETAL_PROPS = "missing_petal_props"
+    MISSING_NODE_PROPS = "missing_node_props"
+    NON_PRIME_PETALS = "non_prime_petals"
+
+@dataclass
+class StructureIssue:
+    kind: StructureIssueKind
+    field_name: str
+    path: str
+    message: str
+
+@dataclass
+class FieldStructureResult:
+    field_name: str
+    is_complete: bool
+    petal_count: int
+    expected_petal_count: int
+    issue_count: int = 0
+    incomplete_details: List[str] = field(default_factory=list)
+
+@dataclass
+class FractalStructureReport:
+    is_valid: bool
+    field_results: List[FieldStructureResult]
+    nodes_checked: int
+    issue_counts: Dict[str, int]
+    summary: str
+
+# One JSON token after any whitespace and separators. Commas and colons
+# carry no structure the validator needs, so they are skipped; a string
+# followed by a colon is an object key.
+_TOKEN = re.compile(
+    r'[\s,:]*(?:"((?:[^"\\]|\\.)*)"(\s*:)?|([{}\[\]])'
+    r'|(-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?)|(true|false|null))'
+)
+_SEPARATORS = ' \t\r\n,:'
+_STRING, _KEY, _BRACKET, _NUMBER, _LITERAL = range(1, 6)
+_BRACKETS = {'{': 'start_map', '}': 'end_map', '[': 'start_array', ']': 'end_array'}
+_LITERALS = {'true': True, 'false': False, 'null': None}
+
+def _json_events(reader: Callable[[int], Any]) -> Iterator[Tuple[str, Any]]:
+    """Pull parser over a streamed JSON document.
+
+    Yields ('start_map' | 'end_map' | 'start_array' | 'end_array', None),
+    ('key', name) and ('value', scalar). Only the current read chunk and
+    one token are held in memory. Separators are not checked.
+    """
+    decode = None
+    buf, pos, end, eof = "", 0, 0, False
+    match = _TOKEN.match
+    while True:
+        m = match(buf, pos, end)
+        if m is None:
+            rest = buf[pos:end].lstrip(_SEPARATORS)
+            if eof or (rest and rest[0] != '"'):
+                # Only a string can legitimately run past the tokenized region
+                if rest or buf[end:].strip(_SEPARATORS):
+                    raise ValueError(f"Malformed JSON near: {buf[pos:pos + 40]!r}")
+                return
+            chunk = reader(_CHUNK_SIZE)
+            eof = not chunk
+            if isinstance(chunk, bytes):
+                if decode is None:
+                    decode = codecs.getincrementaldecoder('utf-8')().decode
+                chunk = decode(chunk, final=eof)
+            buf, pos = buf[pos:] + chunk, 0
+            # Tokens before the last bracket or comma are complete; past it a
+            # number or key may continue in the next chunk
+            end = len(buf) if eof else max(0, *map(buf.rfind, ',{}[]'))
+            continue
+        pos = m.end()
+        kind = m.lastindex
+        if kind == _BRACKET:
+            yield _BRACKETS[m.group(_BRACKET)], None
+        elif kind <= _KEY:
+            text = m.group(_STRING)
+            if '\\' in text:
+                text = json.loads(f'"{text}"')
+            yield ('key' if kind == _KEY else 'value'), text
+        elif kind == _NUMBER:
+            token = m.group(_NUMBER)
+            yield 'value', float(token) if any(c in token for c in '.eE') else int(token)
+        else:
+            yield 'value', _LITERALS[m.group(_LITERAL)]
+
+# Container frame kinds
+_ROOT, _FIELD, _PETALS, _PETAL, _CHILDREN, _NODE, _OTHER = range(7)
+
+class _Frame:
+    __slots__ = ('kind', 'key', 'name', 'seen', 'count', 'numbers', 'result')
+
+    def __init__(self, kind: int):
+        self.kind = kind
+        self.key: Optional[str] = None
+        self.name: Optional[str] = None
+        self.seen = 0        # bitmask of required properties present
+        self.count = 0       # items seen (arrays) or petals/children (maps)
+        self.numbers: Optional[List[Any]] = None
+        self.result: Optional[FieldStructureResult] = None
+
+class FractalFieldStructureValidator:
+    """Checks the structural completeness of fractal field trees streamed as JSON.
+
+    Applies the front-end's validateFractalFieldStructure rules - expected
+    field names, petal count per field, required petal and node properties,
+    petals with recursive nodes - at every depth of the tree, and runs each
+    field's petal pNumbers through the FieldValidator prime sequence check.
+
+    Traversal keeps an explicit stack, one frame per open container, so
+    memory is bounded by tree depth rather than size; issues are yielded as
+    soon as the node they concern closes.
+    """
+
+    def __init__(
+        self,
+        expected_field_names: Tuple[str, ...] = DEFAULT_FIELD_NAMES,
+        expected_petal_count: int = DEFAULT_PETAL_COUNT,
+        prime_validator: Optional[FieldValidator] = None,
+        max_details: int = 20
+    ):
+        self.expected_field_names = tuple(expected_field_names)
+        self.expected_petal_count = expected_petal_count
+        self.prime_validator = prime_validator
+        self.max_details = max_details
+
+    @classmethod
+    def from_config(cls, config_path: str) -> "FractalFieldStructureValidator":
+        """Builds a validator from the fractal_field_structure section of a validator config."""
+        settings = load_config(config_path).config.get('fractal_field_structure') or {}
+        return cls(
+            expected_field_names=tuple(settings.get('expected_field_names', DEFAULT_FIELD_NAMES)),
+            expected_petal_count=settings.get('expected_petal_count', DEFAULT_PETAL_COUNT),
+            prime_validator=FieldValidator(config_path) if settings.get('check_petal_primes', True) else None,
+            max_details=settings.get('max_details', 20)
+        )
+
+    def validate(
+        self,
+        source: Union[str, IO],
+        on_issue: Optional[Callable[[StructureIssue], None]] = None
+    ) -> FractalStructureReport:
+        """Validates a whole stream, passing each issue to `on_issue` as it is found."""
+        scan = self.iter_issues(source)
+        while True:
+            try:
+                issue = next(scan)
+            except StopIteration as done:
+                return done.value
+            if on_issue is not None:
+                on_issue(issue)
+
+    def iter_issues(self, source: Union[str, IO]) -> Iterator[StructureIssue]:
+        """Yields issues in stream order; the generator's return value is the final report.
+
+        `source` is a path or a text or binary file object holding a JSON
+        array of fields.
+        """
+        if isinstance(source, str):
+            with open(source, 'rb') as f:
+                return (yield from self._scan(f.read))
+        return (yield from self._scan(source.read))
+
+    def _scan(self, reader: Callable[[int], Any]) -> Iterator[StructureIssue]:
+        petal_bits = {prop: 1 << i for i, prop in enumerate(PETAL_PROPS)}
+        node_bits = {prop: 1 << i for i, prop in enumerate(NODE_PROPS)}
+        all_petal, all_node = (1 << len(PETAL_PROPS)) - 1, (1 << len(NODE_PROPS)) - 1
+        expected = set(self.expected_field_names)
+        found = set()
+        field_results: List[FieldStructureResult] = []
+        issue_counts: Dict[str, int] = {}
+        nodes = 0
+        skip = 0  # depth inside containers that are not part of the tree
+        stack: List[_Frame] = []
+
+        def issue(kind: StructureIssueKind, message: str) -> StructureIssue:
+            issue_counts[kind.value] = issue_counts.get(kind.value, 0) + 1
+            field_frame = stack[1] if len(stack) > 1 else None
+            if field_frame is not None and field_frame.result is not None:
+                result = field_frame.result
+                result.is_complete = False
+                result.issue_count += 1
+                if len(result.incomplete_details) < self.max_details:
+                    result.incomplete_details.append(message)
+            return StructureIssue(kind, field_frame.name if field_frame else "", self._path(stack), message)
+
+        for event, value in _json_events(reader):
+            if skip:
+                if event in ('start_map', 'start_array'):
+                    skip += 1
+                elif event in ('end_map', 'end_array'):
+                    skip -= 1
+                continue
+            top = stack[-1] if stack else None
+
+            if event == 'key':
+                top.key = value
+                # Presence is `prop in node`, whatever the value's type
+                if top.kind == _PETAL:
+                    top.seen |= petal_bits.get(value, 0)
+                elif top.kind == _NODE:
+                    top.seen |= node_bits.get(value, 0)
+                continue
+
+            if event == 'value':
+                if top is None:
+                    raise ValueError("Expected a JSON array of fields")
+                if top.kind in (_PETAL, _NODE, _FIELD):
+                    if top.key == 'name':
+                        top.name = value
+                    elif top.kind == _PETAL and top.key == 'pNumber':
+                        top.numbers = value
+                else:
+                    top.count += 1
+                continue
+
+            if event in ('start_map', 'start_array'):
+                is_map = event == 'start_map'
+                if top is None:
+                    if is_map:
+                        raise ValueError("Expected a JSON array of fields")
+                    stack.append(_Frame(_ROOT))
+                    continue
+                if top.kind in (_ROOT, _PETALS, _CHILDREN):
+                    top.count += 1
+                    child = {_ROOT: _FIELD, _PETALS: _PETAL, _CHILDREN: _NODE}[top.kind] if is_map else _OTHER
+                elif not is_map and (top.kind, top.key) in ((_FIELD, 'petals'), (_PETAL, 'children'), (_NODE, 'children')):
+                    child = _PETALS if top.kind == _FIELD else _CHILDREN
+                else:
+                    child = _OTHER
+                if child == _OTHER:
+                    skip = 1
+                    continue
+                frame = _Frame(child)
+                if child == _FIELD:
+                    frame.numbers = []
+                    frame.result = FieldStructureResult("", True, 0, self.expected_petal_count)
+                stack.append(frame)
+                continue
+
+            # end_map / end_array closes the innermost frame
+            frame = stack.pop()
+            parent = stack[-1] if stack else None
+            if frame.kind in (_PETALS, _CHILDREN):
+                parent.count = frame.count
+            elif frame.kind == _NODE:
+                nodes += 1
+                if frame.seen != all_node:
+                    stack.append(frame)
+                    missing = [p for p in NODE_PROPS if not frame.seen & node_bits[p]]
+                    yield issue(
+                        StructureIssueKind.MISSING_NODE_PROPS,
+                        f'Node "{frame.name}" in petal "{self._petal_name(stack)}" is missing required properties: {", ".join(missing)}'
+                    )
+                    stack.pop()
+            elif frame.kind == _PETAL:
+                nodes += 1
+                stack.append(frame)
+                if not frame.count:
+                    yield issue(StructureIssueKind.EMPTY_PETAL, f'Petal "{frame.name}" has no recursive nodes')
+                if frame.seen != all_petal:
+                    missing = [p for p in PETAL_PROPS if not frame.seen & petal_bits[p]]
+                    yield issue(
+                        StructureIssueKind.MISSING_PETAL_PROPS,
+                        f'Petal "{frame.name}" is missing required properties: {", ".join(missing)}'
+                    )
+                stack.pop()
+                numbers = stack[-2].numbers
+                if frame.numbers is not None and len(numbers) <= self.expected_petal_count:
+                    numbers.append(frame.numbers)
+            elif frame.kind == _FIELD:
+                nodes += 1
+                stack.append(frame)
+                result = frame.result
+                result.field_name = name = frame.name if frame.name is not None else f"<field {parent.count - 1}>"
+                result.petal_count = frame.count
+                if name not in expected:
+                    yield issue(StructureIssueKind.UNEXPECTED_FIELD, f'Field "{name}" is not an expected field')
+                elif name in found:
+                    yield issue(StructureIssueKind.DUPLICATE_FIELD, f'Field "{name}" appears more than once')
+                else:
+                    found.add(name)
+                if frame.count != self.expected_petal_count:
+                    yield issue(
+                        StructureIssueKind.PETAL_COUNT,
+                        f"Expected {self.expected_petal_count} petals, found {frame.count}"
+                    )
+                elif self.prime_validator is not None:
+                    check = self.prime_validator.validate_prime_sequence(frame.numbers)
+                    if not check.is_valid:
+                        yield issue(StructureIssueKind.NON_PRIME_PETALS, f"Petal pNumbers rejected: {check.error_message}")
+                stack.pop()
+                field_results.append(result)
+
+        if stack:
+            raise ValueError("Truncated JSON: stream ended inside the field tree")
+        for name in self.expected_field_names:
+            if name not in found:
+                message = f'Field "{name}" is missing entirely'
+                issue_counts[StructureIssueKind.MISSING_FIELD.value] = issue_counts.get(StructureIssueKind.MISSING_FIELD.value, 0) + 1
+                field_results.append(FieldStructureResult(name, False, 0, self.expected_petal_count, 1, [message]))
+                yield StructureIssue(StructureIssueKind.MISSING_FIELD, name, name, message)
+
+        is_valid = not issue_counts
+        complete = sum(1 for result in field_results if result.is_complete)
+        summary = (
+            f"All {len(field_results)} fields are structurally complete with {self.expected_petal_count} petals each"
+            if is_valid else
+            f"Only {complete} of {len(self.expected_field_names)} fields are structurally complete"
+        )
+        return FractalStructureReport(is_valid, field_results, nodes, issue_counts, summary)
+
+    @staticmethod
+    def _petal_name(stack: List[_Frame]) -> Optional[str]:
+        for frame in reversed(stack):
+            if frame.kind == _PETAL:
+                return frame.name
+        return None
+
+    @staticmethod
+    def _path(stack: List[_Frame]) -> str:
+        """Location of the innermost frame, e.g. Tata/petals[2]/children[0]/children[3]."""
+        parts = []
+        for i, frame in enumerate(stack):
+            if frame.kind == _FIELD:
+                parts.append(frame.name if frame.name is not None else f"[{stack[i - 1].count - 1}]")
+            elif frame.kind in (_PETAL, _NODE):
+                container = stack[i - 1]
+                label = "petals" if container.kind == _PETALS else "children"
+                parts.append(f"{label}[{container.count - 1}]")
+        return "/".join(parts)
+
+if __name__ == "__main__":
+    # Streams a generated multi-million-node field tree from disk and reports
+    # incomplete nodes as they are found.
+    import os
+    import random
+    import resource
+    import tempfile
+    import time
+
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "validator_config.yaml")
+    path = os.path.join(tempfile.mkdtemp(), "fractal_field_tree.json")
+    rng = random.Random(7)
+    petal_primes = [2, 3, 5, 7, 11, 13]
+
+    def write_nodes(f, depth: int, fanout: int) -> int:
+        written = 0
+        for i in range(fanout):
+            f.write("," if i else "")
+            node = {'name': f"n{depth}-{i}", 'glyph': "⬣", 'color': "bg-red-500", 'description': "generated",
+                    'rNumber': i, 'rName': "Registry"}
+            if rng.random() < 0.00001:
+                del node['rName']
+            f.write(json.dumps(node)[:-1])
+            written += 1
+            if depth:
+                f.write(', "children": [')
+                written += write_nodes(f, depth - 1, fanout)
+                f.write("]")
+            f.write("}")
+        return written
+
+    started = time.perf_counter()
+    total = 0
+    with open(path, 'w') as f:
+        f.write("[")
+        for fi, name in enumerate(("Tata", "Atlas", "Dojo", "ObiWan")):
+            petals = petal_primes if name != "Dojo" else petal_primes[:5] + [15]
+            f.write(("," if fi else "") + json.dumps({'name': name, 'color': "bg-red-500", 'emoji': "🔴",
+                                                      'description': "", 'dominantResonance': "◎ P1"})[:-1])
+            f.write(', "petals": [')
+            for pi, number in enumerate(petals):
+                f.write(("," if pi else "") + json.dumps({'name': f"petal_{number}", 'glyph': "◎", 'description': "",
+                                                           'pNumber': number})[:-1] + ', "children": [')
+                # Atlas's first petal is left without recursive nodes
+                total += write_nodes(f, depth=5, fanout=0 if (name, pi) == ("Atlas", 0) else 6)
+                f.write("]}")
+            f.write("]}")
+        f.write("]")
+    print(f"Generated {total} recursive nodes ({os.path.getsize(path) / 2 ** 20:.0f}MiB) in {time.perf_counter() - started:.1f}s")
+
+    validator = FractalFieldStructureValidator.from_config(config_path)
+    started = time.perf_counter()
+    report = validator.validate(path, on_issue=lambda issue: print(f"  [{issue.kind.value}] {issue.path}: {issue.message}"))
+    elapsed = time.perf_counter() - started
+    print(f"{report.summary}: {report.nodes_checked} nodes in {elapsed:.1f}s "
+          f"({report.nodes_checked / elapsed:,.0f} nodes/s), peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f}MiB")
+    for result in report.field_results:
+        print(f"  {'✅' if result.is_complete else '❌'} {result.field_name}: petals {result.petal_count}/{result.expected_petal_count}, {result.issue_count} issues")
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+import dataclasses
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from .error_codes import ErrorCode
+
+# Failures that depend only on the input and the config, never on flow state;
+# nothing else may be served from the cache.
+CACHEABLE_CODES = frozenset({
+    ErrorCode.INVALID_PRIME_PROGRESSION,
+    ErrorCode.NON_PRIME_DETECTED,
+    ErrorCode.INVALID_FIELD_COORDINATE,
+    ErrorCode.INVALID_DOMAIN_ALIGNMENT,
+    ErrorCode.INVALID_TEMPORAL_MARKER,
+    ErrorCode.INVALID_GATE,
+    ErrorCode.INCOMPATIBLE_DOMAINS,
+})
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over Python hashes (double hashing from one 64-bit hash)."""
+
+    __slots__ = ('size', 'hashes', 'bits', 'count')
+
+    def __init__(self, size: int, hashes: int):
+        self.size = size
+        self.hashes = hashes
+        self.bits = bytearray((size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, h: int):
+        h &= 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, h: int) -> None:
+        bits = self.bits
+        for pos in self._positions(h):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, h: int) -> bool:
+        bits = self.bits
+        for pos in self._positions(h):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def clear(self) -> None:
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+class NegativeResultCache:
+    """Remembers inputs that failed validation so repeats skip re-validation.
+
+    A Bloom filter records every failing input; an input is admitted to the
+    exact LRU only when it fails a second time, so one-off typos never evict
+    real repeat offenders. Lookups consult the LRU, so a Bloom false
+    positive can cost a dict probe but never a wrong verdict, and only
+    failures are ever stored: a hit can never turn an input valid.
+
+    Cached results are shared and must not be mutated. Entries belong to
+    one config content hash and are dropped when the config changes.
+    """
+
+    def __init__(self, maxsize: int = 4096, bloom_bits: int = 1 << 18, bloom_hashes: int = 4, max_offenders: int = 1024):
+        self.maxsize = maxsize
+        self.max_offenders = max_offenders
+        self.config_hash: Optional[str] = None
+        self.stats = {'hits': 0, 'admitted': 0, 'evictions': 0, 'first_failures': 0, 'invalidations': 0}
+        self.offenders: "OrderedDict[str, int]" = OrderedDict()
+
+        self._bloom = _BloomFilter(bloom_bits, bloom_hashes)
+        # Rebuild the filter past this many insertions to keep false positives low
+        self._bloom_capacity = bloom_bits // 16
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def serves(self, config_hash: str) -> bool:
+        """True if lookups are worthwhile for a validator on this config."""
+        return bool(self._entries) and self.config_hash == config_hash
+
+    def lookup(self, key: Hashable, node: str) -> Optional[Any]:
+        """Returns the shared failure result for a known-bad input, else None."""
+        if hash(key) not in self._bloom:
+            return None
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                return None
+            self.stats['hits'] += 1
+            self._entries.move_to_end(key)
+            self._count_offender(node)
+            return result
+
+    def record(self, key: Hashable, result: Any, node: str, config_hash: str) -> None:
+        """Notes a fresh failure; a repeat is admitted to the LRU as a prebuilt result."""
+        if result.error_code not in CACHEABLE_CODES:
+            return
+        with self._lock:
+            if config_hash != self.config_hash:
+                self._reset(config_hash)
+            h = hash(key)
+            if h not in self._bloom:
+                self._bloom.add(h)
+                self.stats['first_failures'] += 1
+                if self._bloom.count > self._bloom_capacity:
+                    self._rebuild_bloom()
+                return
+            self._count_offender(node)
+            if key in self._entries:
+                return
+            self._entries[key] = dataclasses.replace(
+                result,
+                details={**(result.details or {}), 'negative_cache': True}
+            )
+            self.stats['admitted'] += 1
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def top_offenders(self, n: int = 10) -> List[Tuple[str, int]]:
+        """Nodes with the most repeated bad inputs."""
+        with self._lock:
+            offenders = list(self.offenders.items())
+        return sorted(offenders, key=lambda item: item[1], reverse=True)[:n]
+
+    def invalidate(self) -> None:
+        """Drops every cached failure, e.g. after a config reload."""
+        with self._lock:
+            self._reset(self.config_hash)
+
+    def _reset(self, config_hash: Optional[str]) -> None:
+        # Called with the lock held
+        self._entries.clear()
+        self._bloom.clear()
+        self.config_hash = config_hash
+        self.stats['invalidations'] += 1
+
+    def _rebuild_bloom(self) -> None:
+        # Called with the lock held; keeps every LRU entry reachable
+        self._bloom.clear()
+        for key in self._entries:
+            self._bloom.add(hash(key))
+
+    def _count_offender(self, node: str) -> None:
+        # Called with the lock held
+        offenders = self.offenders
+        count = offenders.get(node)
+        if count is None and len(offenders) >= self.max_offenders:
+            # Make room by forgetting the node with the fewest repeats (oldest first on ties)
+            del offenders[min(offenders, key=offenders.__getitem__)]
+        offenders[node] = (count or 0) + 1
+
+_shared_caches: Dict[str, NegativeResultCache] = {}
+_shared_lock = threading.Lock()
+
+def get_negative_cache(config_path: str) -> NegativeResultCache:
+    """Returns the process-wide negative cache for a config file."""
+    path = os.path.abspath(config_path)
+    with _shared_lock:
+        cache = _shared_caches.get(path)
+        if cache is None:
+            cache = _shared_caches[path] = NegativeResultCache()
+        return cache
+
+if __name__ == "__main__":
+    # Example usage: a misbehaving node resending the same bad inputs
+    import time
+    from .validator import FieldValidator
+
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "validator_config.yaml")
+    validator = FieldValidator(config_path)
+    primes = [n for n in range(1000000, 1003000) if validator._is_prime(n)]
+    bad_sequence = primes + [primes[-1] + 1]
+    runs = 200
+
+    started = time.perf_counter()
+    for _ in range(runs):
+        validator._check_prime_sequence(bad_sequence)
+    uncached = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(runs):
+        result = validator.validate_prime_sequence(bad_sequence)
+    cached = time.perf_counter() - started
+
+    print(f"Result: {result}")
+    print(f"Repeated bad sequence: {uncached / runs * 1e6:.0f}us uncached, {cached / runs * 1e6:.0f}us through the cache")
+    for _ in range(3):
+        validator.validate_field_address("FIELD/node-7/12", "NOWHERE/x", "20250612091427Z")
+    print(f"Top offenders: {validator.negative_cache.top_offenders()}")
+    print(f"Cache stats: {validator.negative_cache.stats}")
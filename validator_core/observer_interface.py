@@ -1,11 +1,19 @@
 #!/usr/bin/env python3
 
 import logging
-from typing import Dict, List, Any
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from .validation_flow import ValidationFlowPipeline, ValidationFlowState
+from .config_cache import configure_logging
+from .error_codes import ErrorCode
+from .overrides import ALL_FLOWS, OVERRIDABLE_RULES, get_override_registry
+from .tracing import get_span_recorder
+from .memory_accounting import observer_memory
 
 class ObserverAction(Enum):
     PAUSE = "pause"
@@ -15,6 +23,7 @@ class ObserverAction(Enum):
     OVERRIDE = "override"
     INSPECT = "inspect"
     TRACE = "trace"
+    INSPECT_AT = "inspect_at"
 
 @dataclass
 class ObserverCommand:
@@ -32,153 +41,246 @@ class ObserverResponse:
     timestamp: str
     trace_id: str = ""
 
+# Placeholder state in handler responses, replaced by a flow status snapshot
+_FLOW_STATUS: Dict[str, Any] = {}
+
 class ObserverInterface:
     def __init__(self, flow_controller: ValidationFlowPipeline):
         self.flow_controller = flow_controller
-        self.command_history: List[ObserverCommand] = []
-        self.active_overrides: Dict[str, Any] = {}
+        self.flows: Dict[str, ValidationFlowPipeline] = {flow_controller.flow_id: flow_controller}
+        self.command_history: Deque[ObserverCommand] = deque(
+            maxlen=(flow_controller.config.get('observer_interface') or {}).get('command_history')
+        )
+        self.overrides = get_override_registry()
+        self.tracer = get_span_recorder()
+        self.tracer.configure(flow_controller.config)
+        self._handlers: Dict[ObserverAction, Callable[[ObserverCommand, ValidationFlowPipeline], Tuple[ObserverResponse, str]]] = {
+            ObserverAction.PAUSE: self._pause_flow,
+            ObserverAction.RESUME: self._resume_flow,
+            ObserverAction.ADVANCE: self._advance_flow,
+            ObserverAction.QUARANTINE: self._quarantine_flow,
+            ObserverAction.OVERRIDE: self._override_validation,
+            ObserverAction.INSPECT: self._inspect_state,
+            ObserverAction.TRACE: self._trace_history,
+            ObserverAction.INSPECT_AT: self._inspect_at_time,
+        }
         
-        logging.basicConfig(level=logging.INFO)
+        configure_logging()
         self.logger = logging.getLogger("ObserverInterface")
 
+    @property
+    def active_overrides(self) -> Dict[str, Any]:
+        """Unexpired overrides, keyed by rule (or rule@flow_id for flow-scoped ones)."""
+        return self.overrides.snapshot()
+
+    def register_flow(self, flow_id: str, flow: ValidationFlowPipeline) -> None:
+        """Makes another flow addressable via parameters['flow_id']."""
+        self.flows[flow_id] = flow
+
     def execute_command(self, command: ObserverCommand) -> ObserverResponse:
         """Executes an Observer command and returns response."""
-        try:
-            if command.action == ObserverAction.PAUSE:
-                return self._pause_flow(command)
-            elif command.action == ObserverAction.RESUME:
-                return self._resume_flow(command)
-            elif command.action == ObserverAction.ADVANCE:
-                return self._advance_flow(command)
-            elif command.action == ObserverAction.QUARANTINE:
-                return self._quarantine_flow(command)
-            elif command.action == ObserverAction.OVERRIDE:
-                return self._override_validation(command)
-            elif command.action == ObserverAction.INSPECT:
-                return self._inspect_state(command)
-            elif command.action == ObserverAction.TRACE:
-                return self._trace_history(command)
-            else:
-                raise ValueError(f"Unknown Observer action: {command.action}")
-
-        except Exception as e:
-            self.logger.error(f"Observer command execution error: {str(e)}")
-            return ObserverResponse(
-                success=False,
-                message=f"Command execution error: {str(e)}",
-                state=self.flow_controller.get_flow_status(),
-                timestamp=datetime.utcnow().isoformat() + 'Z',
-                trace_id=command.trace_id
-            )
-
-    def _pause_flow(self, command: ObserverCommand) -> ObserverResponse:
-        """Pauses the validation flow."""
-        if self.flow_controller.flow_context.state == ValidationFlowState.ACTIVE:
-            self.flow_controller.flow_context.state = ValidationFlowState.PAUSED
-            self._log_command(command, "Flow paused by Observer")
-            return ObserverResponse(
-                success=True,
-                message="Flow paused successfully",
-                state=self.flow_controller.get_flow_status(),
-                timestamp=datetime.utcnow().isoformat() + 'Z',
-                trace_id=command.trace_id
-            )
+        flow = self.flow_controller
+        with self._trace(command):
+            try:
+                flow = self._resolve_flow(command)
+                response = self._dispatch(command, flow)
+                if response.state is _FLOW_STATUS:
+                    response.state = flow.get_flow_status()
+                return response
+
+            except Exception as e:
+                self.logger.error(f"Observer command execution error: {str(e)}")
+                return self._error_response(command, e, flow.get_flow_status())
+
+    def execute_batch(self, commands: List[ObserverCommand]) -> List[ObserverResponse]:
+        """Executes a burst of commands, possibly across flows.
+
+        Commands are grouped per flow and applied in their original order
+        within each flow (so ADVANCE steps run in sequence), one status
+        snapshot is taken per flow after its group, and responses come back
+        in input order. Commands without a trace_id get one derived from
+        the batch so every response can be correlated.
+        """
+        batch_id = datetime.utcnow().strftime('%Y%m%d%H%M%S%f')
+        groups: Dict[str, List[int]] = {}
+        for i, command in enumerate(commands):
+            if not command.trace_id:
+                command.trace_id = f"batch-{batch_id}-{i}"
+            groups.setdefault(command.parameters.get('flow_id', self.flow_controller.flow_id), []).append(i)
+
+        responses: List[Optional[ObserverResponse]] = [None] * len(commands)
+        for flow_id, positions in groups.items():
+            flow = self.flows.get(flow_id)
+            if flow is None:
+                error = KeyError(f"Unknown flow: {flow_id}")
+                for i in positions:
+                    responses[i] = self._error_response(commands[i], error, {})
+                continue
+
+            pending_status = []
+            for i in positions:
+                with self._trace(commands[i]):
+                    try:
+                        response = self._dispatch(commands[i], flow, log=False)
+                    except Exception as e:
+                        self.logger.error(f"Observer command execution error: {str(e)}")
+                        response = self._error_response(commands[i], e, _FLOW_STATUS)
+                if response.state is _FLOW_STATUS:
+                    pending_status.append(response)
+                responses[i] = response
+
+            if pending_status:
+                status = flow.get_flow_status()
+                for response in pending_status:
+                    response.state = status
+
+        self.command_history.extend(commands)
+        self.logger.info(f"Observer Batch: {len(commands)} commands across {len(groups)} flows")
+        return responses
+
+    @contextmanager
+    def _trace(self, command: ObserverCommand) -> Iterator[None]:
+        """Roots a (possibly sampled) trace for one command; parameters['trace'] forces sampling."""
+        name = f"ObserverInterface.{getattr(command.action, 'value', command.action)}"
+        with self.tracer.trace(command.trace_id, name, force=bool(command.parameters.get('trace'))) as trace_id:
+            if trace_id is not None and not command.trace_id:
+                command.trace_id = trace_id
+            yield
+
+    def _resolve_flow(self, command: ObserverCommand) -> ValidationFlowPipeline:
+        flow_id = command.parameters.get('flow_id')
+        if flow_id is None:
+            return self.flow_controller
+        flow = self.flows.get(flow_id)
+        if flow is None:
+            raise KeyError(f"Unknown flow: {flow_id}")
+        return flow
+
+    def _dispatch(self, command: ObserverCommand, flow: ValidationFlowPipeline, log: bool = True) -> ObserverResponse:
+        handler = self._handlers.get(command.action)
+        if handler is None:
+            raise ValueError(f"Unknown Observer action: {command.action}")
+        response, message = handler(command, flow)
+        if log and message:
+            self._log_command(command, message)
+        return response
+
+    def _error_response(self, command: ObserverCommand, error: Exception, state: Dict[str, Any]) -> ObserverResponse:
         return ObserverResponse(
             success=False,
-            message="Cannot pause flow in the current state",
-            state=self.flow_controller.get_flow_status(),
+            message=f"Command execution error: {str(error)}",
+            state=state,
             timestamp=datetime.utcnow().isoformat() + 'Z',
             trace_id=command.trace_id
         )
 
-    def _resume_flow(self, command: ObserverCommand) -> ObserverResponse:
-        """Resumes the validation flow."""
-        if self.flow_controller.flow_context.state == ValidationFlowState.PAUSED:
-            self.flow_controller.flow_context.state = ValidationFlowState.ACTIVE
-            self._log_command(command, "Flow resumed by Observer")
-            return ObserverResponse(
-                success=True,
-                message="Flow resumed successfully",
-                state=self.flow_controller.get_flow_status(),
-                timestamp=datetime.utcnow().isoformat() + 'Z',
-                trace_id=command.trace_id
-            )
+    def _respond(self, command: ObserverCommand, success: bool, message: str, state: Dict[str, Any] = _FLOW_STATUS) -> ObserverResponse:
         return ObserverResponse(
-            success=False,
-            message="Cannot resume flow in the current state",
-            state=self.flow_controller.get_flow_status(),
+            success=success,
+            message=message,
+            state=state,
             timestamp=datetime.utcnow().isoformat() + 'Z',
             trace_id=command.trace_id
         )
 
-    def _advance_flow(self, command: ObserverCommand) -> ObserverResponse:
+    def _pause_flow(self, command: ObserverCommand, flow: ValidationFlowPipeline) -> Tuple[ObserverResponse, str]:
+        """Pauses the validation flow."""
+        if flow.flow_context.state == ValidationFlowState.ACTIVE:
+            flow.flow_context.state = ValidationFlowState.PAUSED
+            self._record_replay(flow, command)
+            return self._respond(command, True, "Flow paused successfully"), "Flow paused by Observer"
+        return self._respond(command, False, "Cannot pause flow in the current state"), ""
+
+    def _resume_flow(self, command: ObserverCommand, flow: ValidationFlowPipeline) -> Tuple[ObserverResponse, str]:
+        """Resumes the validation flow."""
+        if flow.flow_context.state == ValidationFlowState.PAUSED:
+            flow.flow_context.state = ValidationFlowState.ACTIVE
+            self._record_replay(flow, command)
+            return self._respond(command, True, "Flow resumed successfully"), "Flow resumed by Observer"
+        return self._respond(command, False, "Cannot resume flow in the current state"), ""
+
+    def _advance_flow(self, command: ObserverCommand, flow: ValidationFlowPipeline) -> Tuple[ObserverResponse, str]:
         """Advances the flow one step."""
         step_type = command.parameters.get('step_type')
         step_params = command.parameters.get('params', {})
-        result = self.flow_controller.process_validation_step(step_type, step_params)
-        self._log_command(command, f"Flow advanced: {step_type}")
-        return ObserverResponse(
-            success=result,
-            message="Flow step processed successfully" if result else "Flow step failed",
-            state=self.flow_controller.get_flow_status(),
-            timestamp=datetime.utcnow().isoformat() + 'Z',
-            trace_id=command.trace_id
+        result = flow.process_validation_step(step_type, step_params)
+        if not result and getattr(flow.last_result, 'error_code', None) == ErrorCode.SHED:
+            return self._respond(command, False, "Flow step shed under load"), ""
+        return (
+            self._respond(command, result, "Flow step processed successfully" if result else "Flow step failed"),
+            f"Flow advanced: {step_type}"
         )
 
-    def _quarantine_flow(self, command: ObserverCommand) -> ObserverResponse:
+    def _quarantine_flow(self, command: ObserverCommand, flow: ValidationFlowPipeline) -> Tuple[ObserverResponse, str]:
         """Forces flow into quarantine state."""
-        self.flow_controller.flow_context.state = ValidationFlowState.QUARANTINED
-        self._log_command(command, "Flow quarantined")
-        return ObserverResponse(
-            success=True,
-            message="Flow quarantined by Observer",
-            state=self.flow_controller.get_flow_status(),
-            timestamp=datetime.utcnow().isoformat() + 'Z',
-            trace_id=command.trace_id
-        )
+        flow.flow_context.state = ValidationFlowState.QUARANTINED
+        if flow.quarantine_scheduler is not None:
+            # Observer quarantines are not retried automatically
+            flow.quarantine_scheduler.release(flow.flow_id)
+        self._record_replay(flow, command)
+        return self._respond(command, True, "Flow quarantined by Observer"), "Flow quarantined"
 
-    def _override_validation(self, command: ObserverCommand) -> ObserverResponse:
-        """Overrides validation with Observer comment."""
-        override_type = command.parameters.get('type')
-        override_value = command.parameters.get('value')
-        self.active_overrides[override_type] = {
-            'value': override_value,
-            'comment': command.comment,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
-        }
-        self._log_command(command, "Validation overridden")
-        return ObserverResponse(
-            success=True,
-            message="Validation override applied",
-            state=self.flow_controller.get_flow_status(),
-            timestamp=datetime.utcnow().isoformat() + 'Z',
-            trace_id=command.trace_id
-        )
+    def _override_validation(self, command: ObserverCommand, flow: ValidationFlowPipeline) -> Tuple[ObserverResponse, str]:
+        """Overrides validation with Observer comment.
 
-    def _inspect_state(self, command: ObserverCommand) -> ObserverResponse:
-        """Performs a deep inspection of the current state."""
-        state_inspection = self.flow_controller.get_flow_status()
-        self._log_command(command, "State inspected")
-        return ObserverResponse(
-            success=True,
-            message="State inspection complete",
-            state=state_inspection,
-            timestamp=datetime.utcnow().isoformat() + 'Z',
-            trace_id=command.trace_id
+        Applies to the addressed flow only; parameters['scope'] == 'all'
+        overrides the rule for every flow in the process.
+        """
+        rule = command.parameters.get('type')
+        ttl = command.parameters.get('ttl')
+        scope = command.parameters.get('scope', 'flow')
+        if rule not in OVERRIDABLE_RULES:
+            return self._respond(command, False, f"Unknown override type: {rule}"), ""
+        if ttl is not None and (isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or not ttl >= 0):
+            return self._respond(command, False, f"Invalid override ttl: {ttl!r}"), ""
+        if scope not in ('flow', 'all'):
+            return self._respond(command, False, f"Unknown override scope: {scope}"), ""
+
+        self.overrides.add(
+            rule=rule,
+            flow_id=ALL_FLOWS if scope == 'all' else flow.flow_id,
+            value=command.parameters.get('value'),
+            comment=command.comment,
+            ttl=ttl
         )
+        return self._respond(command, True, "Validation override applied"), "Validation overridden"
+
+    def _inspect_state(self, command: ObserverCommand, flow: ValidationFlowPipeline) -> Tuple[ObserverResponse, str]:
+        """Performs a deep inspection of the current state, including estimated memory use."""
+        state = flow.get_flow_status(include_memory=True)
+        state['observer_memory'] = observer_memory(self)
+        return self._respond(command, True, "State inspection complete", state), "State inspected"
 
-    def _trace_history(self, command: ObserverCommand) -> ObserverResponse:
+    def _trace_history(self, command: ObserverCommand, flow: ValidationFlowPipeline) -> Tuple[ObserverResponse, str]:
         """Retrieves the validation history trace."""
         limit = command.parameters.get('limit', 10)
-        history = self.flow_controller.flow_context.validation_history[-limit:]
-        self._log_command(command, "History traced")
-        return ObserverResponse(
-            success=True,
-            message="History trace complete",
-            state={'history': history},
-            timestamp=datetime.utcnow().isoformat() + 'Z',
-            trace_id=command.trace_id
-        )
+        entries = flow.flow_context.validation_history
+        start = max(len(entries) - limit, 0)
+        # Entries past the flow's retain_results window only keep their codes
+        history = [
+            entry if entry['result'] is not None else dict(entry, result=flow.result_columns.row(entry['column']))
+            for entry in islice(entries, start, None)
+        ]
+        return self._respond(command, True, "History trace complete", {'history': history}), "History traced"
+
+    def _inspect_at_time(self, command: ObserverCommand, flow: ValidationFlowPipeline) -> Tuple[ObserverResponse, str]:
+        """Reconstructs the flow state at a past timestamp ('at') or event index ('event_index')."""
+        replay_log = getattr(flow, 'replay_log', None)
+        if replay_log is None or not len(replay_log):
+            return self._respond(command, False, "No replay log recorded for this flow", {}), ""
+        tail = command.parameters.get('tail')
+        if 'event_index' in command.parameters:
+            state = replay_log.state_at(int(command.parameters['event_index']), tail)
+        else:
+            state = replay_log.state_at_time(command.parameters['at'], tail)
+            if state is None:
+                return self._respond(command, False, "Requested time predates the flow's oldest retained event", {}), ""
+        return self._respond(command, True, "Historical state reconstructed", state), f"State inspected at event {state['event_index']}"
+
+    def _record_replay(self, flow: ValidationFlowPipeline, command: ObserverCommand) -> None:
+        """Notes an Observer-driven state change in the flow's replay log."""
+        if getattr(flow, 'replay_log', None) is not None:
+            flow.replay_log.record(flow, f"observer_{command.action.value}")
 
     def _log_command(self, command: ObserverCommand, message: str) -> None:
         """Logs the observer command execution."""
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime
+
+ALL_FLOWS = "*"
+# Rules validators consult via is_overridden()
+OVERRIDABLE_RULES = frozenset({
+    "prime_sequence", "field_address", "gate_transition",
+    "prime_spatial", "gate_temporal", "spatial_gate",
+})
+
+class TimerWheel:
+    """Hierarchical timing wheel: O(1) schedule/cancel, expiry without scanning live timers.
+
+    Level 0 has `slots` buckets of one tick each; every higher level covers
+    `slots` times the span of the one below and is cascaded down as the
+    lower level wraps.
+    """
+
+    def __init__(self, tick: float = 1.0, slot_bits: int = 6, levels: int = 4, clock: Callable[[], float] = time.monotonic):
+        self.tick = tick
+        self.slot_bits = slot_bits
+        self.slots = 1 << slot_bits
+        self.levels = levels
+        self.clock = clock
+        self.current = int(clock() / tick)
+        self._wheels: List[List[Dict[Hashable, int]]] = [
+            [{} for _ in range(self.slots)] for _ in range(levels)
+        ]
+        # key -> (expiry tick, level, slot) of its current placement
+        self._deadlines: Dict[Hashable, Tuple[int, int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """Schedules (or reschedules) `key` to expire at the monotonic time `deadline`."""
+        self.cancel(key)
+        self._place(key, max(int(-(-deadline // self.tick)), self.current + 1))
+
+    def cancel(self, key: Hashable) -> None:
+        placement = self._deadlines.pop(key, None)
+        if placement is not None:
+            _, level, slot = placement
+            self._wheels[level][slot].pop(key, None)
+
+    def advance(self, now: Optional[float] = None) -> List[Hashable]:
+        """Moves the wheel to `now` and returns the keys that expired."""
+        target = int((self.clock() if now is None else now) / self.tick)
+        expired: List[Hashable] = []
+        if not self._deadlines:
+            self.current = max(self.current, target)
+            return expired
+        while self.current < target and self._deadlines:
+            self.current += 1
+            self._cascade()
+            bucket = self._wheels[0][self.current & (self.slots - 1)]
+            if bucket:
+                for key in list(bucket):
+                    del bucket[key]
+                    del self._deadlines[key]
+                    expired.append(key)
+        self.current = max(self.current, target)
+        return expired
+
+    def _cascade(self) -> None:
+        for level in range(1, self.levels):
+            if self.current & ((1 << (self.slot_bits * level)) - 1):
+                return
+            slot = (self.current >> (self.slot_bits * level)) & (self.slots - 1)
+            bucket = self._wheels[level][slot]
+            if bucket:
+                self._wheels[level][slot] = {}
+                for key, expiry in bucket.items():
+                    self._place(key, expiry)
+
+    def _slot_for(self, expiry: int) -> Tuple[int, int]:
+        delta = expiry - self.current
+        for level in range(self.levels):
+            if delta < (1 << (self.slot_bits * (level + 1))) or level == self.levels - 1:
+                span = self.slot_bits * level
+                if level == self.levels - 1 and delta >= (1 << (self.slot_bits * self.levels)):
+                    # Beyond the wheel's horizon: park in the furthest slot and re-cascade later
+                    expiry = self.current + (1 << (self.slot_bits * self.levels)) - 1
+                return level, (expiry >> span) & (self.slots - 1)
+        raise AssertionError("unreachable")
+
+    def _place(self, key: Hashable, expiry: int) -> None:
+        level, slot = self._slot_for(expiry)
+        self._wheels[level][slot][key] = expiry
+        self._deadlines[key] = (expiry, level, slot)
+
+@dataclass
+class OverrideEntry:
+    rule: str
+    flow_id: str
+    value: Any
+    comment: str
+    created: str
+    expires_at: Optional[float] = None
+
+class OverrideRegistry:
+    """Observer overrides keyed by (rule, flow_id), consulted by validators per check.
+
+    is_overridden() is a single truthiness test while no override exists,
+    so the validation hot path pays nothing in the common case.
+    """
+
+    def __init__(self, tick: float = 1.0, audit_size: int = 1000, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.stats = {'added': 0, 'removed': 0, 'expired': 0, 'hits': 0}
+        self.audit_log: Deque[Tuple[str, str, str, str]] = deque(maxlen=audit_size)
+
+        self._entries: Dict[Tuple[str, str], OverrideEntry] = {}
+        self._wheel = TimerWheel(tick=tick, clock=clock)
+        self._next_tick = float('inf')
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger("OverrideRegistry")
+
+    def add(
+        self,
+        rule: str,
+        flow_id: str = ALL_FLOWS,
+        value: Any = True,
+        comment: str = "",
+        ttl: Optional[float] = None
+    ) -> OverrideEntry:
+        """Overrides `rule` for one flow (or ALL_FLOWS), optionally expiring after `ttl` seconds."""
+        key = (rule, flow_id)
+        entry = OverrideEntry(
+            rule=rule,
+            flow_id=flow_id,
+            value=value,
+            comment=comment,
+            created=datetime.utcnow().isoformat() + 'Z',
+            expires_at=self.clock() + ttl if ttl is not None else None
+        )
+        with self._lock:
+            self._entries[key] = entry
+            if entry.expires_at is None:
+                self._wheel.cancel(key)
+            else:
+                self._wheel.schedule(key, entry.expires_at)
+                self._next_tick = min(self._next_tick, entry.expires_at)
+            self.stats['added'] += 1
+            self._audit("added", key)
+        return entry
+
+    def remove(self, rule: str, flow_id: str = ALL_FLOWS) -> bool:
+        """Removes an override before it expires."""
+        key = (rule, flow_id)
+        with self._lock:
+            if self._entries.pop(key, None) is None:
+                return False
+            self._wheel.cancel(key)
+            self.stats['removed'] += 1
+            self._audit("removed", key)
+            return True
+
+    def is_overridden(self, rule: str, flow_id: str) -> bool:
+        """O(1) check whether validation of `rule` is overridden for `flow_id`."""
+        if not self._entries:
+            return False
+        if self._next_tick <= self.clock():
+            self.expire()
+        if (rule, flow_id) in self._entries or (rule, ALL_FLOWS) in self._entries:
+            self.stats['hits'] += 1
+            return True
+        return False
+
+    def expire(self) -> int:
+        """Drops overrides whose TTL has passed. Returns how many expired."""
+        with self._lock:
+            expired = self._wheel.advance()
+            for key in expired:
+                if self._entries.pop(key, None) is not None:
+                    self.stats['expired'] += 1
+                    self._audit("expired", key)
+            self._next_tick = (self._wheel.current + 1) * self._wheel.tick if len(self._wheel) else float('inf')
+            return len(expired)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Active overrides in the Observer API's active_overrides shape."""
+        if self._entries:
+            self.expire()
+        return {
+            (rule if flow_id == ALL_FLOWS else f"{rule}@{flow_id}"): {
+                'value': entry.value,
+                'comment': entry.comment,
+                'timestamp': entry.created,
+                'expires_in': None if entry.expires_at is None else max(0.0, entry.expires_at - self.clock())
+            }
+            for (rule, flow_id), entry in list(self._entries.items())
+        }
+
+    def _audit(self, event: str, key: Tuple[str, str]) -> None:
+        self.audit_log.append((datetime.utcnow().isoformat() + 'Z', event, key[0], key[1]))
+        self.logger.info(f"Override {event}: {key[0]} (flow {key[1]})")
+
+_default_registry = OverrideRegistry()
+
+def get_override_registry() -> OverrideRegistry:
+    """Returns the process-wide override registry shared by validators and the Observer."""
+    return _default_registry
+
+if __name__ == "__main__":
+    # Lookup overhead benchmark
+    import timeit
+
+    registry = OverrideRegistry()
+    runs = 1000000
+    empty = timeit.timeit(lambda: registry.is_overridden("prime_sequence", "flow-1"), number=runs)
+    baseline = timeit.timeit(lambda: None, number=runs)
+    print(f"No overrides: {(empty - baseline) / runs * 1e9:.0f}ns per lookup over call overhead")
+
+    for i in range(10000):
+        registry.add("gate_transition", f"flow-{i}", ttl=60 + i % 3600)
+    populated = timeit.timeit(lambda: registry.is_overridden("prime_sequence", "flow-1"), number=runs)
+    print(f"10k overrides with TTLs: {(populated - baseline) / runs * 1e9:.0f}ns per lookup over call overhead")
+
+    clock = [0.0]
+    registry = OverrideRegistry(clock=lambda: clock[0])
+    registry.add("field_address", "flow-1", ttl=5)
+    registry.add("gate_transition", ttl=5000)
+    for clock[0] in (4.0, 6.0, 5001.0):
+        print(f"t={clock[0]:g}s field_address={registry.is_overridden('field_address', 'flow-1')} "
+              f"gate_transition={registry.is_overridden('gate_transition', 'flow-2')}")
+    print(f"Audit counters: {registry.stats}")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+from array import array
+from bisect import bisect_left
+from operator import itemgetter
+from typing import Iterable, Sequence
+
+# Above this value a bitset costs more memory than a sorted array is worth
+BITSET_LIMIT = 1 << 22
+
+class PrimeAlignmentIndex:
+    """Membership index over a prime sequence: a bitset for small values, else a sorted array.
+
+    The index keeps its own snapshot of the sequence, so a caller's list
+    that is later changed in place can never be answered from a stale index.
+    """
+
+    __slots__ = ('sequence', 'length', 'last', '_bits', '_sorted')
+
+    def __init__(self, sequence: Sequence[int]):
+        self.sequence = tuple(sequence)
+        self.length = len(self.sequence)
+        self.last = self.sequence[-1] if self.length else None
+        self._bits = None
+        self._sorted = None
+
+        largest = max(self.sequence) if self.length else 0
+        if 0 <= min(self.sequence, default=0) and largest < BITSET_LIMIT:
+            bits = bytearray(largest + 1)
+            for value in self.sequence:
+                bits[value] = 1
+            self._bits = bytes(bits)
+        else:
+            self._sorted = array('q', sorted(set(self.sequence)))
+
+    def matches(self, sequence: Sequence[int]) -> bool:
+        """True if `sequence` has the same contents as the indexed snapshot.
+
+        Length and last element reject most changes cheaply; the full
+        comparison runs in C and also catches elements overwritten in place.
+        """
+        if len(sequence) != self.length or (sequence[-1] if self.length else None) != self.last:
+            return False
+        return (sequence if isinstance(sequence, tuple) else tuple(sequence)) == self.sequence
+
+    def __contains__(self, value: int) -> bool:
+        if self._bits is not None:
+            return 0 <= value < len(self._bits) and self._bits[value] == 1
+        i = bisect_left(self._sorted, value)
+        return i < len(self._sorted) and self._sorted[i] == value
+
+    def contains_many(self, values: Iterable[int]) -> bytes:
+        """Membership for many values as one byte each (1 = member).
+
+        With a bitset the lookups run as one C-level gather; values past
+        the largest prime are covered by padding the bitset for the call.
+        """
+        values = values if isinstance(values, (list, tuple, array)) else list(values)
+        bits = self._bits
+        if bits is not None and len(values) > 1 and min(values) >= 0:
+            largest = max(values)
+            if largest < BITSET_LIMIT:
+                if largest >= len(bits):
+                    bits = bits + bytes(largest + 1 - len(bits))
+                return bytes(itemgetter(*values)(bits))
+        return bytes(map(self.__contains__, values))
+
+if __name__ == "__main__":
+    # Example usage
+    import time
+
+    limit = 300000
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b"\x00\x00"
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytearray(len(sieve[i * i::i]))
+    primes = [i for i in range(limit) if sieve[i]]
+
+    started = time.perf_counter()
+    index = PrimeAlignmentIndex(primes)
+    built = time.perf_counter() - started
+    nodes = list(range(100000))
+    started = time.perf_counter()
+    aligned = sum(index.contains_many(nodes))
+    print(f"{len(primes)} primes indexed in {built * 1000:.1f}ms; "
+          f"{aligned} of {len(nodes)} nodes aligned in {(time.perf_counter() - started) * 1000:.1f}ms")
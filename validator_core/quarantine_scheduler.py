@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from .concurrency import TokenBucket
+from .error_codes import AlertLevel
+
+@dataclass
+class QuarantinePolicy:
+    base_delay: float = 1.0       # seconds before the first retry
+    multiplier: float = 2.0       # backoff growth per failed retry
+    max_delay: float = 300.0
+    jitter: float = 0.1           # +/- fraction applied to each delay
+    max_attempts: int = 10        # failed retries before the flow is left for the Observer
+    max_workers: int = 4
+    max_rate: float = 20.0        # revalidations per second across all flows
+    burst: float = 5.0
+
+    def delay(self, attempts: int) -> float:
+        """Backoff before retry number `attempts` + 1."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** attempts)
+        if self.jitter:
+            delay *= 1.0 + random.uniform(-self.jitter, self.jitter)
+        return delay
+
+@dataclass
+class QuarantineEntry:
+    flow: Any
+    severity: AlertLevel
+    attempts: int
+    next_retry: float
+    quarantined_at: float
+    seq: int = 0
+    in_flight: bool = False
+
+class QuarantineScheduler:
+    """Automated, resource-bounded recovery of QUARANTINED flows.
+
+    Flows wait in a heap keyed by next-retry time; once due they move to a
+    ready heap keyed by severity (most severe first), from which a bounded
+    worker pool calls flow.revalidate(), which takes the flow's own lock
+    so it never interleaves with live steps on that flow. A global token
+    bucket caps the revalidation rate so a recovery storm cannot starve
+    live validation.
+    """
+
+    def __init__(self, policy: Optional[QuarantinePolicy] = None, clock: Callable[[], float] = time.monotonic):
+        self.policy = policy or QuarantinePolicy()
+        self.clock = clock
+        self.stats = {
+            'quarantined': 0,
+            'attempts': 0,
+            'recovered': 0,
+            'retried': 0,
+            'exhausted': 0,
+            'released': 0,
+            'throttled': 0,
+            'errors': 0
+        }
+
+        self._entries: Dict[str, QuarantineEntry] = {}
+        self._waiting: List[Tuple[float, int, str]] = []
+        self._ready: List[Tuple[int, float, int, str]] = []
+        self._seq = itertools.count()
+        self._bucket = TokenBucket(self.policy.max_rate, self.policy.burst, clock)
+        self._slots = threading.Semaphore(self.policy.max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._wakeup = threading.Condition(threading.Lock())
+        self.logger = logging.getLogger("QuarantineScheduler")
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]], clock: Callable[[], float] = time.monotonic) -> "QuarantineScheduler":
+        """Builds a scheduler from the quarantine_recovery section of a validator config."""
+        settings = (config or {}).get('quarantine_recovery') or {}
+        defaults = QuarantinePolicy()
+        policy = QuarantinePolicy(**{
+            name: settings.get(name, getattr(defaults, name))
+            for name in defaults.__dataclass_fields__
+        })
+        return cls(policy, clock)
+
+    def track(self, flow: Any) -> None:
+        """Hands the flow's future quarantines to this scheduler."""
+        flow.quarantine_scheduler = self
+        if flow.flow_context.state.value == "quarantined":
+            self.quarantine(flow)
+
+    def untrack(self, flow: Any) -> None:
+        """Stops recovering a flow."""
+        if getattr(flow, 'quarantine_scheduler', None) is self:
+            flow.quarantine_scheduler = None
+        self.release(flow.flow_id)
+
+    def quarantine(self, flow: Any, severity: AlertLevel = AlertLevel.HIGH) -> None:
+        """Queues a flow that just entered QUARANTINED; repeats only raise its severity."""
+        severity = AlertLevel(severity)
+        with self._wakeup:
+            entry = self._entries.get(flow.flow_id)
+            if entry is not None:
+                if severity > entry.severity:
+                    entry.severity = severity
+                    if not entry.in_flight:
+                        self._push(entry)
+                return
+            now = self.clock()
+            entry = self._entries[flow.flow_id] = QuarantineEntry(
+                flow=flow,
+                severity=severity,
+                attempts=0,
+                next_retry=now + self.policy.delay(0),
+                quarantined_at=now
+            )
+            self._push(entry)
+            self.stats['quarantined'] += 1
+            self._wakeup.notify()
+
+    def release(self, flow_id: str) -> bool:
+        """Drops a flow from the queue, e.g. after a manual Observer action."""
+        with self._wakeup:
+            entry = self._entries.pop(flow_id, None)
+            if entry is None:
+                return False
+            self.stats['released'] += 1
+            return True
+
+    def pending(self) -> int:
+        """Number of flows awaiting recovery."""
+        return len(self._entries)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Queued flows in retry order, for Observer inspection."""
+        now = self.clock()
+        with self._wakeup:
+            entries = sorted(self._entries.items(), key=lambda item: item[1].next_retry)
+            return [
+                {
+                    'flow_id': flow_id,
+                    'severity': entry.severity.label,
+                    'attempts': entry.attempts,
+                    'retry_in': max(0.0, entry.next_retry - now),
+                    'in_flight': entry.in_flight
+                }
+                for flow_id, entry in entries
+            ]
+
+    def dispatch(self, now: Optional[float] = None, wait: bool = False) -> int:
+        """Submits due flows to the worker pool within the rate cap. Returns how many were submitted."""
+        now = self.clock() if now is None else now
+        submitted = 0
+        with self._wakeup:
+            while self._waiting and self._waiting[0][0] <= now:
+                _, seq, flow_id = heapq.heappop(self._waiting)
+                entry = self._entries.get(flow_id)
+                if entry is not None and entry.seq == seq and not entry.in_flight:
+                    heapq.heappush(self._ready, (-entry.severity, entry.next_retry, seq, flow_id))
+
+            while self._ready:
+                _, _, seq, flow_id = self._ready[0]
+                entry = self._entries.get(flow_id)
+                if entry is None or entry.seq != seq or entry.in_flight:
+                    heapq.heappop(self._ready)
+                    continue
+                if not self._slots.acquire(blocking=False):
+                    break
+                if not self._bucket.allow(now):
+                    self._slots.release()
+                    self.stats['throttled'] += 1
+                    break
+                heapq.heappop(self._ready)
+                entry.in_flight = True
+                self.stats['attempts'] += 1
+                submitted += 1
+                if wait:
+                    self._wakeup.release()
+                    try:
+                        self._revalidate(flow_id, entry)
+                    finally:
+                        self._wakeup.acquire()
+                else:
+                    self._pool().submit(self._revalidate, flow_id, entry)
+        return submitted
+
+    def start(self) -> None:
+        """Dispatches due revalidations from a background thread."""
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="QuarantineScheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops dispatching and waits for in-flight revalidations."""
+        self._stopping.set()
+        with self._wakeup:
+            self._wakeup.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                self.dispatch()
+            except Exception as e:
+                self.logger.error(f"Quarantine dispatch error: {str(e)}")
+            with self._wakeup:
+                if self._stopping.is_set():
+                    break
+                self._wakeup.wait(self._next_wakeup())
+
+    def _next_wakeup(self) -> float:
+        # Called with the lock held
+        if self._ready:
+            # Waiting on a worker slot or a rate token
+            return max(1.0 / max(self.policy.max_rate, 1e-6), 0.001)
+        if self._waiting:
+            return max(self._waiting[0][0] - self.clock(), 0.0)
+        return 1.0
+
+    def _revalidate(self, flow_id: str, entry: QuarantineEntry) -> None:
+        try:
+            flow = entry.flow
+            recovered = False
+            if flow.flow_context.state.value != "quarantined":
+                # Recovered through live traffic or an Observer action in the meantime
+                recovered = True
+            else:
+                try:
+                    recovered = bool(flow.revalidate())
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    self.logger.error(f"Revalidation error for flow {flow_id}: {str(e)}")
+
+            with self._wakeup:
+                entry.in_flight = False
+                self._wakeup.notify()
+                if self._entries.get(flow_id) is not entry:
+                    return
+                if recovered:
+                    del self._entries[flow_id]
+                    self.stats['recovered'] += 1
+                    self.logger.info(
+                        f"Flow {flow_id} recovered from quarantine after {entry.attempts + 1} attempt(s)"
+                    )
+                    return
+                entry.attempts += 1
+                if entry.attempts >= self.policy.max_attempts:
+                    del self._entries[flow_id]
+                    self.stats['exhausted'] += 1
+                    self.logger.warning(
+                        f"Flow {flow_id} still quarantined after {entry.attempts} revalidations; "
+                        f"leaving it for the Observer"
+                    )
+                    return
+                entry.next_retry = self.clock() + self.policy.delay(entry.attempts)
+                self._push(entry)
+                self.stats['retried'] += 1
+        finally:
+            self._slots.release()
+
+    def _push(self, entry: QuarantineEntry) -> None:
+        # Called with the lock held; older heap items for the flow go stale via seq
+        entry.seq = next(self._seq)
+        heapq.heappush(self._waiting, (entry.next_retry, entry.seq, entry.flow.flow_id))
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.policy.max_workers,
+                thread_name_prefix="QuarantineRevalidation"
+            )
+        return self._executor
+
+if __name__ == "__main__":
+    # Recovery storm: 2000 quarantined flows, a third of which recover per attempt
+    from types import SimpleNamespace
+    from enum import Enum
+
+    class _State(Enum):
+        ACTIVE = "active"
+        QUARANTINED = "quarantined"
+
+    class _Flow:
+        def __init__(self, flow_id: str):
+            self.flow_id = flow_id
+            self.flow_context = SimpleNamespace(state=_State.QUARANTINED)
+            self.quarantine_scheduler = None
+
+        def revalidate(self) -> bool:
+            time.sleep(0.001)
+            if random.random() < 1 / 3:
+                self.flow_context.state = _State.ACTIVE
+                return True
+            return False
+
+    logging.getLogger("QuarantineScheduler").setLevel(logging.ERROR)
+    scheduler = QuarantineScheduler(QuarantinePolicy(
+        base_delay=0.05, max_delay=0.5, max_attempts=8, max_workers=4, max_rate=1000, burst=50
+    ))
+    flows = [_Flow(f"flow-{i}") for i in range(2000)]
+    for i, flow in enumerate(flows):
+        scheduler.track(flow)
+        scheduler.quarantine(flow, AlertLevel.CRITICAL if i % 10 == 0 else AlertLevel.HIGH)
+
+    started = time.monotonic()
+    scheduler.start()
+    while scheduler.pending() and time.monotonic() - started < 30:
+        time.sleep(0.1)
+    scheduler.stop()
+    elapsed = time.monotonic() - started
+    print(f"Drained in {elapsed:.2f}s: {scheduler.stats['attempts'] / elapsed:.0f} revalidations/s (cap 1000)")
+    print(f"Scheduler stats: {scheduler.stats}")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from .error_codes import AlertLevel, ErrorCode
+
+class ResultColumns:
+    """Columnar store of result codes and alert levels as one byte each.
+
+    Rows are addressed by absolute index: `base` is the index of the first
+    stored row and only moves forward, so an index handed out by append()
+    never points at a different result later.
+    """
+
+    def __init__(self):
+        self.codes = array('B')
+        self.levels = array('B')
+        self.valid = array('B')
+        self.base = 0
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def append(self, result: Any) -> int:
+        """Appends a ValidationResult or CoherenceResult and returns its absolute index."""
+        self.codes.append(result.error_code)
+        self.levels.append(result.alert_level)
+        self.valid.append(self._is_ok(result))
+        return self.base + len(self.codes) - 1
+
+    def append_code(self, error_code: ErrorCode, alert_level: AlertLevel, is_ok: bool) -> None:
+        """Appends a result given as its codes, for batch APIs that never build result objects."""
+        self.codes.append(error_code)
+        self.levels.append(alert_level)
+        self.valid.append(is_ok)
+
+    def extend(self, results: Iterable[Any]) -> None:
+        """Appends many results."""
+        for result in results:
+            self.append(result)
+
+    def row(self, index: int) -> Optional[Dict[str, Any]]:
+        """The stored codes of the result at an absolute index, or None once it was dropped."""
+        position = index - self.base
+        if not 0 <= position < len(self.codes):
+            return None
+        return {
+            'error_code': ErrorCode(self.codes[position]),
+            'alert_level': AlertLevel(self.levels[position]),
+            'is_valid': bool(self.valid[position])
+        }
+
+    def compact_history(self, history: Sequence[Dict[str, Any]], retain: int) -> None:
+        """Drops the result object from the history entry `retain` places back.
+
+        Called after each append, so only the newest `retain` entries keep
+        full result objects; older ones keep their codes here, found through
+        the entry's 'column' index via row(). Once a bounded history (a
+        deque with maxlen) has evicted entries, the rows before its oldest
+        entry are dropped too, in batches of maxlen.
+        """
+        index = len(history) - retain - 1
+        if index >= 0:
+            history[index]['result'] = None
+        maxlen = getattr(history, 'maxlen', None)
+        if maxlen and len(self.codes) >= 2 * maxlen:
+            self.trim(history[0]['column'])
+
+    def trim(self, keep_from: int) -> None:
+        """Drops the rows before absolute index `keep_from`."""
+        drop = keep_from - self.base
+        if drop > 0:
+            del self.codes[:drop]
+            del self.levels[:drop]
+            del self.valid[:drop]
+            self.base = keep_from
+
+    def indices_at_least(self, level: AlertLevel) -> List[int]:
+        """Returns the absolute indexes of results at or above the given severity."""
+        threshold = int(level)
+        return [i for i, lvl in enumerate(self.levels, self.base) if lvl >= threshold]
+
+    def count_at_least(self, level: AlertLevel) -> int:
+        """Counts results at or above the given severity."""
+        threshold = int(level)
+        return sum(1 for lvl in self.levels if lvl >= threshold)
+
+    def code_counts(self) -> Dict[ErrorCode, int]:
+        """Counts failures per error code."""
+        return {ErrorCode(code): n for code, n in Counter(self.codes).items() if code}
+
+    def clear(self) -> None:
+        """Drops all stored results; their indexes are never reused."""
+        self.base += len(self.codes)
+        del self.codes[:]
+        del self.levels[:]
+        del self.valid[:]
+
+    @staticmethod
+    def _is_ok(result: Any) -> bool:
+        if hasattr(result, 'is_valid'):
+            return bool(result.is_valid)
+        return bool(getattr(result, 'is_coherent', False))
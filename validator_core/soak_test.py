@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+
+import gc
+import logging
+import os
+import resource
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set
+from .config_cache import configure_logging, load_config
+from .flow_controller import ValidationFlowController, FlowState
+from .validation_flow import ValidationFlowPipeline
+from .observer_interface import ObserverInterface, ObserverCommand, ObserverAction
+from .memory_accounting import flow_memory, observer_memory
+
+_DOMAINS = ('OBI-WAN', 'BERJAK', 'INFINITY')
+
+@dataclass
+class SoakBounds:
+    max_rss_growth_mb: float = 96.0
+    max_traced_growth_mb: float = 48.0
+    max_bytes_per_event: float = 32.0    # traced growth per recorded flow event or command
+    max_failed_steps: int = 0            # synthetic steps are all valid, so any failure is a regression
+
+@dataclass
+class SoakSample:
+    elapsed: float
+    events: int
+    rss: int
+    traced: int
+    structures: Dict[str, int]
+
+@dataclass
+class SoakReport:
+    passed: bool
+    violations: List[str]
+    duration: float
+    cycles: int
+    failed_steps: int
+    restarts: int
+    events: int
+    rss_growth: int
+    traced_growth: int
+    bytes_per_event: float
+    structure_growth: Dict[str, int]
+    samples: List[SoakSample] = field(default_factory=list)
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes (peak RSS where /proc is unavailable)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+class SoakHarness:
+    """Drives long-running synthetic flows and fails when memory grows past configured bounds.
+
+    Each cycle moves every flow across the three domains with the gate its
+    validator accepts next, updates its field coordinates and advances an
+    Observer-managed pipeline; every step is expected to pass. RSS,
+    tracemalloc and per-structure estimates are sampled periodically;
+    growth is measured from the first sample after warmup.
+
+    Structure estimates share one `seen` set per sample, so objects
+    referenced from several structures are charged to the first one
+    walked. They cover objects allocated before tracing started, so only
+    their growth, not their level, is comparable with tracemalloc.
+    """
+
+    def __init__(
+        self,
+        config_path: str,
+        flows: int = 4,
+        bounds: Optional[SoakBounds] = None,
+        sample_interval: float = 10.0,
+        warmup: float = 0.5,
+        step_rate: float = 0.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.config_path = config_path
+        self.bounds = bounds or SoakBounds()
+        self.sample_interval = sample_interval
+        self.warmup = warmup
+        self.step_rate = step_rate
+        self.clock = clock
+        self.stats = {'cycles': 0, 'failed_steps': 0, 'restarts': 0}
+
+        self.initial_context = {
+            'domain': _DOMAINS[0],
+            'prime_sequence': [2, 3, 5, 7, 11],
+            'coordinates': {'latitude': 'FIELD/node-1/003', 'longitude': 'OBI-WAN/soak', 'temporal': '20250101000000Z'}
+        }
+        self.flows = [ValidationFlowController(config_path, f"soak-{i}") for i in range(flows)]
+        for flow in self.flows:
+            flow.begin_validation_flow(self.initial_context)
+        self.gate_sequence = load_config(config_path).gate_sequence
+
+        self.pipeline = ValidationFlowPipeline(config_path, "soak-observer")
+        self.pipeline.initialize_flow({'domain': _DOMAINS[0], 'prime_sequence': [2, 3, 5, 7, 11]})
+        self.observer = ObserverInterface(self.pipeline)
+        for flow in self.flows:
+            self.observer.register_flow(flow.flow_id, flow)
+
+        configure_logging()
+        self.logger = logging.getLogger("SoakHarness")
+
+    @classmethod
+    def from_config(cls, config_path: str, **overrides: Any) -> "SoakHarness":
+        """Builds a harness from the soak_test section of a validator config."""
+        settings = dict(load_config(config_path).config.get('soak_test') or {})
+        settings.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(
+            config_path,
+            flows=settings.get('flows', 4),
+            bounds=SoakBounds(
+                max_rss_growth_mb=settings.get('max_rss_growth_mb', 96.0),
+                max_traced_growth_mb=settings.get('max_traced_growth_mb', 48.0),
+                max_bytes_per_event=settings.get('max_bytes_per_event', 32.0),
+                max_failed_steps=settings.get('max_failed_steps', 0)
+            ),
+            sample_interval=settings.get('sample_interval', 10.0),
+            warmup=settings.get('warmup', 0.5),
+            step_rate=settings.get('step_rate', 0.0)
+        )
+
+    def run(self, duration: float) -> SoakReport:
+        """Soaks for `duration` seconds and checks growth against the bounds."""
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        try:
+            samples = [self._sample(0.0)]
+            started = self.clock()
+            next_sample = started + self.sample_interval
+            pace = 1.0 / self.step_rate if self.step_rate > 0 else 0.0
+            cycle = 0
+            while True:
+                now = self.clock()
+                if now - started >= duration:
+                    break
+                self._cycle(cycle)
+                cycle += 1
+                if now >= next_sample:
+                    samples.append(self._sample(now - started))
+                    next_sample = now + self.sample_interval
+                    self.logger.info(
+                        f"Soak sample: {samples[-1].elapsed:.0f}s, {samples[-1].events} events, "
+                        f"RSS {samples[-1].rss / 2 ** 20:.1f}MiB, traced {samples[-1].traced / 2 ** 20:.1f}MiB"
+                    )
+                if pace:
+                    time.sleep(max(0.0, started + cycle * pace - self.clock()))
+            samples.append(self._sample(self.clock() - started))
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+        return self._evaluate(samples, self.clock() - started)
+
+    def _cycle(self, cycle: int) -> None:
+        """One domain round trip and coordinate update per flow, plus one Observer-driven step."""
+        temporal = f"{20250101000000 + cycle % 1000000:014d}Z"
+        for flow in self.flows:
+            for i in range(len(_DOMAINS)):
+                target = _DOMAINS[(cycle + i + 1) % len(_DOMAINS)]
+                self._step(flow, flow.process_gate_transition(self._next_gate(flow.validator), target))
+            self._step(flow, flow.update_field_coordinates({
+                'latitude': f"FIELD/node-{cycle % 64}/003",
+                'longitude': 'OBI-WAN/soak',
+                'temporal': temporal
+            }))
+        response = self.observer.execute_command(ObserverCommand(
+            action=ObserverAction.ADVANCE,
+            parameters={'step_type': 'gate_transition', 'params': {
+                'gate': self._next_gate(self.pipeline.validator),
+                'from_domain': _DOMAINS[0],
+                'to_domain': _DOMAINS[1]
+            }},
+            timestamp=datetime.utcnow().isoformat() + 'Z'
+        ))
+        if not response.success or not self.pipeline.last_result.is_valid:
+            self.stats['failed_steps'] += 1
+        self.stats['cycles'] += 1
+
+    def _next_gate(self, validator: Any) -> str:
+        """The gate the validator's sequence check accepts next."""
+        history = validator.validation_state['active_gates']
+        if not history:
+            return self.gate_sequence[0]
+        return self.gate_sequence[(self.gate_sequence.index(history[-1]) + 1) % len(self.gate_sequence)]
+
+    def _step(self, flow: ValidationFlowController, result: Any) -> None:
+        if result.is_valid:
+            return
+        self.stats['failed_steps'] += 1
+        if self.stats['failed_steps'] <= 3:
+            self.logger.warning(f"Soak step failed on {flow.flow_id}: {result.error_code} - {result.error_message}")
+        if flow.flow_context.state != FlowState.ACTIVE:
+            # Keep the run going so memory is still measured; the failure is reported
+            flow.begin_validation_flow(self.initial_context)
+            self.stats['restarts'] += 1
+
+    def _events(self) -> int:
+        # Histories are bounded, so count revisions (one per recorded event) and the one command per cycle
+        return sum(flow.revision for flow in self.flows + [self.pipeline]) + self.stats['cycles']
+
+    def _sample(self, elapsed: float) -> SoakSample:
+        gc.collect()
+        structures: Dict[str, int] = {}
+        seen: Set[int] = set()
+        for flow in self.flows + [self.pipeline]:
+            for name, size in flow_memory(flow, seen=seen).items():
+                if name != 'total':
+                    structures[name] = structures.get(name, 0) + size
+        for name, size in observer_memory(self.observer, seen=seen).items():
+            if name != 'total':
+                structures[name] = structures.get(name, 0) + size
+        return SoakSample(elapsed, self._events(), current_rss(), tracemalloc.get_traced_memory()[0], structures)
+
+    def _evaluate(self, samples: List[SoakSample], duration: float) -> SoakReport:
+        # Growth is measured from the first sample past warmup
+        cutoff = duration * self.warmup
+        measured = [sample for sample in samples if sample.elapsed >= cutoff] or samples[-1:]
+        if len(measured) < 2:
+            measured = samples[-2:]
+        base, last = measured[0], measured[-1]
+
+        # Least-squares slope of traced bytes against events
+        slope = 0.0
+        if len(measured) >= 2:
+            n = len(measured)
+            mean_x = sum(s.events for s in measured) / n
+            mean_y = sum(s.traced for s in measured) / n
+            var = sum((s.events - mean_x) ** 2 for s in measured)
+            if var:
+                slope = sum((s.events - mean_x) * (s.traced - mean_y) for s in measured) / var
+
+        rss_growth = last.rss - base.rss
+        traced_growth = last.traced - base.traced
+        violations = []
+        if rss_growth > self.bounds.max_rss_growth_mb * 2 ** 20:
+            violations.append(f"RSS grew {rss_growth / 2 ** 20:.1f}MiB (bound {self.bounds.max_rss_growth_mb}MiB)")
+        if traced_growth > self.bounds.max_traced_growth_mb * 2 ** 20:
+            violations.append(f"Traced memory grew {traced_growth / 2 ** 20:.1f}MiB (bound {self.bounds.max_traced_growth_mb}MiB)")
+        if slope > self.bounds.max_bytes_per_event:
+            violations.append(f"Memory grows {slope:.0f} bytes per event (bound {self.bounds.max_bytes_per_event:.0f})")
+        if self.stats['failed_steps'] > self.bounds.max_failed_steps:
+            violations.append(f"{self.stats['failed_steps']} synthetic steps failed (bound {self.bounds.max_failed_steps})")
+
+        structure_growth = {
+            name: last.structures.get(name, 0) - base.structures.get(name, 0)
+            for name in sorted(last.structures, key=lambda name: base.structures.get(name, 0) - last.structures[name])
+        }
+        return SoakReport(
+            passed=not violations,
+            violations=violations,
+            duration=duration,
+            cycles=self.stats['cycles'],
+            failed_steps=self.stats['failed_steps'],
+            restarts=self.stats['restarts'],
+            events=last.events - base.events,
+            rss_growth=rss_growth,
+            traced_growth=traced_growth,
+            bytes_per_event=slope,
+            structure_growth=structure_growth,
+            samples=samples
+        )
+
+if __name__ == "__main__":
+    # Soak run: python -m validator_core.soak_test --duration 600
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Memory soak test for long-running validation flows")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "validator_config.yaml"))
+    parser.add_argument("--duration", type=float, help="seconds to run (default: soak_test.duration)")
+    parser.add_argument("--flows", type=int)
+    parser.add_argument("--sample-interval", type=float)
+    parser.add_argument("--step-rate", type=float, help="cycles per second; 0 runs flat out")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    for name in ("ValidationFlowController", "ValidationFlowPipeline", "ObserverInterface", "FieldValidator", "AlertDispatcher"):
+        logging.getLogger(name).setLevel(logging.ERROR)
+    settings = load_config(args.config).config.get('soak_test') or {}
+    harness = SoakHarness.from_config(
+        args.config, flows=args.flows, sample_interval=args.sample_interval, step_rate=args.step_rate
+    )
+    report = harness.run(args.duration if args.duration is not None else settings.get('duration', 600.0))
+
+    print(f"{'PASSED' if report.passed else 'FAILED'}: {report.cycles} cycles, {report.events} events measured in {report.duration:.0f}s "
+          f"({report.failed_steps} failed steps, {report.restarts} flow restarts)")
+    print(f"  RSS growth {report.rss_growth / 2 ** 20:.1f}MiB, traced growth {report.traced_growth / 2 ** 20:.1f}MiB, "
+          f"{report.bytes_per_event:.0f} bytes/event")
+    for name, growth in report.structure_growth.items():
+        print(f"  {name:<20} {growth / 1024:+10.0f}KiB")
+    for violation in report.violations:
+        print(f"  violation: {violation}")
+    sys.exit(0 if report.passed else 1)
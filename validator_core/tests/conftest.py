@@ -0,0 +1,34 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PACKAGE_ROOT)
+# Keep compiled-config caches out of the source tree
+os.environ.setdefault('VALIDATOR_CONFIG_CACHE_DIR', tempfile.mkdtemp(prefix="validator-config-cache-"))
+
+CONFIG_PATH = os.path.join(PACKAGE_ROOT, "validator_core", "validator_config.yaml")
+
+INITIAL_CONTEXT = {
+    'domain': 'OBI-WAN',
+    'prime_sequence': [2, 3, 5, 7, 11],
+    'coordinates': {
+        'latitude': 'FIELD/node-1/003',
+        'longitude': 'OBI-WAN/personal',
+        'temporal': '20250612092216Z'
+    }
+}
+
+@pytest.fixture
+def config_path() -> str:
+    return CONFIG_PATH
+
+@pytest.fixture
+def pipeline():
+    from validator_core.validation_flow import ValidationFlowPipeline
+
+    flow = ValidationFlowPipeline(CONFIG_PATH, "test-flow")
+    assert flow.initialize_flow(INITIAL_CONTEXT)
+    return flow
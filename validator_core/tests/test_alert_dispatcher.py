@@ -0,0 +1,56 @@
+from validator_core.alert_dispatcher import AlertDispatcher, get_alert_dispatcher
+from validator_core.error_codes import AlertLevel, ErrorCode
+
+def _dispatcher(**kwargs):
+    dispatcher = AlertDispatcher(
+        channels=["system_state", "admin_notification"],
+        aggregation_window=0.2,
+        rate_limits={"admin_notification": 1.0},
+        **kwargs
+    )
+    delivered = []
+    dispatcher.register_handler("admin_notification", delivered.append)
+    return dispatcher, delivered
+
+def test_lower_levels_do_not_spend_admin_budget():
+    dispatcher, delivered = _dispatcher()
+    dispatcher.submit(ErrorCode.INVALID_GATE, AlertLevel.HIGH, "high first", "flow-1")
+    dispatcher.submit(ErrorCode.INVALID_GATE_SEQUENCE, AlertLevel.CRITICAL, "critical second", "flow-1")
+    dispatcher.close()
+
+    assert [a.error_code for a in delivered] == [ErrorCode.INVALID_GATE_SEQUENCE]
+    assert dispatcher.stats['rate_limited'] == 0
+    assert set(dispatcher.system_state) == {"INVALID_GATE", "INVALID_GATE_SEQUENCE"}
+
+def test_rate_limit_applies_between_critical_aggregates():
+    dispatcher, delivered = _dispatcher()
+    dispatcher.submit(ErrorCode.INVALID_GATE_SEQUENCE, AlertLevel.CRITICAL, "one", "flow-1")
+    dispatcher.submit(ErrorCode.NON_PRIME_DETECTED, AlertLevel.CRITICAL, "two", "flow-1")
+    dispatcher.close()
+
+    assert len(delivered) == 1
+    assert dispatcher.stats['rate_limited'] == 1
+
+def test_repeats_aggregate_into_one_delivery():
+    dispatcher, delivered = _dispatcher()
+    for _ in range(50):
+        dispatcher.submit(ErrorCode.INVALID_GATE_SEQUENCE, AlertLevel.CRITICAL, "again", "flow-1")
+    dispatcher.close()
+
+    assert len(delivered) == 1
+    assert delivered[0].count == 50
+    assert dispatcher.stats['aggregated'] == 49
+
+def test_full_queue_drops_without_blocking():
+    dispatcher, _ = _dispatcher(queue_size=1)
+    dispatcher._start = lambda: None  # keep the queue undrained
+    dispatcher._thread = object()
+    assert dispatcher.submit(ErrorCode.INVALID_GATE, AlertLevel.HIGH, "kept")
+    assert not dispatcher.submit(ErrorCode.INVALID_GATE, AlertLevel.HIGH, "dropped")
+    assert dispatcher.stats['dropped'] == 1
+
+def test_shared_dispatcher_keys_on_dispatch_settings():
+    config = {'observer_interface': {'alert_channels': ["observer_log"], 'alert_dispatch': {'queue_size': 8}}}
+    other = {'observer_interface': {'alert_channels': ["observer_log"], 'alert_dispatch': {'queue_size': 16}}}
+    assert get_alert_dispatcher(config) is get_alert_dispatcher(dict(config))
+    assert get_alert_dispatcher(config) is not get_alert_dispatcher(other)
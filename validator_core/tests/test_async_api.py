@@ -0,0 +1,47 @@
+import asyncio
+
+from validator_core.async_api import AsyncFieldValidator, AsyncFlowPipeline, AsyncOffloader
+from validator_core.negative_cache import NegativeResultCache
+from validator_core.overrides import OverrideRegistry
+from validator_core.validator import FieldValidator
+
+def test_cheap_pipeline_steps_wait_off_the_loop(pipeline):
+    offloader = AsyncOffloader()
+    flow = AsyncFlowPipeline(pipeline, offloader)
+
+    async def main():
+        with pipeline.lock:  # e.g. a background revalidation holding the flow
+            step = asyncio.create_task(flow.process_validation_step("prime_sequence", {'sequence': [2, 3, 5]}))
+            await asyncio.sleep(0.05)  # the loop keeps running while the step waits
+            assert not step.done()
+        return await step
+
+    try:
+        assert asyncio.run(main())
+    finally:
+        offloader.close()
+    assert offloader.stats == {'inline': 0, 'threaded': 1, 'processed': 0}
+
+def test_process_offload_keeps_overrides_and_negative_cache(config_path):
+    validator = FieldValidator(config_path, "async-flow")
+    validator.overrides = OverrideRegistry()
+    validator.negative_cache = NegativeResultCache()
+    offloader = AsyncOffloader(cost_threshold=0, max_workers=1, use_processes=True)
+    facade = AsyncFieldValidator(validator, offloader)
+    bad = [2, 3, 5, 9]
+
+    async def main():
+        results = [await facade.validate_prime_sequence(bad) for _ in range(3)]
+        validator.overrides.add("prime_sequence", "async-flow", ttl=60)
+        results.append(await facade.validate_prime_sequence(bad))
+        return results
+
+    try:
+        first, second, cached, overridden = asyncio.run(main())
+    finally:
+        offloader.close()
+    assert not first.is_valid and not second.is_valid
+    assert cached.details == {'negative_cache': True}
+    assert overridden.is_valid and overridden.details == {'overridden': "prime_sequence"}
+    assert offloader.stats['processed'] == 2
+    assert validator.negative_cache.stats['hits'] == 1
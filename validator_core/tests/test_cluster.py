@@ -0,0 +1,70 @@
+import json
+
+from validator_core.cluster import ClusterNode, export_flow_record, import_flow_record
+from validator_core.coherence_check import CoherenceResult, CoherenceState
+from validator_core.drift_detection import DriftDetectionEngine, DriftThresholds
+from validator_core.validation_flow import ValidationFlowPipeline, ValidationFlowState
+
+BAD_ADDRESS = {'latitude': 'FIELD/node-1/003', 'longitude': 'NOWHERE/x', 'temporal': '20250612092216Z'}
+
+def _quarantined_record(pipeline):
+    for _ in range(600):
+        assert pipeline.process_validation_step("gate_transition", {
+            'gate': "🜂", 'from_domain': 'OBI-WAN', 'to_domain': 'OBI-WAN'
+        })
+    assert not pipeline.process_validation_step("field_address", BAD_ADDRESS)
+    assert pipeline.flow_context.state == ValidationFlowState.QUARANTINED
+    # Round-trip through JSON like the wire does
+    return json.loads(json.dumps(export_flow_record(pipeline)))
+
+def test_record_carries_gate_tail_quarantine_step_and_replay(pipeline, config_path):
+    pipeline.validator.validation_state['active_gates'] = ["🜂", "🜄", "🜃", "🜁"] * 1000
+    record = _quarantined_record(pipeline)
+    assert record['gate_state'] == ["🜁"]
+
+    flow = ValidationFlowPipeline(config_path, pipeline.flow_id)
+    import_flow_record(flow, record)
+
+    assert flow.validator.validation_state['active_gates'] == ["🜁"]
+    assert flow.flow_context.state == ValidationFlowState.QUARANTINED
+    assert flow.quarantine_step == ("field_address", BAD_ADDRESS)
+
+    source, moved = pipeline.replay_log, flow.replay_log
+    last = source.first_index + len(source) - 1
+    assert moved.first_index > source.first_index
+    assert moved.first_index % moved.keyframe_interval == 0
+    for index in (moved.first_index, last - 100, last):
+        assert moved.state_at(index) == source.state_at(index)
+    migrated = moved.state_at(-1)
+    assert migrated['event_index'] == last + 1
+    assert migrated['event_type'] == "migrated"
+    assert migrated['state'] == ValidationFlowState.QUARANTINED.value
+
+def test_drift_state_survives_a_move_between_clocks():
+    thresholds = DriftThresholds(window_seconds=10, critical_drift_count=3, quarantine_count=6)
+    source = DriftDetectionEngine(thresholds, clock=lambda: 1000.0)
+    target = DriftDetectionEngine(thresholds, clock=lambda: 5.0)
+    drift = CoherenceResult(is_coherent=False, state=CoherenceState.PARTIAL_DRIFT, drift_points=["gate_temporal_misalignment"])
+    for _ in range(4):
+        source.record("moving", drift)
+
+    target.import_flow("moving", json.loads(json.dumps(source.export_flow("moving"))))
+
+    assert target.window_counts("moving") == source.window_counts("moving")
+    assert target.record("moving", drift).state == CoherenceState.CRITICAL_DRIFT
+    assert source.export_flow("unknown") is None
+
+def test_node_recovers_the_quarantined_flows_it_holds(pipeline, config_path):
+    record = _quarantined_record(pipeline)
+    node = ClusterNode("node-1", "unix:/nonexistent", config_path)
+    scheduler = node.quarantine_scheduler
+
+    assert node.handle({'op': 'import_flow', 'flow_id': pipeline.flow_id, 'record': record})['accepted']
+    assert scheduler.pending() == 1
+    assert node.flows[pipeline.flow_id].quarantine_scheduler is scheduler
+
+    reply = node.handle({'op': 'export_flow', 'flow_id': pipeline.flow_id})
+    assert reply['record']['quarantine_step'] == ("field_address", BAD_ADDRESS)
+    assert scheduler.pending() == 0
+    assert node.handle({'op': 'stats'})['migrated_in'] == 1
+    assert node.stats['migrated_out'] == 1
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+from validator_core.config_cache import clear_memo, load_config
+
+CONFIG = "gate_validator:\n  gate_sequence: [{gates}]\n"
+
+def _caches(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".cfgcache"))
+
+def test_writing_a_new_hash_prunes_older_caches(tmp_path):
+    cache_dir = tmp_path / "cache"
+    config = tmp_path / "validator_config.yaml"
+    other = tmp_path / "validation_chain.yaml"
+    other.write_text(CONFIG.format(gates="a"))
+    load_config(str(other), str(cache_dir))
+
+    for gates in ("a", "a, b", "a, b, c"):
+        config.write_text(CONFIG.format(gates=gates))
+        os.utime(config, ns=(len(gates), len(gates)))  # distinct mtimes defeat the in-process memo
+        assert load_config(str(config), str(cache_dir)).gate_sequence == gates.split(", ")
+
+    caches = _caches(cache_dir)
+    assert len(caches) == 2
+    assert sum(name.startswith("validator_config.yaml.") for name in caches) == 1
+    assert sum(name.startswith("validation_chain.yaml.") for name in caches) == 1
+
+def test_cached_config_loads_without_yaml(tmp_path, config_path):
+    cache_dir = str(tmp_path)
+    clear_memo()  # a memo hit would skip writing the cache into cache_dir
+    load_config(config_path, cache_dir)
+    probe = (
+        "import sys\n"
+        "from validator_core.config_cache import load_config\n"
+        f"load_config({config_path!r}, {cache_dir!r})\n"
+        "print('yaml' in sys.modules)\n"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], cwd=os.path.dirname(os.path.dirname(config_path)),
+                         capture_output=True, text=True, check=True).stdout.strip()
+    assert out == "False"
+
+def test_validator_import_defers_runtime_services(config_path):
+    probe = (
+        "import sys\n"
+        "import validator_core.validator\n"
+        "print(sorted(m for m in ('validator_core.alert_dispatcher', 'validator_core.overrides',"
+        " 'validator_core.negative_cache', 'json', 'random', 'yaml') if m in sys.modules))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], cwd=os.path.dirname(os.path.dirname(config_path)),
+                         capture_output=True, text=True, check=True).stdout.strip()
+    assert out == "[]"
@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+import pytest
+
+from validator_core.flow_replay import FlowReplayLog
+from validator_core.validation_flow import ValidationFlowState
+
+_FIELDS = ('state', 'current_domain', 'active_gates', 'prime_sequence', 'field_coordinates', 'timestamp', 'coherence_state')
+
+def _flow():
+    return SimpleNamespace(revision=0, flow_context=SimpleNamespace(
+        state=ValidationFlowState.ACTIVE,
+        current_domain='OBI-WAN',
+        active_gates=[],
+        prime_sequence=[2, 3],
+        field_coordinates={'latitude': 'FIELD/node-1/003'},
+        timestamp='20250612092216Z',
+        coherence_state='coherent'
+    ))
+
+def _mutate(ctx, i):
+    ctx.active_gates.append("🜂🜄🜃🜁"[i % 4])
+    if i % 5 == 0:
+        ctx.current_domain = ('OBI-WAN', 'BERJAK', 'INFINITY')[i % 3]
+    if i % 7 == 0:
+        ctx.field_coordinates = {'latitude': f"FIELD/node-{i}/003"}
+    if i % 11 == 0:
+        ctx.prime_sequence = ctx.prime_sequence + [97]  # a replaced list starts a new slice
+    if i % 13 == 0:
+        ctx.state = ValidationFlowState.QUARANTINED if ctx.state == ValidationFlowState.ACTIVE else ValidationFlowState.ACTIVE
+
+def _record(log, flow, events):
+    expected = []
+    for i in range(events):
+        _mutate(flow.flow_context, i)
+        flow.revision += 1
+        log.record(flow, "validation")
+        ctx = flow.flow_context
+        expected.append({
+            'state': ctx.state.value,
+            'current_domain': ctx.current_domain,
+            'active_gates': list(ctx.active_gates),
+            'prime_sequence': list(ctx.prime_sequence),
+            'field_coordinates': dict(ctx.field_coordinates),
+            'timestamp': ctx.timestamp,
+            'coherence_state': ctx.coherence_state
+        })
+    return expected
+
+def test_state_at_survives_trimming():
+    ticks = iter(range(10 ** 6))
+    log = FlowReplayLog(keyframe_interval=4, max_events=8, clock=lambda: 1_750_000_000.0 + next(ticks))
+    flow = _flow()
+    expected = _record(log, flow, 103)
+
+    assert log.stats['trimmed'] > 0
+    assert log.first_index % 4 == 0
+    assert log.first_index + len(log) == 103
+    assert 8 <= len(log) < 103
+    for index in range(log.first_index, 103):
+        state = log.state_at(index)
+        assert {name: state[name] for name in _FIELDS} == expected[index]
+        assert state['event_index'] == index and state['revision'] == index + 1
+    assert log.state_at(-1, tail=2)['active_gates'] == expected[-1]['active_gates'][-2:]
+
+    with pytest.raises(IndexError):
+        log.state_at(log.first_index - 1)
+    assert log.state_at_time(1_750_000_000.0 + log.first_index - 1) is None
+    assert log.state_at_time(1_750_000_000.0 + log.first_index)['event_index'] == log.first_index
+
+def test_export_resumes_after_the_retained_window():
+    ticks = iter(range(10 ** 6))
+    log = FlowReplayLog(keyframe_interval=4, max_events=8, clock=lambda: float(next(ticks)))
+    flow = _flow()
+    expected = _record(log, flow, 50)
+
+    copy = FlowReplayLog.from_export(log.export(tail=5), max_events=8, clock=lambda: float(next(ticks)))
+    assert copy.first_index == 44  # whole keyframe blocks holding the last five events
+    expected += _record(copy, flow, 30)
+    for index in range(copy.first_index, copy.first_index + len(copy)):
+        assert {name: copy.state_at(index)[name] for name in _FIELDS} == expected[index]
@@ -0,0 +1,57 @@
+import io
+import json
+
+import pytest
+
+from validator_core.fractal_structure import _json_events
+
+DOCUMENT = [
+    {
+        "name": "Tata",
+        "petals": [
+            {"name": "Ré \"quoted\" \\ back", "glyph": "🜂", "pNumber": 12345, "ratio": -1.5e-3},
+            {"name": "", "done": True, "skipped": False, "note": None, "values": [0, 10, -7, 2.25]}
+        ],
+        "nested": {"deep": [[[]], {}], "a-very-long-key-that-spans-chunk-boundaries": "x" * 50}
+    },
+    {"name": "Atlas", "petals": []}
+]
+
+def _expected(value):
+    if isinstance(value, dict):
+        yield 'start_map', None
+        for key, item in value.items():
+            yield 'key', key
+            yield from _expected(item)
+        yield 'end_map', None
+    elif isinstance(value, list):
+        yield 'start_array', None
+        for item in value:
+            yield from _expected(item)
+        yield 'end_array', None
+    else:
+        yield 'value', value
+
+def _reader(data, size):
+    """A reader returning at most `size` characters or bytes per call, whatever it is asked for."""
+    stream = io.BytesIO(data) if isinstance(data, bytes) else io.StringIO(data)
+    return lambda _: stream.read(size)
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 64, 1 << 16])
+@pytest.mark.parametrize("encode", [False, True], ids=["text", "utf-8"])
+def test_events_do_not_depend_on_chunk_boundaries(size, encode):
+    for indent in (None, 2):
+        text = json.dumps(DOCUMENT, ensure_ascii=False, indent=indent)
+        data = text.encode('utf-8') if encode else text
+        assert list(_json_events(_reader(data, size))) == list(_expected(DOCUMENT))
+
+@pytest.mark.parametrize("size", [1, 3, 1 << 16])
+def test_top_level_scalars_and_trailing_whitespace(size):
+    assert list(_json_events(_reader(' 123456 \n', size))) == [('value', 123456)]
+    assert list(_json_events(_reader('"split string"  ', size))) == [('value', "split string")]
+
+@pytest.mark.parametrize("size", [1, 1 << 16])
+@pytest.mark.parametrize("document", ['{"a": tru}', '[1, @]', '["unterminated'])
+def test_malformed_tokens_raise(document, size):
+    with pytest.raises(ValueError):
+        list(_json_events(_reader(document, size)))
@@ -0,0 +1,81 @@
+import threading
+
+from validator_core.error_codes import AlertLevel, ErrorCode
+from validator_core.negative_cache import NegativeResultCache
+from validator_core.validator import ValidationResult
+
+FAILURE = ValidationResult(is_valid=False, error_code=ErrorCode.NON_PRIME_DETECTED, alert_level=AlertLevel.CRITICAL)
+
+def test_input_is_admitted_on_its_second_failure():
+    cache = NegativeResultCache()
+    cache.record("bad", FAILURE, "node-1", "cfg")
+    assert cache.lookup("bad", "node-1") is None
+    assert cache.stats['first_failures'] == 1
+
+    cache.record("bad", FAILURE, "node-1", "cfg")
+    cached = cache.lookup("bad", "node-1")
+    assert cached.error_code == ErrorCode.NON_PRIME_DETECTED
+    assert cached.details == {'negative_cache': True}
+    assert FAILURE.details is None
+    assert cache.serves("cfg") and not cache.serves("other")
+
+def test_state_dependent_failures_are_never_cached():
+    cache = NegativeResultCache()
+    failure = ValidationResult(is_valid=False, error_code=ErrorCode.INVALID_GATE_SEQUENCE, alert_level=AlertLevel.CRITICAL)
+    for _ in range(3):
+        cache.record("gate", failure, "node-1", "cfg")
+    assert cache.lookup("gate", "node-1") is None
+    assert cache.stats['first_failures'] == 0
+
+def test_lru_evicts_the_least_recently_used_entry():
+    cache = NegativeResultCache(maxsize=2)
+    for key in ("a", "b"):
+        cache.record(key, FAILURE, "node-1", "cfg")
+        cache.record(key, FAILURE, "node-1", "cfg")
+    assert cache.lookup("a", "node-1") is not None  # "b" is now least recently used
+    cache.record("c", FAILURE, "node-1", "cfg")
+    cache.record("c", FAILURE, "node-1", "cfg")
+
+    assert len(cache) == 2
+    assert cache.stats['evictions'] == 1
+    assert cache.lookup("b", "node-1") is None
+    assert cache.lookup("a", "node-1") is not None
+
+def test_config_change_drops_cached_failures():
+    cache = NegativeResultCache()
+    cache.record("bad", FAILURE, "node-1", "cfg")
+    cache.record("bad", FAILURE, "node-1", "cfg")
+    cache.record("other", FAILURE, "node-1", "cfg-2")
+    assert len(cache) == 0
+    assert cache.lookup("bad", "node-1") is None
+
+def test_offender_table_evicts_the_lowest_count():
+    cache = NegativeResultCache(max_offenders=3)
+    for _ in range(5):
+        cache._count_offender("worst")
+    for node in ("one-off-1", "one-off-2", "one-off-3", "one-off-4"):
+        cache._count_offender(node)
+    assert cache.top_offenders(1) == [("worst", 5)]
+    assert len(cache.offenders) == 3
+
+def test_concurrent_lookups_and_records():
+    cache = NegativeResultCache(maxsize=16)
+    errors = []
+
+    def hammer(node):
+        try:
+            for i in range(2000):
+                key = i % 40
+                cache.record(key, FAILURE, node, "cfg")
+                cache.lookup(key, node)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=hammer, args=(f"node-{n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(cache) <= 16
+    assert sum(cache.offenders.values()) >= cache.stats['hits'] > 0
@@ -0,0 +1,96 @@
+import pytest
+
+from validator_core.observer_interface import ObserverAction, ObserverCommand, ObserverInterface
+from validator_core.overrides import ALL_FLOWS, OverrideRegistry, TimerWheel, get_override_registry
+from validator_core.validation_flow import ValidationFlowPipeline
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+def _expiry_tick(wheel, clock, deadline, limit):
+    wheel.schedule("key", deadline)
+    for tick in range(limit):
+        clock.now = float(tick)
+        if wheel.advance():
+            return tick
+    return None
+
+@pytest.mark.parametrize("deadline", [0.5, 3.0, 2.5, 63.0, 64.0, 65.5, 300.0, 4100.0])
+def test_timer_wheel_expires_at_the_deadline_tick(deadline):
+    clock = FakeClock()
+    wheel = TimerWheel(tick=1.0, clock=clock)
+    assert _expiry_tick(wheel, clock, deadline, 5000) == max(int(-(-deadline // 1)), 1)
+    assert len(wheel) == 0
+
+def test_timer_wheel_parks_deadlines_past_its_horizon():
+    clock = FakeClock()
+    wheel = TimerWheel(tick=1.0, slot_bits=2, levels=2, clock=clock)  # 16-tick horizon
+    assert _expiry_tick(wheel, clock, 40.0, 100) == 40
+
+def test_timer_wheel_cancel_and_reschedule():
+    clock = FakeClock()
+    wheel = TimerWheel(tick=1.0, clock=clock)
+    wheel.schedule("a", 5.0)
+    wheel.schedule("b", 5.0)
+    wheel.cancel("a")
+    wheel.schedule("b", 10.0)
+    assert wheel.advance(6.0) == []
+    assert wheel.advance(10.0) == ["b"]
+
+def test_registry_ttl_expiry_and_zero_ttl():
+    clock = FakeClock(100.0)
+    registry = OverrideRegistry(clock=clock)
+    registry.add("prime_sequence", "flow-1", ttl=5.0)
+    registry.add("gate_transition", "flow-1", ttl=0)
+    assert registry.is_overridden("prime_sequence", "flow-1")
+    assert not registry.is_overridden("prime_sequence", "flow-2")
+    clock.now = 101.0
+    assert not registry.is_overridden("gate_transition", "flow-1")
+    clock.now = 106.0
+    assert not registry.is_overridden("prime_sequence", "flow-1")
+    assert registry.stats['expired'] == 2
+
+@pytest.fixture
+def observer(pipeline, config_path):
+    observer = ObserverInterface(pipeline)
+    observer.register_flow("other-flow", ValidationFlowPipeline(config_path, "other-flow"))
+    registry = get_override_registry()
+    yield observer
+    for rule, flow_id in list(registry._entries):
+        registry.remove(rule, flow_id)
+
+def _override(observer, **parameters):
+    return observer.execute_command(ObserverCommand(ObserverAction.OVERRIDE, parameters, "", comment="test"))
+
+def test_override_defaults_to_the_addressed_flow(observer):
+    assert _override(observer, type="prime_sequence").success
+    assert observer.overrides.is_overridden("prime_sequence", "test-flow")
+    assert not observer.overrides.is_overridden("prime_sequence", "other-flow")
+
+    assert _override(observer, type="field_address", flow_id="other-flow").success
+    assert observer.overrides.is_overridden("field_address", "other-flow")
+    assert not observer.overrides.is_overridden("field_address", "test-flow")
+
+def test_override_scope_all_is_explicit(observer):
+    assert _override(observer, type="gate_transition", scope="all").success
+    assert ("gate_transition", ALL_FLOWS) in observer.overrides._entries
+    assert observer.overrides.is_overridden("gate_transition", "other-flow")
+
+@pytest.mark.parametrize("parameters", [
+    {},
+    {'type': None},
+    {'type': "not_a_rule"},
+    {'type': "prime_sequence", 'ttl': -1},
+    {'type': "prime_sequence", 'ttl': "60"},
+    {'type': "prime_sequence", 'ttl': True},
+    {'type': "prime_sequence", 'ttl': float('nan')},
+    {'type': "prime_sequence", 'scope': "everything"},
+])
+def test_invalid_overrides_are_rejected(observer, parameters):
+    response = _override(observer, **parameters)
+    assert not response.success
+    assert not observer.overrides.snapshot()
@@ -0,0 +1,45 @@
+import pytest
+
+from validator_core.coherence_check import CrossValidatorCoherence
+from validator_core.error_codes import ErrorCode
+from validator_core.prime_index import BITSET_LIMIT, PrimeAlignmentIndex
+
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+def test_equal_sequences_reuse_the_index():
+    checker = CrossValidatorCoherence()
+    index = checker.alignment_index(PRIMES)
+    assert checker.alignment_index(list(PRIMES)) is index
+    assert checker.alignment_index(tuple(PRIMES)) is index
+
+def test_in_place_mutation_rebuilds_the_index():
+    checker = CrossValidatorCoherence()
+    sequence = list(PRIMES)
+    index = checker.alignment_index(sequence)
+    sequence[3] = 31  # same length and last element
+    rebuilt = checker.alignment_index(sequence)
+    assert rebuilt is not index
+    assert 31 in rebuilt and 7 not in rebuilt
+    assert 7 in index  # the old index kept its own snapshot
+
+@pytest.mark.parametrize("sequence", [PRIMES, [BITSET_LIMIT + 1, BITSET_LIMIT + 3]])
+def test_contains_many_matches_scalar_lookups(sequence):
+    index = PrimeAlignmentIndex(sequence)
+    values = [-1, 0, 2, 4, 29, 30, 1000, BITSET_LIMIT + 1, BITSET_LIMIT * 4]
+    assert list(index.contains_many(values)) == [int(v in sequence) for v in values]
+    assert list(index.contains_many(v for v in [2, 4])) == [int(2 in sequence), 0]
+    assert index.contains_many([]) == b""
+
+def test_fleet_check_codes_each_node():
+    checker = CrossValidatorCoherence()
+    fleet = [
+        {'latitude': 'FIELD/node-1/003'},
+        {'latitude': 'FIELD/node-1/004'},
+        {'latitude': 'FIELD/node-1/097'},
+        {'latitude': 'FIELD/node-1/abc'},
+    ]
+    columns = checker.check_fleet_prime_spatial_coherence(PRIMES, fleet)
+    assert [columns.row(i)['error_code'] for i in range(4)] == [
+        ErrorCode.NONE, ErrorCode.PRIME_SPATIAL_INCOHERENCE,
+        ErrorCode.PRIME_SPATIAL_INCOHERENCE, ErrorCode.COHERENCE_CHECK_ERROR
+    ]
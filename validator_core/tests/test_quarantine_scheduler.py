@@ -0,0 +1,63 @@
+import threading
+import time
+
+from validator_core.error_codes import AlertLevel
+from validator_core.quarantine_scheduler import QuarantinePolicy, QuarantineScheduler
+from validator_core.validation_flow import ValidationFlowState
+
+def _quarantine(pipeline, scheduler):
+    scheduler.track(pipeline)
+    pipeline.flow_context.state = ValidationFlowState.QUARANTINED
+    scheduler.quarantine(pipeline, AlertLevel.HIGH)
+
+def test_revalidation_waits_for_the_flow_lock(pipeline):
+    scheduler = QuarantineScheduler(QuarantinePolicy(base_delay=0.0, jitter=0.0))
+    _quarantine(pipeline, scheduler)
+    history_length = len(pipeline.flow_context.validation_history)
+
+    with pipeline.lock:
+        worker = threading.Thread(target=scheduler.dispatch, kwargs={'now': time.monotonic() + 1, 'wait': True})
+        worker.start()
+        worker.join(0.2)
+        assert worker.is_alive()
+        assert len(pipeline.flow_context.validation_history) == history_length
+    worker.join(5)
+
+    assert not worker.is_alive()
+    assert pipeline.flow_context.state == ValidationFlowState.ACTIVE
+    assert scheduler.stats['recovered'] == 1
+    assert scheduler.pending() == 0
+
+def test_revalidate_leaves_a_recovered_flow_alone(pipeline):
+    history_length = len(pipeline.flow_context.validation_history)
+    assert pipeline.revalidate()
+    assert len(pipeline.flow_context.validation_history) == history_length
+
+def test_failed_revalidations_back_off_until_exhausted():
+    class _Flow:
+        flow_id = "stuck"
+
+        def __init__(self):
+            self.flow_context = type("Context", (), {'state': ValidationFlowState.QUARANTINED})()
+            self.calls = 0
+
+        def revalidate(self):
+            self.calls += 1
+            return False
+
+    now = [0.0]
+    scheduler = QuarantineScheduler(
+        QuarantinePolicy(base_delay=1.0, multiplier=2.0, jitter=0.0, max_attempts=3, max_rate=100, burst=10),
+        clock=lambda: now[0]
+    )
+    flow = _Flow()
+    scheduler.quarantine(flow)
+    retries = []
+    for _ in range(3):
+        now[0] = scheduler.snapshot()[0]['retry_in'] + now[0]
+        retries.append(now[0])
+        assert scheduler.dispatch(wait=True) == 1
+    assert retries == [1.0, 3.0, 7.0]
+    assert flow.calls == 3
+    assert scheduler.stats['exhausted'] == 1
+    assert scheduler.pending() == 0
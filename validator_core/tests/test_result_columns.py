@@ -0,0 +1,50 @@
+from validator_core.cluster import export_flow_record, import_flow_record
+from validator_core.error_codes import AlertLevel, ErrorCode
+from validator_core.flow_checkpoint import restore_flow
+from validator_core.result_columns import ResultColumns
+from validator_core.validation_flow import ValidationFlowPipeline
+from validator_core.validator import ValidationResult
+
+def _result(code=ErrorCode.NONE, level=AlertLevel.NORMAL):
+    return ValidationResult(is_valid=code == ErrorCode.NONE, error_code=code, alert_level=level)
+
+def test_append_returns_absolute_index_that_survives_clear():
+    columns = ResultColumns()
+    assert columns.append(_result()) == 0
+    first = columns.append(_result(ErrorCode.NON_PRIME_DETECTED, AlertLevel.HIGH))
+    columns.clear()
+    assert columns.row(first) is None
+    assert columns.append(_result()) == 2
+    assert columns.row(2) == {'error_code': ErrorCode.NONE, 'alert_level': AlertLevel.NORMAL, 'is_valid': True}
+
+def test_compacted_entries_resolve_through_their_column(pipeline):
+    pipeline.retain_results = 1
+    for _ in range(3):
+        pipeline.process_validation_step("prime_sequence", {'sequence': [2, 3, 4]})
+    history = pipeline.flow_context.validation_history
+    assert history[-1]['result'] is not None
+    compacted = history[-2]
+    assert compacted['result'] is None
+    assert pipeline.result_columns.row(compacted['column'])['error_code'] == ErrorCode.NON_PRIME_DETECTED
+
+def test_restore_clears_history_and_columns(pipeline):
+    pipeline.process_validation_step("prime_sequence", {'sequence': [2, 3, 5]})
+    record = export_flow_record(pipeline)
+    restore_flow(pipeline, record)
+    assert not pipeline.flow_context.validation_history
+    assert not len(pipeline.result_columns)
+
+def test_migration_keeps_compacted_codes(pipeline, config_path):
+    pipeline.retain_results = 1
+    pipeline.process_validation_step("prime_sequence", {'sequence': [2, 3, 4]})
+    pipeline.process_validation_step("prime_sequence", {'sequence': [2, 3, 5]})
+    record = export_flow_record(pipeline)
+
+    moved = ValidationFlowPipeline(config_path, "test-flow")
+    moved.retain_results = 1
+    import_flow_record(moved, record)
+    history = moved.flow_context.validation_history
+    assert len(history) == len(record['history'])
+    assert history[-2]['result'] is None
+    assert moved.result_columns.row(history[-2]['column'])['error_code'] == ErrorCode.NON_PRIME_DETECTED
+    assert history[-1]['result'].is_valid
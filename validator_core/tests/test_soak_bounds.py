@@ -0,0 +1,36 @@
+from collections import deque
+from datetime import datetime
+
+from validator_core.observer_interface import ObserverAction, ObserverCommand, ObserverInterface
+from validator_core.soak_test import SoakHarness, SoakSample
+
+def test_bounded_history_keeps_its_result_rows(pipeline):
+    pipeline.flow_context.validation_history = deque(maxlen=8)
+    pipeline.retain_results = 2
+    for _ in range(40):
+        assert pipeline.process_validation_step("prime_sequence", {'sequence': [2, 3, 5]})
+
+    history = pipeline.flow_context.validation_history
+    assert len(history) == 8
+    assert len(pipeline.result_columns) < 16
+    assert all(pipeline.result_columns.row(entry['column']) is not None for entry in history)
+
+    observer = ObserverInterface(pipeline)
+    response = observer.execute_command(ObserverCommand(
+        action=ObserverAction.TRACE, parameters={'limit': 5}, timestamp=datetime.utcnow().isoformat() + 'Z'
+    ))
+    assert [entry['column'] for entry in response.state['history']] == [entry['column'] for entry in history][-5:]
+    assert observer.command_history.maxlen == 1024
+
+def _samples(bytes_per_event: int):
+    return [
+        SoakSample(elapsed=float(t), events=t * 1000, rss=0, traced=t * 1000 * bytes_per_event, structures={})
+        for t in range(0, 101, 10)
+    ]
+
+def test_default_bounds_fail_per_event_growth(config_path):
+    harness = SoakHarness.from_config(config_path, flows=1)
+    leaking = harness._evaluate(_samples(492), 100.0)
+    assert not leaking.passed
+    assert any("bytes per event" in violation for violation in leaking.violations)
+    assert harness._evaluate(_samples(5), 100.0).passed
@@ -0,0 +1,38 @@
+from validator_core.watch_points import FIELD_COORDINATES, PRIME_STATE, WatchPointScheduler
+
+def _on_change_scheduler():
+    return WatchPointScheduler.from_config({
+        'observer_interface': {'watch_points': {'prime_state': {'interval': 'on_change', 'alert_threshold': 'high'}}}
+    })
+
+def test_unwatched_steps_snapshot_nothing(pipeline):
+    versions = dict(pipeline.watch_versions)
+    pipeline.process_validation_step("prime_sequence", {'sequence': [2, 3, 5, 7, 11, 13]})
+    assert pipeline.watch_values == {}
+    assert pipeline.watch_versions == versions
+
+def test_on_change_watcher_sees_only_changes(pipeline):
+    pipeline.watch_scheduler = _on_change_scheduler()
+    events = []
+    assert pipeline.watch_scheduler.subscribe("prime_state", events.append)
+
+    sequence = [2, 3, 5, 7]
+    pipeline.process_validation_step("prime_sequence", {'sequence': sequence})
+    pipeline.process_validation_step("prime_sequence", {'sequence': list(sequence)})
+    sequence.append(11)  # mutated in place by the caller
+    pipeline.process_validation_step("prime_sequence", {'sequence': sequence})
+
+    assert [event.version for event in events] == [1, 2]
+    assert pipeline.watch_values[PRIME_STATE] == (2, 3, 5, 7, 11)
+    assert pipeline.watch_scheduler.stats['skipped_unchanged'] == 1
+
+def test_invalid_steps_do_not_bump_versions(pipeline):
+    pipeline.watch_scheduler = _on_change_scheduler()
+    pipeline.watch_scheduler.subscribe("prime_state", lambda event: None)
+    pipeline.process_validation_step("prime_sequence", {'sequence': [2, 3, 4]})
+    assert pipeline.watch_versions[PRIME_STATE] == 0
+
+def test_unconfigured_watch_points_are_refused():
+    scheduler = _on_change_scheduler()
+    assert not scheduler.subscribe("field_address", lambda event: None)
+    assert not scheduler.wants(FIELD_COORDINATES)
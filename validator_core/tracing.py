@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+
+import contextvars
+import functools
+import itertools
+import os
+import threading
+from array import array
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Trace id of the sampled trace the current context belongs to; None when not tracing
+_current_trace: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("validator_trace", default=None)
+# Sequence number of the innermost open span, for parent links
+_current_span: contextvars.ContextVar[int] = contextvars.ContextVar("validator_span", default=-1)
+
+def _sample() -> float:
+    import random  # only imported once sampling is enabled
+
+    return random.random()
+
+def current_trace_id() -> Optional[str]:
+    """Trace id propagated to this call, if it belongs to a sampled trace."""
+    return _current_trace.get()
+
+class SpanRecorder:
+    """Ring buffer of timed spans in preallocated columns.
+
+    Spans are only recorded inside a sampled trace, so with sampling off an
+    instrumented call costs one ContextVar lookup. Once the buffer wraps the
+    oldest spans are overwritten.
+    """
+
+    def __init__(self, capacity: int = 65536, sample_rate: float = 0.0):
+        self.sample_rate = sample_rate
+        self.stats = {'traces': 0, 'unsampled': 0}
+
+        # (capacity, starts, durations, seqs, parents, threads, names, traces);
+        # replaced as a whole on resize so writers never index a mix of buffers
+        self._buffers = self._allocate(capacity)
+        self._counter = itertools.count()
+        self._trace_counter = itertools.count()
+        self._pid = os.getpid()
+        self._configured = False
+        self._configure_lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self._buffers[0]
+
+    @staticmethod
+    def _allocate(capacity: int) -> tuple:
+        return (
+            capacity,
+            array('q', bytes(8 * capacity)),
+            array('q', bytes(8 * capacity)),
+            array('q', [-1]) * capacity,
+            array('q', bytes(8 * capacity)),
+            array('Q', bytes(8 * capacity)),
+            [None] * capacity,
+            [None] * capacity
+        )
+
+    def configure(self, config: Optional[Dict[str, Any]]) -> None:
+        """Applies observer_interface.tracing from a validator config, once per recorder.
+
+        The recorder is process-wide, so later calls (one per Observer) leave
+        the first configuration in place.
+        """
+        with self._configure_lock:
+            if self._configured:
+                return
+            self._configured = True
+            settings = ((config or {}).get('observer_interface') or {}).get('tracing') or {}
+            self.sample_rate = float(settings.get('sample_rate', self.sample_rate))
+            capacity = int(settings.get('buffer_size', self.capacity))
+            if capacity != self.capacity:
+                self._resize(capacity)
+
+    def _resize(self, capacity: int) -> None:
+        """Swaps in buffers of a new size, keeping the most recent spans that fit."""
+        old = self._buffers
+        new = self._allocate(capacity)
+        kept = sorted((seq, slot) for slot, seq in enumerate(old[3]) if seq >= 0)[-capacity:]
+        for seq, slot in kept:
+            target = seq % capacity
+            for column in range(1, len(new)):
+                new[column][target] = old[column][slot]
+        self._buffers = new
+
+    @contextmanager
+    def trace(self, trace_id: str = "", name: str = "trace", force: bool = False) -> Iterator[Optional[str]]:
+        """Root span: samples the trace and propagates its id to nested spans.
+
+        Yields the trace id, or None when the trace is not sampled. An
+        already-open trace is joined rather than re-sampled.
+        """
+        if _current_trace.get() is not None:
+            with self.span(name):
+                yield _current_trace.get()
+            return
+        if not force and (self.sample_rate <= 0.0 or _sample() >= self.sample_rate):
+            self.stats['unsampled'] += 1
+            yield None
+            return
+
+        trace_id = trace_id or f"trace-{self._pid}-{next(self._trace_counter)}"
+        self.stats['traces'] += 1
+        token = _current_trace.set(trace_id)
+        try:
+            with self.span(name):
+                yield trace_id
+        finally:
+            _current_trace.reset(token)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Times a block as a child of the current span (no-op outside a sampled trace)."""
+        trace_id = _current_trace.get()
+        if trace_id is None:
+            yield
+            return
+        seq = next(self._counter)
+        token = _current_span.set(seq)
+        start = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._store(seq, name, trace_id, start, perf_counter_ns() - start, token.old_value)
+            _current_span.reset(token)
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Recorded spans still in the buffer, oldest first, optionally for one trace."""
+        capacity, starts, durations, seqs, parents, threads, names, traces = self._buffers
+        out = []
+        for slot in range(capacity):
+            seq = seqs[slot]
+            if seq < 0 or (trace_id is not None and traces[slot] != trace_id):
+                continue
+            parent = parents[slot]
+            out.append({
+                'seq': seq,
+                'name': names[slot],
+                'trace_id': traces[slot],
+                'start_ns': starts[slot],
+                'duration_ns': durations[slot],
+                'parent': None if parent < 0 else parent,
+                'thread': threads[slot]
+            })
+        out.sort(key=lambda span: span['seq'])
+        return out
+
+    def export_chrome_trace(self, path: str, trace_id: Optional[str] = None) -> int:
+        """Writes spans as Chrome Trace Event JSON (chrome://tracing, Perfetto). Returns the span count."""
+        events = [
+            {
+                'name': span['name'],
+                'cat': 'validator_core',
+                'ph': 'X',
+                'ts': span['start_ns'] / 1000.0,
+                'dur': span['duration_ns'] / 1000.0,
+                'pid': self._pid,
+                'tid': span['thread'],
+                'args': {'trace_id': span['trace_id'], 'span': span['seq'], 'parent': span['parent']}
+            }
+            for span in self.spans(trace_id)
+        ]
+        import json
+
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ns'}, f)
+        return len(events)
+
+    def clear(self) -> None:
+        """Forgets every recorded span."""
+        capacity, _, _, seqs, _, _, names, traces = self._buffers
+        for slot in range(capacity):
+            seqs[slot] = -1
+            names[slot] = None
+            traces[slot] = None
+
+    def _store(self, seq: int, name: str, trace_id: str, start: int, duration: int, parent: Any) -> None:
+        capacity, starts, durations, seqs, parents, threads, names, traces = self._buffers
+        slot = seq % capacity
+        starts[slot] = start
+        durations[slot] = duration
+        parents[slot] = -1 if parent is contextvars.Token.MISSING else parent
+        threads[slot] = threading.get_ident()
+        names[slot] = name
+        traces[slot] = trace_id
+        seqs[slot] = seq
+
+_default_recorder = SpanRecorder()
+
+def get_span_recorder() -> SpanRecorder:
+    """Returns the process-wide span recorder shared by every instrumented layer."""
+    return _default_recorder
+
+def traced(fn: Callable) -> Callable:
+    """Records each call of `fn` as a span named after its qualified name."""
+    name = fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if _current_trace.get() is None:
+            return fn(*args, **kwargs)
+        with _default_recorder.span(name):
+            return fn(*args, **kwargs)
+    return wrapper
+
+if __name__ == "__main__":
+    # Overhead with sampling off, then a sampled ADVANCE exported for a trace viewer
+    import tempfile
+    import timeit
+    from datetime import datetime
+    from .validator import FieldValidator
+    from .observer_interface import ObserverInterface, ObserverCommand, ObserverAction
+    from .validation_flow import ValidationFlowPipeline
+    from . import tracing  # the package's module instance, not __main__
+
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "validator_config.yaml")
+    validator = FieldValidator(config_path)
+    call = lambda: validator.validate_field_address("FIELD/node-1/003", "OBI-WAN/personal", "20250612091630Z")
+    untraced = lambda: FieldValidator.validate_field_address.__wrapped__(
+        validator, "FIELD/node-1/003", "OBI-WAN/personal", "20250612091630Z"
+    )
+    runs = 200000
+    base = min(timeit.repeat(untraced, number=runs, repeat=5))
+    off = min(timeit.repeat(call, number=runs, repeat=5))
+    noop = lambda: None
+    wrapped = traced(noop)
+    overhead = min(timeit.repeat(wrapped, number=runs, repeat=5)) - min(timeit.repeat(noop, number=runs, repeat=5))
+    print(f"validate_field_address: {base / runs * 1e9:.0f}ns bare, {off / runs * 1e9:.0f}ns instrumented with sampling off "
+          f"(wrapper overhead {overhead / runs * 1e9:.0f}ns per call)")
+
+    pipeline = ValidationFlowPipeline(config_path, "flow-1")
+    pipeline.initialize_flow({'domain': 'OBI-WAN', 'prime_sequence': [2, 3, 5, 7, 11]})
+    observer = ObserverInterface(pipeline)
+    response = observer.execute_command(ObserverCommand(
+        action=ObserverAction.ADVANCE,
+        parameters={'step_type': 'gate_transition', 'params': {'gate': "🜂", 'from_domain': 'OBI-WAN', 'to_domain': 'BERJAK'}, 'trace': True},
+        timestamp=datetime.utcnow().isoformat() + 'Z',
+        trace_id="advance-demo"
+    ))
+    recorder = tracing.get_span_recorder()
+    for span in recorder.spans("advance-demo"):
+        print(f"  {span['name']:<48} {span['duration_ns'] / 1000:8.1f}us parent={span['parent']}")
+    path = os.path.join(tempfile.gettempdir(), "validator_trace.json")
+    print(f"Exported {recorder.export_chrome_trace(path, 'advance-demo')} spans to {path}")
@@ -1,22 +1,37 @@
 #!/usr/bin/env python3
 
-import yaml
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from .validator import FieldValidator
-from .coherence_check import CrossValidatorCoherence, CoherenceResult
+from .admission_control import get_admission_controller
+from .coherence_check import CrossValidatorCoherence, CoherenceResult, CoherenceState
+from .drift_detection import get_drift_engine
+from .error_codes import AlertLevel, ErrorCode
+from .result_columns import ResultColumns
+from .config_cache import configure_logging
+from .flow_replay import FlowReplayLog
+from .memory_accounting import flow_memory
+from .watch_points import WatchPointScheduler, PRIME_STATE, FIELD_COORDINATES, GATE_TRANSITIONS
+from .tracing import traced
+from .concurrency import serialized
 
 class ValidationFlowState(Enum):
     INITIALIZING = "initializing"
     ACTIVE = "active"
     VALIDATING = "validating"
+    PAUSED = "paused"
     TRANSITIONING = "transitioning"
     QUARANTINED = "quarantined"
     ERROR = "error"
 
+_COORDINATE_KEYS = ('latitude', 'longitude', 'temporal')
+_WATCH_TOPICS = {"prime_sequence": PRIME_STATE, "field_address": FIELD_COORDINATES}
+
 @dataclass
 class ValidationFlowContext:
     state: ValidationFlowState
@@ -24,43 +39,71 @@ class ValidationFlowContext:
     field_coordinates: Dict[str, str]
     active_gates: List[str]
     current_domain: str
-    validation_history: List[Dict[str, Any]]
+    validation_history: Deque[Dict[str, Any]]
     coherence_state: str
     timestamp: str
 
 class ValidationFlowPipeline:
-    def __init__(self, config_path: str):
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
-        
-        self.validator = FieldValidator(config_path)
-        self.coherence_checker = CrossValidatorCoherence()
+    def __init__(self, config_path: str, flow_id: str = "default"):
+        self.flow_id = flow_id
+        self.validator = FieldValidator(config_path, flow_id)
+        self.config = self.validator.config
+        self.coherence_checker = CrossValidatorCoherence(
+            get_drift_engine(self.config),
+            flow_id=flow_id
+        )
+        history_settings = self.config.get('flow_history') or {}
         self.flow_context = ValidationFlowContext(
             state=ValidationFlowState.INITIALIZING,
             prime_sequence=[],
             field_coordinates={},
             active_gates=[],
             current_domain="",
-            validation_history=[],
+            validation_history=deque(maxlen=history_settings.get('max_entries')),
             coherence_state="coherent",
             timestamp=datetime.utcnow().isoformat() + 'Z'
         )
+        self.result_columns = ResultColumns()
+        self.retain_results = history_settings.get('retain_results', 256)
+        self.revision = 0
+        self.watch_scheduler = WatchPointScheduler.from_config(self.config)
+        self.watch_versions = {PRIME_STATE: 0, FIELD_COORDINATES: 0, GATE_TRANSITIONS: 0}
+        self.watch_values: Dict[str, Tuple] = {}  # last value published per watched topic
+        self.quarantine_scheduler = None  # set by QuarantineScheduler.track()
+        self.lock = threading.RLock()  # serializes steps with background revalidation and migration
+        self.quarantine_step: Optional[Tuple[str, Dict[str, Any]]] = None  # step that last quarantined the flow
+        self.admission = get_admission_controller(self.config)
+        self.replay_log = FlowReplayLog.from_config(self.config)
+        self.last_result: Any = None
         
-        logging.basicConfig(level=logging.INFO)
+        configure_logging()
         self.logger = logging.getLogger("ValidationFlowPipeline")
 
+    @traced
+    @serialized
     def initialize_flow(self, initial_context: Dict[str, Any]) -> bool:
         """Initializes the validation flow pipeline."""
         try:
-            self.flow_context.prime_sequence = initial_context.get('prime_sequence', [])
+            self.flow_context.prime_sequence = list(initial_context.get('prime_sequence', []))  # owned copy, not the caller's list
             self.flow_context.field_coordinates = initial_context.get('coordinates', {})
             self.flow_context.current_domain = initial_context.get('domain', '')
+            self.revision += 1  # context replaced without a history entry; marks checkpoints dirty
             
             # Validate initial state
             if not self._validate_initial_state():
                 return False
 
             self.flow_context.state = ValidationFlowState.ACTIVE
+            self.watch_values = {
+                topic: self._watch_value(topic, source)
+                for topic, source in (
+                    (PRIME_STATE, {'sequence': self.flow_context.prime_sequence}),
+                    (FIELD_COORDINATES, self.flow_context.field_coordinates)
+                )
+                if self.watch_scheduler.wants(topic)
+            }
+            if self.replay_log is not None:
+                self.replay_log.record(self, "flow_initialized")
             self._notify_observer("Flow initialized successfully")
             return True
 
@@ -69,8 +112,18 @@ class ValidationFlowPipeline:
             self.flow_context.state = ValidationFlowState.ERROR
             return False
 
-    def process_validation_step(self, step_type: str, params: Dict[str, Any]) -> bool:
-        """Processes a single validation step in the flow."""
+    @traced
+    @serialized
+    def process_validation_step(self, step_type: str, params: Dict[str, Any], deadline: Optional[float] = None) -> bool:
+        """Processes a single validation step in the flow.
+
+        Steps pass admission control first; a shed step returns False with
+        an ErrorCode.SHED result in last_result and leaves the flow untouched.
+        """
+        admission = self.admission
+        if admission is not None and not admission.acquire(admission.priority_for(step_type), deadline):
+            self.last_result = admission.shed_result(step_type)
+            return False
         try:
             self.flow_context.state = ValidationFlowState.VALIDATING
             
@@ -91,7 +144,11 @@ class ValidationFlowPipeline:
             else:
                 raise ValueError(f"Unknown validation step type: {step_type}")
 
+            self.last_result = result
             self._update_flow_state(result)
+            if self.flow_context.state == ValidationFlowState.QUARANTINED:
+                self.quarantine_step = (step_type, dict(params))
+            self._publish_watch(step_type, params, result)
             return result.is_valid
 
         except Exception as e:
@@ -99,6 +156,12 @@ class ValidationFlowPipeline:
             self.flow_context.state = ValidationFlowState.ERROR
             return False
 
+        finally:
+            if admission is not None:
+                admission.release()
+
+    @traced
+    @serialized
     def check_field_coherence(self) -> CoherenceResult:
         """Checks overall field coherence."""
         try:
@@ -110,17 +173,53 @@ class ValidationFlowPipeline:
                 self.flow_context.active_gates
             )
 
-            self.flow_context.coherence_state = result.state.value
+            self.coherence_checker.update_coherence_history(result, self.flow_id)
+            self.flow_context.coherence_state = self.coherence_checker.coherence_state.value
+            if self.coherence_checker.coherence_state == CoherenceState.QUARANTINED:
+                self.flow_context.state = ValidationFlowState.QUARANTINED
+                self.quarantine_step = None
+                if self.quarantine_scheduler is not None:
+                    self.quarantine_scheduler.quarantine(self, max(result.alert_level, AlertLevel.HIGH))
             self._update_validation_history("coherence_check", result)
             return result
 
         except Exception as e:
             self.logger.error(f"Coherence check error: {str(e)}")
             return self.coherence_checker._create_error_result(
-                "COHERENCE_CHECK_ERROR",
+                ErrorCode.COHERENCE_CHECK_ERROR,
                 str(e)
             )
 
+    @traced
+    @serialized
+    def revalidate(self) -> bool:
+        """Re-validates the committed flow state; a quarantined flow that passes becomes ACTIVE again.
+
+        The step that quarantined the flow (e.g. a rejected gate transition)
+        is re-run too and must now pass. A sticky drift quarantine is
+        released first and must not recur on a fresh coherence check.
+        Runs under the flow lock, so it never interleaves with live steps.
+        """
+        if self.flow_context.state != ValidationFlowState.QUARANTINED:
+            return True  # left quarantine while this call waited for the lock
+        step = self.quarantine_step
+        if not self._validate_initial_state():
+            self.quarantine_step = step or self.quarantine_step
+            return False
+        if step is not None:
+            if not self.process_validation_step(*step):
+                return False
+            self.quarantine_step = None
+        if self.coherence_checker.coherence_state == CoherenceState.QUARANTINED:
+            if self.coherence_checker.drift_engine is not None:
+                self.coherence_checker.drift_engine.release(self.flow_id)
+            self.coherence_checker.coherence_state = CoherenceState.COHERENT
+            self.check_field_coherence()
+            if self.coherence_checker.coherence_state == CoherenceState.QUARANTINED:
+                return False
+        self.flow_context.state = ValidationFlowState.ACTIVE
+        return True
+
     def _validate_initial_state(self) -> bool:
         """Validates the initial flow state."""
         try:
@@ -149,10 +248,12 @@ class ValidationFlowPipeline:
     def _update_flow_state(self, validation_result: Any) -> None:
         """Updates flow state based on validation result."""
         if not validation_result.is_valid:
-            if validation_result.alert_level == "critical":
+            if validation_result.alert_level >= AlertLevel.CRITICAL:
                 self.flow_context.state = ValidationFlowState.ERROR
-            elif validation_result.alert_level == "high":
+            elif validation_result.alert_level >= AlertLevel.HIGH:
                 self.flow_context.state = ValidationFlowState.QUARANTINED
+                if self.quarantine_scheduler is not None:
+                    self.quarantine_scheduler.quarantine(self, validation_result.alert_level)
         else:
             self.flow_context.state = ValidationFlowState.ACTIVE
 
@@ -160,12 +261,43 @@ class ValidationFlowPipeline:
 
     def _update_validation_history(self, event_type: str, result: Any) -> None:
         """Updates validation history with new event."""
+        self.revision += 1
         self.flow_context.validation_history.append({
             'timestamp': datetime.utcnow().isoformat() + 'Z',
             'event_type': event_type,
             'result': result,
+            'column': self.result_columns.append(result),
             'flow_state': self.flow_context.state.value
         })
+        self.result_columns.compact_history(self.flow_context.validation_history, self.retain_results)
+        if self.replay_log is not None:
+            self.replay_log.record(self, event_type, result)
+
+    def _publish_watch(self, step_type: str, params: Dict[str, Any], result: Any) -> None:
+        """Bumps the step's topic version on change and offers the event to subscribed watchers.
+
+        An unwatched topic costs one set lookup; values are only copied and
+        compared while someone is subscribed.
+        """
+        topic = _WATCH_TOPICS.get(step_type, GATE_TRANSITIONS)
+        if not self.watch_scheduler.wants(topic):
+            return
+        # Steps never write the flow context, so compare with the last published value
+        value = self._watch_value(topic, params)
+        if result.is_valid and (value is None or value != self.watch_values.get(topic)):
+            if value is not None:
+                self.watch_values[topic] = value
+            self.watch_versions[topic] += 1
+        self.watch_scheduler.publish(topic, self.watch_versions[topic], self.get_flow_status, result)
+
+    @staticmethod
+    def _watch_value(topic: str, source: Dict[str, Any]) -> Optional[Tuple]:
+        """Immutable snapshot of a topic's watched value from step params or the flow context."""
+        if topic == PRIME_STATE:
+            return tuple(source.get('sequence', ()))
+        if topic == FIELD_COORDINATES:
+            return tuple(source.get(key) for key in _COORDINATE_KEYS)
+        return None
 
     def _notify_observer(self, message: str) -> None:
         """Notifies observer of flow state changes."""
@@ -175,9 +307,13 @@ class ValidationFlowPipeline:
             f"Coherence: {self.flow_context.coherence_state}"
         )
 
-    def get_flow_status(self) -> Dict[str, Any]:
-        """Returns current flow status for observer monitoring."""
-        return {
+    def get_flow_status(self, include_memory: bool = False) -> Dict[str, Any]:
+        """Returns current flow status for observer monitoring.
+
+        With include_memory, adds estimated retained bytes per growing
+        structure under 'memory'.
+        """
+        status = {
             'state': self.flow_context.state.value,
             'coherence_state': self.flow_context.coherence_state,
             'current_domain': self.flow_context.current_domain,
@@ -186,6 +322,9 @@ class ValidationFlowPipeline:
             'last_validation': self.flow_context.validation_history[-1] if self.flow_context.validation_history else None,
             'timestamp': datetime.utcnow().isoformat() + 'Z'
         }
+        if include_memory:
+            status['memory'] = flow_memory(self)
+        return status
 
 if __name__ == "__main__":
     # Example usage
@@ -1,24 +1,29 @@
 #!/usr/bin/env python3
 
-import yaml
 import logging
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import Collection, List, Dict, Any, Optional, Pattern
 from datetime import datetime
+from .error_codes import AlertLevel, ErrorCode
+from .config_cache import configure_logging, load_config
+from .coordinates import get_coordinate_cache
+from .tracing import traced
 
 @dataclass
 class ValidationResult:
     is_valid: bool
-    error_code: str = ""
+    error_code: ErrorCode = ErrorCode.NONE
     error_message: str = ""
-    alert_level: str = "normal"
+    alert_level: AlertLevel = AlertLevel.NORMAL
     timestamp: str = ""
     details: Dict[str, Any] = None
 
 class FieldValidator:
-    def __init__(self, config_path: str):
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+    def __init__(self, config_path: str, flow_id: str = "default"):
+        self.flow_id = flow_id
+        self.config_path = config_path
+        self.compiled_config = load_config(config_path)
+        self.config = self.compiled_config.config
         
         self.validation_state = {
             "last_valid_state": None,
@@ -27,149 +32,266 @@ class FieldValidator:
             "field_coordinates": None
         }
         
-        logging.basicConfig(level=logging.INFO)
+        configure_logging()
         self.logger = logging.getLogger("FieldValidator")
+        # Imported on first construction so importing this module (e.g. for ValidationResult) stays light
+        from .alert_dispatcher import get_alert_dispatcher
+        from .negative_cache import CACHEABLE_CODES, get_negative_cache
+        from .overrides import get_override_registry
+        self.alert_dispatcher = get_alert_dispatcher(self.config)
+        self.coordinates = get_coordinate_cache()
+        self.overrides = get_override_registry()
+        self.negative_cache = get_negative_cache(config_path)
+        self.cacheable_codes = CACHEABLE_CODES
 
+    @traced
     def validate_prime_sequence(self, sequence: List[int]) -> ValidationResult:
         """Validates prime number sequence and progression."""
         try:
-            # Check if sequence is strictly increasing
-            if not all(sequence[i] < sequence[i+1] for i in range(len(sequence)-1)):
-                return ValidationResult(
-                    is_valid=False,
-                    error_code="INVALID_PRIME_PROGRESSION",
-                    error_message="Prime sequence is not strictly increasing",
-                    alert_level="critical",
-                    timestamp=datetime.utcnow().isoformat() + 'Z'
+            result = self.known_prime_sequence_result(sequence)
+            if result is None:
+                result = self._check_prime_sequence(sequence)
+                self.remember_prime_sequence_result(sequence, result)
+            return result
+
+        except Exception as e:
+            return self.prime_sequence_error(e)
+
+    def known_prime_sequence_result(self, sequence: List[int]) -> Optional[ValidationResult]:
+        """Verdict that needs no check: an active override or a cached repeat failure, else None."""
+        if self.overrides.is_overridden("prime_sequence", self.flow_id):
+            return self._overridden_result("prime_sequence")
+        cache = self.negative_cache
+        if cache.serves(self.compiled_config.content_hash):
+            return cache.lookup(('prime_sequence', tuple(sequence)), self.flow_id)
+        return None
+
+    def remember_prime_sequence_result(self, sequence: List[int], result: ValidationResult) -> None:
+        """Feeds a freshly checked result to the negative cache."""
+        if result.error_code in self.cacheable_codes:
+            self.negative_cache.record(
+                ('prime_sequence', tuple(sequence)), result, self.flow_id, self.compiled_config.content_hash
+            )
+
+    def prime_sequence_error(self, error: Exception) -> ValidationResult:
+        self.logger.error(f"Prime sequence validation error: {str(error)}")
+        return ValidationResult(
+            is_valid=False,
+            error_code=ErrorCode.VALIDATION_ERROR,
+            error_message=str(error),
+            alert_level=AlertLevel.CRITICAL,
+            timestamp=datetime.utcnow().isoformat() + 'Z'
+        )
+
+    @traced
+    def validate_field_address(
+        self,
+        latitude: str,
+        longitude: str,
+        temporal: str,
+        components: Optional[Collection[str]] = None
+    ) -> ValidationResult:
+        """Validates spatiotemporal field address.
+
+        `components` restricts validation to the named parts ("latitude",
+        "longitude", "temporal"), e.g. only those that changed since the
+        last validated address. None validates all three.
+        """
+        if self.overrides.is_overridden("field_address", self.flow_id):
+            return self._overridden_result("field_address")
+        cache = self.negative_cache
+        config_hash = self.compiled_config.content_hash
+        try:
+            checks = (
+                components is None or 'latitude' in components,
+                components is None or 'longitude' in components,
+                components is None or 'temporal' in components
+            )
+            if cache.serves(config_hash):
+                cached = cache.lookup(
+                    ('field_address', latitude, longitude, temporal, checks),
+                    self._address_node(latitude, longitude)
                 )
+                if cached is not None:
+                    return cached
 
-            # Verify each number is prime
-            for num in sequence:
-                if not self._is_prime(num):
-                    return ValidationResult(
-                        is_valid=False,
-                        error_code="NON_PRIME_DETECTED",
-                        error_message=f"Non-prime number {num} detected in sequence",
-                        alert_level="critical",
-                        timestamp=datetime.utcnow().isoformat() + 'Z'
-                    )
+            result = self._check_field_address(latitude, longitude, temporal, *checks)
+            if result.error_code in self.cacheable_codes:
+                cache.record(
+                    ('field_address', latitude, longitude, temporal, checks),
+                    result,
+                    self._address_node(latitude, longitude),
+                    config_hash
+                )
+            return result
 
+        except Exception as e:
+            self.logger.error(f"Field address validation error: {str(e)}")
             return ValidationResult(
-                is_valid=True,
+                is_valid=False,
+                error_code=ErrorCode.VALIDATION_ERROR,
+                error_message=str(e),
+                alert_level=AlertLevel.CRITICAL,
                 timestamp=datetime.utcnow().isoformat() + 'Z'
             )
 
+    @traced
+    def validate_gate_transition(self, gate: str, from_domain: str, to_domain: str) -> ValidationResult:
+        """Validates alchemical gate transitions."""
+        if self.overrides.is_overridden("gate_transition", self.flow_id):
+            return self._overridden_result("gate_transition")
+        cache = self.negative_cache
+        config_hash = self.compiled_config.content_hash
+        try:
+            if cache.serves(config_hash):
+                cached = cache.lookup(('gate_transition', gate, from_domain, to_domain), self.flow_id)
+                if cached is not None:
+                    return cached
+
+            result = self._check_gate_transition(gate, from_domain, to_domain)
+            if result.error_code in self.cacheable_codes:
+                cache.record(('gate_transition', gate, from_domain, to_domain), result, self.flow_id, config_hash)
+            return result
+
         except Exception as e:
-            self.logger.error(f"Prime sequence validation error: {str(e)}")
+            self.logger.error(f"Gate transition validation error: {str(e)}")
             return ValidationResult(
                 is_valid=False,
-                error_code="VALIDATION_ERROR",
+                error_code=ErrorCode.VALIDATION_ERROR,
                 error_message=str(e),
-                alert_level="critical",
+                alert_level=AlertLevel.CRITICAL,
                 timestamp=datetime.utcnow().isoformat() + 'Z'
             )
 
-    def validate_field_address(self, latitude: str, longitude: str, temporal: str) -> ValidationResult:
-        """Validates spatiotemporal field address."""
-        try:
-            # Validate latitude (field coordinate)
-            lat_pattern = self.config['field_address_validator']['validation_rules']['latitude']['pattern']
-            if not self._matches_pattern(latitude, lat_pattern):
-                return ValidationResult(
-                    is_valid=False,
-                    error_code="INVALID_FIELD_COORDINATE",
-                    error_message=f"Invalid field coordinate: {latitude}",
-                    alert_level="critical",
-                    timestamp=datetime.utcnow().isoformat() + 'Z'
-                )
+    def _check_prime_sequence(self, sequence: List[int]) -> ValidationResult:
+        # Check if sequence is strictly increasing
+        if not all(sequence[i] < sequence[i+1] for i in range(len(sequence)-1)):
+            return ValidationResult(
+                is_valid=False,
+                error_code=ErrorCode.INVALID_PRIME_PROGRESSION,
+                error_message="Prime sequence is not strictly increasing",
+                alert_level=AlertLevel.CRITICAL,
+                timestamp=datetime.utcnow().isoformat() + 'Z'
+            )
 
-            # Validate longitude (domain alignment)
-            long_pattern = self.config['field_address_validator']['validation_rules']['longitude']['pattern']
-            if not self._matches_pattern(longitude, long_pattern):
+        # Verify each number is prime
+        for num in sequence:
+            if not self._is_prime(num):
                 return ValidationResult(
                     is_valid=False,
-                    error_code="INVALID_DOMAIN_ALIGNMENT",
-                    error_message=f"Invalid domain alignment: {longitude}",
-                    alert_level="high",
+                    error_code=ErrorCode.NON_PRIME_DETECTED,
+                    error_message=f"Non-prime number {num} detected in sequence",
+                    alert_level=AlertLevel.CRITICAL,
                     timestamp=datetime.utcnow().isoformat() + 'Z'
                 )
 
-            # Validate temporal marker
-            temp_pattern = self.config['field_address_validator']['validation_rules']['temporal']['pattern']
-            if not self._matches_pattern(temporal, temp_pattern):
-                return ValidationResult(
-                    is_valid=False,
-                    error_code="INVALID_TEMPORAL_MARKER",
-                    error_message=f"Invalid temporal marker: {temporal}",
-                    alert_level="critical",
-                    timestamp=datetime.utcnow().isoformat() + 'Z'
-                )
+        return ValidationResult(
+            is_valid=True,
+            timestamp=datetime.utcnow().isoformat() + 'Z'
+        )
 
+    def _check_field_address(
+        self,
+        latitude: str,
+        longitude: str,
+        temporal: str,
+        check_latitude: bool,
+        check_longitude: bool,
+        check_temporal: bool
+    ) -> ValidationResult:
+        latitude_valid = longitude_valid = True
+        if check_latitude or check_longitude:
+            address = self.coordinates.parse(latitude, longitude)
+            latitude_valid, longitude_valid = address.spatial_verdict(
+                self.compiled_config.content_hash,
+                self.compiled_config.patterns
+            )
+
+        # Validate latitude (field coordinate)
+        if check_latitude and not latitude_valid:
             return ValidationResult(
-                is_valid=True,
+                is_valid=False,
+                error_code=ErrorCode.INVALID_FIELD_COORDINATE,
+                error_message=f"Invalid field coordinate: {latitude}",
+                alert_level=AlertLevel.CRITICAL,
                 timestamp=datetime.utcnow().isoformat() + 'Z'
             )
 
-        except Exception as e:
-            self.logger.error(f"Field address validation error: {str(e)}")
+        # Validate longitude (domain alignment)
+        if check_longitude and not longitude_valid:
             return ValidationResult(
                 is_valid=False,
-                error_code="VALIDATION_ERROR",
-                error_message=str(e),
-                alert_level="critical",
+                error_code=ErrorCode.INVALID_DOMAIN_ALIGNMENT,
+                error_message=f"Invalid domain alignment: {longitude}",
+                alert_level=AlertLevel.HIGH,
                 timestamp=datetime.utcnow().isoformat() + 'Z'
             )
 
-    def validate_gate_transition(self, gate: str, from_domain: str, to_domain: str) -> ValidationResult:
-        """Validates alchemical gate transitions."""
-        try:
-            gate_sequence = self.config['gate_validator']['gate_sequence']
-            
-            # Check if gate is valid
-            if gate not in gate_sequence:
-                return ValidationResult(
-                    is_valid=False,
-                    error_code="INVALID_GATE",
-                    error_message=f"Invalid gate symbol: {gate}",
-                    alert_level="critical",
-                    timestamp=datetime.utcnow().isoformat() + 'Z'
-                )
+        # Validate temporal marker
+        if check_temporal and not self._matches_pattern(temporal, self.compiled_config.patterns['temporal']):
+            return ValidationResult(
+                is_valid=False,
+                error_code=ErrorCode.INVALID_TEMPORAL_MARKER,
+                error_message=f"Invalid temporal marker: {temporal}",
+                alert_level=AlertLevel.CRITICAL,
+                timestamp=datetime.utcnow().isoformat() + 'Z'
+            )
 
-            # Check domain compatibility
-            if not self._are_domains_compatible(from_domain, to_domain):
-                return ValidationResult(
-                    is_valid=False,
-                    error_code="INCOMPATIBLE_DOMAINS",
-                    error_message=f"Incompatible domain transition: {from_domain} -> {to_domain}",
-                    alert_level="high",
-                    timestamp=datetime.utcnow().isoformat() + 'Z'
-                )
+        return ValidationResult(
+            is_valid=True,
+            timestamp=datetime.utcnow().isoformat() + 'Z'
+        )
 
-            # Check gate sequence integrity
-            if not self._is_valid_gate_sequence(gate, self.validation_state['active_gates']):
-                return ValidationResult(
-                    is_valid=False,
-                    error_code="INVALID_GATE_SEQUENCE",
-                    error_message="Gate sequence violation detected",
-                    alert_level="critical",
-                    timestamp=datetime.utcnow().isoformat() + 'Z'
-                )
+    def _check_gate_transition(self, gate: str, from_domain: str, to_domain: str) -> ValidationResult:
+        gate_sequence = self.config['gate_validator']['gate_sequence']
 
+        # Check if gate is valid
+        if gate not in gate_sequence:
             return ValidationResult(
-                is_valid=True,
+                is_valid=False,
+                error_code=ErrorCode.INVALID_GATE,
+                error_message=f"Invalid gate symbol: {gate}",
+                alert_level=AlertLevel.CRITICAL,
                 timestamp=datetime.utcnow().isoformat() + 'Z'
             )
 
-        except Exception as e:
-            self.logger.error(f"Gate transition validation error: {str(e)}")
+        # Check domain compatibility
+        if not self._are_domains_compatible(from_domain, to_domain):
             return ValidationResult(
                 is_valid=False,
-                error_code="VALIDATION_ERROR",
-                error_message=str(e),
-                alert_level="critical",
+                error_code=ErrorCode.INCOMPATIBLE_DOMAINS,
+                error_message=f"Incompatible domain transition: {from_domain} -> {to_domain}",
+                alert_level=AlertLevel.HIGH,
                 timestamp=datetime.utcnow().isoformat() + 'Z'
             )
 
+        # Check gate sequence integrity
+        if not self._is_valid_gate_sequence(gate, self.validation_state['active_gates']):
+            return ValidationResult(
+                is_valid=False,
+                error_code=ErrorCode.INVALID_GATE_SEQUENCE,
+                error_message="Gate sequence violation detected",
+                alert_level=AlertLevel.CRITICAL,
+                timestamp=datetime.utcnow().isoformat() + 'Z'
+            )
+
+        return ValidationResult(
+            is_valid=True,
+            timestamp=datetime.utcnow().isoformat() + 'Z'
+        )
+
+    def _address_node(self, latitude: str, longitude: str) -> str:
+        """Node an address belongs to, for repeat-offender counts."""
+        return self.coordinates.parse(latitude, longitude).node_name or latitude
+
+    def _overridden_result(self, rule: str) -> ValidationResult:
+        """Result for a check skipped because an Observer override is active."""
+        return ValidationResult(
+            is_valid=True,
+            timestamp=datetime.utcnow().isoformat() + 'Z',
+            details={'overridden': rule}
+        )
+
     def _is_prime(self, n: int) -> bool:
         """Helper function to check if a number is prime."""
         if n < 2:
@@ -179,10 +301,9 @@ class FieldValidator:
                 return False
         return True
 
-    def _matches_pattern(self, value: str, pattern: str) -> bool:
-        """Helper function to check if value matches regex pattern."""
-        import re
-        return bool(re.match(pattern, value))
+    def _matches_pattern(self, value: str, pattern: Pattern) -> bool:
+        """Helper function to check if value matches a precompiled regex pattern."""
+        return bool(pattern.match(value))
 
     def _are_domains_compatible(self, from_domain: str, to_domain: str) -> bool:
         """Helper function to check domain compatibility."""
@@ -194,7 +315,7 @@ class FieldValidator:
         gate_sequence = self.config['gate_validator']['gate_sequence']
         if not current_sequence:
             return new_gate == gate_sequence[0]
-        current_index = gate_sequence.index(current_sequence[-1])
+        current_index = self.compiled_config.gate_index[current_sequence[-1]]
         next_valid_index = (current_index + 1) % len(gate_sequence)
         return new_gate == gate_sequence[next_valid_index]
 
@@ -208,9 +329,9 @@ class FieldValidator:
         self._notify_observer(result)
 
     def _notify_observer(self, result: ValidationResult) -> None:
-        """Notifies observer of validation results."""
-        if result.alert_level in ['high', 'critical']:
-            self.logger.warning(f"Observer Alert: {result.error_code} - {result.error_message}")
+        """Notifies observer of validation results; repeats served from the negative cache stay quiet."""
+        if result.alert_level >= AlertLevel.HIGH and not (result.details and result.details.get('negative_cache')):
+            self.alert_dispatcher.submit_result(result, "FieldValidator")
 
 if __name__ == "__main__":
     # Example usage
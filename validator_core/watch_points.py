@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass
+from enum import Enum
+from .error_codes import AlertLevel
+
+PRIME_STATE = "prime_state"
+FIELD_COORDINATES = "field_coordinates"
+GATE_TRANSITIONS = "gate_transitions"
+
+# validator_config.yaml and validation_chain.yaml name the coordinate watch differently
+_TOPIC_ALIASES = {
+    "field_address": FIELD_COORDINATES,
+}
+
+class WatchInterval(Enum):
+    CONTINUOUS = "continuous"
+    ON_CHANGE = "on_change"
+    PER_TRANSITION = "per_transition"
+
+@dataclass
+class WatchPoint:
+    name: str
+    topic: str
+    interval: WatchInterval
+    alert_threshold: AlertLevel
+
+@dataclass
+class WatchEvent:
+    watch_point: WatchPoint
+    version: int
+    state: Dict[str, Any]
+    result: Any = None
+
+@dataclass
+class _Watcher:
+    watch_point: WatchPoint
+    callback: Callable[[WatchEvent], None]
+    last_version: int = -1
+
+@dataclass
+class _TopicLatest:
+    version: int
+    state_fn: Callable[[], Dict[str, Any]]
+
+class WatchPointScheduler:
+    """Delivers flow events only to watchers configured under observer_interface.watch_points.
+
+    Flows ask `wants(topic)` before building anything, so with no
+    subscribers the hot path is a single set lookup.
+    """
+
+    def __init__(self, watch_points: List[WatchPoint], tick_interval: float = 1.0):
+        self.watch_points: Dict[str, WatchPoint] = {wp.topic: wp for wp in watch_points}
+        self.tick_interval = tick_interval
+        self.active_topics: frozenset = frozenset()
+        self.stats = {'delivered': 0, 'skipped_unchanged': 0, 'skipped_threshold': 0}
+
+        self._watchers: Dict[str, List[_Watcher]] = {}
+        self._latest: Dict[str, _TopicLatest] = {}
+        self._lock = threading.Lock()
+        self._ticker: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self.logger = logging.getLogger("WatchPointScheduler")
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], tick_interval: float = 1.0) -> "WatchPointScheduler":
+        """Parses watch points from either config layout (mapping or list of entries)."""
+        raw = ((config or {}).get('observer_interface', {}) or {}).get('watch_points') or {}
+        if isinstance(raw, dict):
+            entries = [dict(spec or {}, type=name) for name, spec in raw.items()]
+        else:
+            entries = list(raw)
+
+        watch_points = []
+        for entry in entries:
+            name = entry.get('type', '')
+            try:
+                interval = WatchInterval(entry.get('interval', 'per_transition'))
+            except ValueError:
+                logging.getLogger("WatchPointScheduler").warning(
+                    f"Unknown watch interval for {name}: {entry.get('interval')}"
+                )
+                continue
+            threshold = entry.get('alert_threshold', 'normal')
+            # "immediate" means alert on every failure regardless of severity
+            level = AlertLevel.NORMAL if threshold == "immediate" else AlertLevel(threshold)
+            watch_points.append(WatchPoint(
+                name=name,
+                topic=_TOPIC_ALIASES.get(name, name),
+                interval=interval,
+                alert_threshold=level
+            ))
+        return cls(watch_points, tick_interval)
+
+    def subscribe(self, name: str, callback: Callable[[WatchEvent], None]) -> bool:
+        """Subscribes a callback to a configured watch point. Unconfigured names are refused."""
+        topic = _TOPIC_ALIASES.get(name, name)
+        watch_point = self.watch_points.get(topic)
+        if watch_point is None:
+            self.logger.warning(f"Watch point not configured: {name}")
+            return False
+
+        with self._lock:
+            self._watchers.setdefault(topic, []).append(_Watcher(watch_point, callback))
+            self.active_topics = frozenset(self._watchers)
+        if watch_point.interval == WatchInterval.CONTINUOUS:
+            self._start_ticker()
+        return True
+
+    def unsubscribe(self, name: str, callback: Callable[[WatchEvent], None]) -> None:
+        """Removes a previously subscribed callback."""
+        topic = _TOPIC_ALIASES.get(name, name)
+        with self._lock:
+            watchers = [w for w in self._watchers.get(topic, []) if w.callback is not callback]
+            if watchers:
+                self._watchers[topic] = watchers
+            else:
+                self._watchers.pop(topic, None)
+            self.active_topics = frozenset(self._watchers)
+
+    def wants(self, topic: str) -> bool:
+        """True if any watcher is subscribed to the topic."""
+        return topic in self.active_topics
+
+    def publish(
+        self,
+        topic: str,
+        version: int,
+        state_fn: Callable[[], Dict[str, Any]],
+        result: Any = None
+    ) -> None:
+        """Offers a flow event; state_fn is only called if some watcher needs the state."""
+        watchers = self._watchers.get(topic)
+        if not watchers:
+            return
+
+        state = None
+        for watcher in watchers:
+            watch_point = watcher.watch_point
+            alerting = result is not None and not self._is_ok(result)
+            if alerting and result.alert_level < watch_point.alert_threshold:
+                self.stats['skipped_threshold'] += 1
+                continue
+
+            if watch_point.interval == WatchInterval.CONTINUOUS:
+                # Coalesced: the ticker delivers the latest version once per tick
+                self._latest[topic] = _TopicLatest(version, state_fn)
+                continue
+            if watch_point.interval == WatchInterval.ON_CHANGE and not alerting and version == watcher.last_version:
+                self.stats['skipped_unchanged'] += 1
+                continue
+
+            if state is None:
+                state = state_fn()
+            self._deliver(watcher, WatchEvent(watch_point, version, state, result))
+
+    def tick(self) -> None:
+        """Delivers the latest state to continuous watchers whose topic changed since the last tick."""
+        for topic, latest in list(self._latest.items()):
+            state = None
+            for watcher in self._watchers.get(topic, []):
+                if watcher.watch_point.interval != WatchInterval.CONTINUOUS:
+                    continue
+                if watcher.last_version == latest.version:
+                    self.stats['skipped_unchanged'] += 1
+                    continue
+                if state is None:
+                    state = latest.state_fn()
+                self._deliver(watcher, WatchEvent(watcher.watch_point, latest.version, state))
+
+    def close(self) -> None:
+        """Stops the continuous ticker."""
+        self._stopping.set()
+        if self._ticker is not None:
+            self._ticker.join(timeout=self.tick_interval * 2)
+            self._ticker = None
+
+    def _deliver(self, watcher: _Watcher, event: WatchEvent) -> None:
+        watcher.last_version = event.version
+        try:
+            watcher.callback(event)
+            self.stats['delivered'] += 1
+        except Exception as e:
+            self.logger.error(f"Watcher error on {watcher.watch_point.name}: {str(e)}")
+
+    def _start_ticker(self) -> None:
+        with self._lock:
+            if self._ticker is None:
+                self._stopping.clear()
+                self._ticker = threading.Thread(target=self._run_ticker, name="WatchPointTicker", daemon=True)
+                self._ticker.start()
+
+    def _run_ticker(self) -> None:
+        while not self._stopping.wait(self.tick_interval):
+            self.tick()
+
+    @staticmethod
+    def _is_ok(result: Any) -> bool:
+        if hasattr(result, 'is_valid'):
+            return bool(result.is_valid)
+        return bool(getattr(result, 'is_coherent', True))
+
+if __name__ == "__main__":
+    # Example usage
+    scheduler = WatchPointScheduler.from_config({
+        'observer_interface': {
+            'watch_points': {
+                'field_address': {'interval': 'on_change', 'alert_threshold': 'high'}
+            }
+        }
+    })
+    scheduler.subscribe("field_address", lambda event: print(f"Watch event: {event.version} {event.state}"))
+    for version in (1, 1, 2):
+        scheduler.publish(FIELD_COORDINATES, version, lambda: {'latitude': 'FIELD/node-1/003'})
+    print(f"Scheduler stats: {scheduler.stats}")